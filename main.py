@@ -11,6 +11,21 @@ Uso:
     python3 main.py --evangelio        # Solo actualiza evangelio
     python3 main.py --santos           # Solo actualiza santos
     python3 main.py --santos-dia 11 11 # Solo actualiza un día específico
+    python3 main.py --replay --santos-dia 11 11
+                                       # Igual, pero sirviendo todo desde el archivo de
+                                       # respuestas (sin red). --replay=AAAA-MM-DD usa lo
+                                       # archivado hasta esa fecha
+    python3 main.py --sqlite --santos  # Igual, manteniendo también data/santos.db (SQLite)
+                                       # al día con santos.csv. --sqlite=RUTA usa otra base
+    python3 main.py --santos-incremental # Solo días/santos editados en Wikipedia
+    python3 main.py --santos-etiquetas # Vuelve a descargar las etiquetas especiales
+    python3 main.py --santos-imagenes  # Descarga en paralelo las imágenes que faltan
+    python3 main.py --santos-imagenes --reducir
+                                       # Además reemplaza por miniaturas de 300 px
+                                       # las imágenes de más de 100 KB
+    python3 main.py --santos-variantes # Genera las variantes WebP/JPEG de web/images
+    python3 main.py --santos-volcado eswiki-AAAAMMDD-pages-articles-multistream.xml.bz2
+                                       # Reconstruye santos desde el volcado local (sin conexión)
 """
 
 import sys
@@ -111,7 +126,13 @@ def actualizar_santos_completo():
     """Actualiza todos los santos del año"""
     print("\n✝️  ACTUALIZANDO SANTOS (AÑO COMPLETO)...")
     print("-" * 70)
-    print("⚠️  ADVERTENCIA: Este proceso puede tomar varias horas")
+    print("⚠️  ADVERTENCIA: Este proceso puede tomar bastante tiempo (se procesa en pipeline por etapas)")
+    
+    # Una ejecución cortada (Ctrl-C, caída) se retoma desde el primer día sin terminar
+    from progreso_santos import describir_pendiente
+    pendiente = describir_pendiente()
+    if pendiente:
+        print(f"♻️  {pendiente}")
     
     respuesta = input("¿Deseas continuar? (s/N): ").strip().lower()
     if respuesta != 's':
@@ -121,8 +142,28 @@ def actualizar_santos_completo():
     try:
         from scraper_santos_wikipedia import SantosWikipediaScraper
         
-        scraper = SantosWikipediaScraper(descargar_imagenes=True)
-        scraper.ejecutar(mes_inicio=1, dia_inicio=1, mes_fin=12, dia_fin=31)
+        scraper = SantosWikipediaScraper(descargar_imagenes=True, enriquecimiento='api', motor_santoral='wikitext')
+        scraper.ejecutar(mes_inicio=1, dia_inicio=1, mes_fin=12, dia_fin=31, pipeline=True)
+        
+        print("\n✅ Santos actualizados correctamente")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ Error al actualizar santos: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def actualizar_santos_incremental():
+    """Actualiza solo los días y santos cuya página de Wikipedia cambió"""
+    print("\n✝️  ACTUALIZANDO SANTOS (INCREMENTAL)...")
+    print("-" * 70)
+    
+    try:
+        from scraper_santos_wikipedia import SantosWikipediaScraper
+        
+        scraper = SantosWikipediaScraper(descargar_imagenes=True, enriquecimiento='api', motor_santoral='wikitext')
+        scraper.ejecutar(mes_inicio=1, dia_inicio=1, mes_fin=12, dia_fin=31, pipeline=True, incremental=True)
         
         print("\n✅ Santos actualizados correctamente")
         return True
@@ -133,6 +174,89 @@ def actualizar_santos_completo():
         traceback.print_exc()
         return False
 
+def actualizar_santos_volcado(ruta_volcado):
+    """Reconstruye todos los santos del año desde un volcado local de Wikipedia"""
+    print("\n✝️  RECONSTRUYENDO SANTOS DESDE EL VOLCADO DE WIKIPEDIA...")
+    print("-" * 70)
+    
+    try:
+        from scraper_santos_wikipedia import SantosWikipediaScraper
+        
+        # Sin conexión no se descargan imágenes (cada santo conserva la que ya tenía;
+        # las que falten se completan luego con --santos-imagenes)
+        scraper = SantosWikipediaScraper(descargar_imagenes=False, volcado=ruta_volcado)
+        scraper.ejecutar(mes_inicio=1, dia_inicio=1, mes_fin=12, dia_fin=31,
+                         eliminar_existentes=True, pipeline=True)
+        
+        print("\n✅ Santos reconstruidos correctamente")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ Error al reconstruir santos: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def actualizar_etiquetas_santos():
+    """Descarga de nuevo las etiquetas especiales (santos argentinos, scouts, festividades)"""
+    print("\n🏷️  ACTUALIZANDO ETIQUETAS ESPECIALES...")
+    print("-" * 70)
+    
+    try:
+        from scraper_santos_wikipedia import SantosWikipediaScraper
+        
+        scraper = SantosWikipediaScraper()
+        scraper.actualizar_etiquetas()
+        
+        print(f"\n✅ Etiquetas guardadas en {scraper.archivo_etiquetas}")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ Error al actualizar etiquetas: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def completar_imagenes_santos(reducir=False):
+    """Descarga las imágenes faltantes de los santos que ya están en el CSV"""
+    print("\n🖼️  COMPLETANDO IMÁGENES DE SANTOS...")
+    print("-" * 70)
+    
+    try:
+        from scraper_santos_wikipedia import SantosWikipediaScraper
+        
+        scraper = SantosWikipediaScraper(descargar_imagenes=True, hilos_imagenes=16)
+        scraper.completar_imagenes_faltantes(reemplazar_mayores_kb=100 if reducir else None)
+        scraper.descargador.cerrar()
+        
+        print("\n✅ Imágenes completadas")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ Error al completar imágenes: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def generar_variantes_imagenes(todo=False):
+    """Genera las variantes responsive (WebP + JPEG por ancho) de las imágenes de santos"""
+    print("\n🖼️  GENERANDO VARIANTES DE IMÁGENES...")
+    print("-" * 70)
+    
+    try:
+        from generar_variantes_imagenes import GeneradorVariantes
+        
+        GeneradorVariantes().ejecutar(todo=todo)
+        
+        print("\n✅ Variantes generadas")
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ Error al generar variantes: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def actualizar_santos_dia(mes=None, dia=None):
     """Actualiza santos de un día específico"""
     if mes is None or dia is None:
@@ -156,7 +280,7 @@ def actualizar_santos_dia(mes=None, dia=None):
     try:
         from scraper_santos_wikipedia import SantosWikipediaScraper
         
-        scraper = SantosWikipediaScraper(descargar_imagenes=True)
+        scraper = SantosWikipediaScraper(descargar_imagenes=True, enriquecimiento='api')
         scraper.ejecutar(mes_inicio=mes, dia_inicio=dia, mes_fin=mes, dia_fin=dia)
         
         print(f"\n✅ Santos del {dia:02d}/{mes:02d} actualizados correctamente")
@@ -171,6 +295,24 @@ def actualizar_santos_dia(mes=None, dia=None):
 def main():
     """Función principal"""
     
+    # Modo replay: todas las peticiones se sirven desde el archivo de respuestas
+    for opcion in [a for a in sys.argv[1:] if a.lower().startswith('--replay')]:
+        from archivo_respuestas import activar_replay
+        
+        fecha = opcion.split('=', 1)[1] if '=' in opcion else None
+        activar_replay(fecha)
+        sys.argv.remove(opcion)
+        print(f"📼 Modo replay: respuestas archivadas{' hasta ' + fecha if fecha else ''}, sin conexión")
+    
+    # Base SQLite: los scrapers de santos la mantienen al día junto con santos.csv
+    for opcion in [a for a in sys.argv[1:] if a.lower().startswith('--sqlite')]:
+        from base_santos import ARCHIVO_BASE, activar_base
+        
+        ruta = opcion.split('=', 1)[1] if '=' in opcion else ARCHIVO_BASE
+        activar_base(ruta)
+        sys.argv.remove(opcion)
+        print(f"🗄️  Base SQLite: {ruta}")
+    
     # Verificar argumentos de línea de comandos
     if len(sys.argv) > 1:
         arg = sys.argv[1].lower()
@@ -181,6 +323,24 @@ def main():
         elif arg == '--santos':
             return actualizar_santos_completo()
         
+        elif arg == '--santos-incremental':
+            return actualizar_santos_incremental()
+        
+        elif arg == '--santos-volcado':
+            if len(sys.argv) < 3:
+                print("❌ Uso: python3 main.py --santos-volcado RUTA_VOLCADO")
+                return False
+            return actualizar_santos_volcado(sys.argv[2])
+        
+        elif arg == '--santos-etiquetas':
+            return actualizar_etiquetas_santos()
+        
+        elif arg == '--santos-imagenes':
+            return completar_imagenes_santos(reducir='--reducir' in sys.argv[2:])
+        
+        elif arg == '--santos-variantes':
+            return generar_variantes_imagenes(todo='--todo' in sys.argv[2:])
+        
         elif arg == '--santos-dia':
             if len(sys.argv) < 4:
                 print("❌ Uso: python3 main.py --santos-dia MES DIA")
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Almacén de imágenes direccionado por contenido
+==============================================
+Indexa web/images por hash de contenido (sha256) y por hash perceptual
+(dHash de 64 bits) en data/imagenes_hashes.json, para que una misma imagen
+guardada con varios nombres (variantes ortográficas del santo, ej:
+afra_de_augsburgo.jpg / afra_de_ausburgo.jpg) se guarde una sola vez.
+
+- Al descargar, si el contenido ya existe con otro nombre se descarta la
+  copia nueva y se usa el archivo canónico (DescargadorImagenes lo consulta).
+- El comando deduplica lo ya descargado: agrupa archivos idénticos y casi
+  idénticos (misma pintura a otra resolución), elige un canónico por grupo,
+  apunta las filas de santos.csv al canónico y borra el resto.
+
+Sin Pillow solo se detectan los duplicados idénticos.
+
+Uso:
+    python3 scripts/almacen_imagenes.py             # informe (no modifica nada)
+    python3 scripts/almacen_imagenes.py --aplicar   # deduplica y actualiza santos.csv
+    python3 scripts/almacen_imagenes.py --umbral=0  # solo duplicados idénticos
+"""
+
+import csv
+import hashlib
+import json
+import os
+import sys
+import threading
+
+try:
+    from PIL import Image
+except ImportError:  # Dependencia opcional: sin ella no hay hash perceptual
+    Image = None
+
+# Rutas relativas al directorio raíz del proyecto
+DIRECTORIO_BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIRECTORIO_IMAGENES = os.path.join(DIRECTORIO_BASE, "web", "images")
+ARCHIVO_INDICE = os.path.join(DIRECTORIO_BASE, "data", "imagenes_hashes.json")
+ARCHIVO_CSV = os.path.join(DIRECTORIO_BASE, "data", "santos.csv")
+
+EXTENSIONES_IMAGEN = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+
+# Bits distintos (de 64) hasta los que dos imágenes se consideran la misma
+UMBRAL_HAMMING = 4
+
+# Diferencia relativa máxima de proporción (ancho/alto) entre casi duplicados
+TOLERANCIA_PROPORCION = 0.05
+
+# Diferencia media máxima (0-255) entre las firmas de color de casi duplicados:
+# el dHash es en grises y confunde, por ejemplo, banderas de franjas parecidas
+TOLERANCIA_COLOR = 16
+
+
+def hash_contenido(ruta):
+    h = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(64 * 1024), b''):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+def hash_perceptual(ruta):
+    """
+    dHash de 64 bits: compara el brillo de píxeles vecinos en una versión de 9x8
+    en grises, así que no cambia al reescalar ni al recomprimir la imagen.
+    Se acompaña de una firma de color (la imagen reducida a 4x4 en RGB)
+
+    Returns:
+        tuple: (dhash, firma_color, ancho, alto) o (None, None, None, None) si no se puede calcular
+    """
+    if Image is None:
+        return None, None, None, None
+    try:
+        with Image.open(ruta) as imagen:
+            ancho, alto = imagen.size
+            imagen = imagen.convert('RGBA' if 'transparency' in imagen.info else 'RGB').convert('RGB')
+            pixeles = list(imagen.convert('L').resize((9, 8), Image.LANCZOS).getdata())
+            firma = bytes(v for pixel in imagen.resize((4, 4), Image.BOX).getdata() for v in pixel).hex()
+    except Exception:
+        return None, None, None, None
+
+    valor = 0
+    for fila in range(8):
+        for columna in range(8):
+            izquierda = pixeles[fila * 9 + columna]
+            derecha = pixeles[fila * 9 + columna + 1]
+            valor = (valor << 1) | (izquierda > derecha)
+    return valor, firma, ancho, alto
+
+
+def distancia_hamming(a, b):
+    return bin(a ^ b).count('1')
+
+
+def diferencia_color(a, b):
+    """Diferencia media por canal entre dos firmas de color"""
+    a, b = bytes.fromhex(a), bytes.fromhex(b)
+    return sum(abs(x - y) for x, y in zip(a, b)) / len(a)
+
+
+class AlmacenImagenes:
+    def __init__(self, directorio=DIRECTORIO_IMAGENES, archivo_indice=ARCHIVO_INDICE):
+        """
+        Args:
+            directorio (str): Carpeta de las imágenes (web/images)
+            archivo_indice (str): JSON con los hashes ya calculados
+        """
+        self.directorio = directorio
+        self.archivo_indice = archivo_indice
+        self._lock = threading.Lock()
+        self.indice = self._cargar_indice()  # nombre -> {tamano, mtime, sha256, dhash, ancho, alto}
+        self._por_hash = {}
+        for nombre, entrada in self.indice.items():
+            self._por_hash.setdefault(entrada['sha256'], set()).add(nombre)
+
+    # ------------------------------------------------------------------
+    # Índice
+    # ------------------------------------------------------------------
+
+    def _cargar_indice(self):
+        if os.path.exists(self.archivo_indice):
+            try:
+                with open(self.archivo_indice, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"⚠️ Error leyendo {self.archivo_indice}, se recalcula: {e}")
+        return {}
+
+    def guardar_indice(self):
+        with self._lock:
+            contenido = json.dumps(self.indice, ensure_ascii=False, indent=1, sort_keys=True)
+        temporal = f"{self.archivo_indice}.{threading.get_ident()}.tmp"
+        with open(temporal, 'w', encoding='utf-8') as f:
+            f.write(contenido)
+        os.replace(temporal, self.archivo_indice)
+
+    def _entrada(self, nombre):
+        """Entrada del índice para un archivo, recalculada solo si cambió en disco (con el lock tomado)"""
+        ruta = os.path.join(self.directorio, nombre)
+        estado = os.stat(ruta)
+        entrada = self.indice.get(nombre)
+        if entrada and entrada['tamano'] == estado.st_size and entrada['mtime'] == int(estado.st_mtime):
+            return entrada
+
+        if entrada:
+            self._olvidar(nombre)
+        dhash, firma_color, ancho, alto = hash_perceptual(ruta)
+        entrada = {
+            'tamano': estado.st_size,
+            'mtime': int(estado.st_mtime),
+            'sha256': hash_contenido(ruta),
+            'dhash': f"{dhash:016x}" if dhash is not None else None,
+            'color': firma_color,
+            'ancho': ancho,
+            'alto': alto,
+        }
+        self.indice[nombre] = entrada
+        self._por_hash.setdefault(entrada['sha256'], set()).add(nombre)
+        return entrada
+
+    def _olvidar(self, nombre):
+        entrada = self.indice.pop(nombre, None)
+        if entrada:
+            nombres = self._por_hash.get(entrada['sha256'], set())
+            nombres.discard(nombre)
+            if not nombres:
+                self._por_hash.pop(entrada['sha256'], None)
+
+    def actualizar(self):
+        """Sincroniza el índice con la carpeta (hashea solo archivos nuevos o modificados)"""
+        presentes = {nombre for nombre in os.listdir(self.directorio)
+                     if nombre.lower().endswith(EXTENSIONES_IMAGEN)
+                     and os.path.isfile(os.path.join(self.directorio, nombre))}
+        with self._lock:
+            for nombre in set(self.indice) - presentes:
+                self._olvidar(nombre)
+            for nombre in sorted(presentes):
+                try:
+                    self._entrada(nombre)
+                except OSError as e:
+                    print(f"  ⚠️ No se pudo leer {nombre}: {e}")
+        self.guardar_indice()
+        return self.indice
+
+    # ------------------------------------------------------------------
+    # Descargas
+    # ------------------------------------------------------------------
+
+    def registrar(self, nombre):
+        """
+        Registra un archivo recién descargado; si su contenido ya estaba guardado con
+        otro nombre, borra la copia nueva y retorna el nombre canónico
+
+        Returns:
+            str: nombre con el que hay que referenciar la imagen
+        """
+        with self._lock:
+            try:
+                entrada = self._entrada(nombre)
+            except OSError:
+                return nombre
+            for otro in sorted(self._por_hash.get(entrada['sha256'], ())):
+                if otro != nombre and os.path.exists(os.path.join(self.directorio, otro)):
+                    os.remove(os.path.join(self.directorio, nombre))
+                    self._olvidar(nombre)
+                    return otro
+            return nombre
+
+    # ------------------------------------------------------------------
+    # Deduplicación
+    # ------------------------------------------------------------------
+
+    def grupos_duplicados(self, umbral=UMBRAL_HAMMING):
+        """
+        Agrupa los archivos idénticos (mismo sha256) y casi idénticos (dHash a
+        distancia <= umbral, misma proporción y colores parecidos)
+
+        Returns:
+            list: listas de nombres, cada una con dos o más archivos
+        """
+        nombres = sorted(self.indice)
+        padre = {nombre: nombre for nombre in nombres}
+
+        def raiz(nombre):
+            while padre[nombre] != nombre:
+                padre[nombre] = padre[padre[nombre]]
+                nombre = padre[nombre]
+            return nombre
+
+        def unir(a, b):
+            padre[raiz(a)] = raiz(b)
+
+        for iguales in self._por_hash.values():
+            iguales = sorted(iguales)
+            for otro in iguales[1:]:
+                unir(iguales[0], otro)
+
+        if umbral > 0:
+            for a, b in self._pares_cercanos(umbral):
+                unir(a, b)
+
+        grupos = {}
+        for nombre in nombres:
+            grupos.setdefault(raiz(nombre), []).append(nombre)
+        return [grupo for grupo in grupos.values() if len(grupo) > 1]
+
+    def _pares_cercanos(self, umbral):
+        """
+        Pares de archivos con dHash cercano. Con umbral < 8 dos hashes cercanos
+        coinciden al menos en uno de sus 8 bytes, así que solo se comparan los
+        archivos que comparten algún byte (en lugar de todos contra todos)
+        """
+        hashes = {nombre: int(e['dhash'], 16) for nombre, e in self.indice.items() if e.get('dhash')}
+        cubetas = {}
+        for nombre, valor in hashes.items():
+            for banda in range(8):
+                cubetas.setdefault((banda, (valor >> (banda * 8)) & 0xFF), []).append(nombre)
+
+        vistos = set()
+        for miembros in cubetas.values() if umbral < 8 else [list(hashes)]:
+            for i, a in enumerate(miembros):
+                for b in miembros[i + 1:]:
+                    par = (a, b) if a < b else (b, a)
+                    if par in vistos:
+                        continue
+                    vistos.add(par)
+                    if distancia_hamming(hashes[a], hashes[b]) <= umbral and self._parecidas(a, b):
+                        yield par
+
+    def _parecidas(self, a, b):
+        """Misma proporción y colores parecidos"""
+        ea, eb = self.indice[a], self.indice[b]
+        if not (ea.get('ancho') and ea.get('alto') and eb.get('ancho') and eb.get('alto')):
+            return False
+        pa, pb = ea['ancho'] / ea['alto'], eb['ancho'] / eb['alto']
+        if abs(pa - pb) / max(pa, pb) > TOLERANCIA_PROPORCION:
+            return False
+        return bool(ea.get('color') and eb.get('color')) and \
+            diferencia_color(ea['color'], eb['color']) <= TOLERANCIA_COLOR
+
+    def _elegir_canonico(self, grupo, referencias):
+        """La de mayor resolución; a igualdad, la más referenciada en el CSV y el nombre más corto"""
+        def clave(nombre):
+            e = self.indice[nombre]
+            return (-(e.get('ancho') or 0) * (e.get('alto') or 0), -referencias.get(nombre, 0), len(nombre), nombre)
+        return min(grupo, key=clave)
+
+    def deduplicar(self, archivo_csv=ARCHIVO_CSV, umbral=UMBRAL_HAMMING, aplicar=False):
+        """
+        Deja un único archivo por grupo de duplicados y apunta santos.csv al canónico
+
+        Args:
+            archivo_csv (str): CSV de santos cuya columna 'imagen' se actualiza
+            umbral (int): Distancia de Hamming máxima para casi duplicados (0: solo idénticos)
+            aplicar (bool): Si False solo informa, sin borrar ni modificar nada
+
+        Returns:
+            dict: {duplicado: canonico}
+        """
+        print("=" * 60)
+        print("🧬 DEDUPLICACIÓN DE IMÁGENES")
+        print("=" * 60)
+        if Image is None and umbral > 0:
+            print("ℹ️  Sin Pillow: solo se detectan duplicados idénticos")
+
+        self.actualizar()
+        print(f"📋 {len(self.indice)} imagen(es) indexadas")
+
+        filas, campos = [], None
+        if os.path.exists(archivo_csv):
+            with open(archivo_csv, 'r', encoding='utf-8') as f:
+                lector = csv.DictReader(f)
+                campos = lector.fieldnames
+                filas = list(lector)
+        referencias = {}
+        for fila in filas:
+            if fila.get('imagen'):
+                referencias[fila['imagen']] = referencias.get(fila['imagen'], 0) + 1
+
+        reemplazos = {}
+        bytes_recuperados = 0
+        for grupo in self.grupos_duplicados(umbral):
+            canonico = self._elegir_canonico(grupo, referencias)
+            for nombre in grupo:
+                if nombre == canonico:
+                    continue
+                reemplazos[nombre] = canonico
+                bytes_recuperados += self.indice[nombre]['tamano']
+                identica = self.indice[nombre]['sha256'] == self.indice[canonico]['sha256']
+                print(f"  {'🟰' if identica else '≈'} {nombre} → {canonico}")
+
+        filas_actualizadas = sum(1 for fila in filas if fila.get('imagen') in reemplazos)
+
+        if aplicar and reemplazos:
+            if filas_actualizadas:
+                for fila in filas:
+                    if fila.get('imagen') in reemplazos:
+                        fila['imagen'] = reemplazos[fila['imagen']]
+                temporal = archivo_csv + '.tmp'
+                with open(temporal, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(f, fieldnames=campos)
+                    writer.writeheader()
+                    writer.writerows(filas)
+                os.replace(temporal, archivo_csv)
+
+            # El CSV ya no las referencia: recién ahora se borran
+            for nombre in reemplazos:
+                try:
+                    os.remove(os.path.join(self.directorio, nombre))
+                except OSError as e:
+                    print(f"  ⚠️ No se pudo borrar {nombre}: {e}")
+                with self._lock:
+                    self._olvidar(nombre)
+            self.guardar_indice()
+
+        print("-" * 60)
+        print(f"🧬 Duplicados: {len(reemplazos)} archivo(s), {filas_actualizadas} fila(s) de santos.csv a actualizar")
+        print(f"💾 Espacio {'recuperado' if aplicar else 'recuperable'}: {bytes_recuperados / (1024 * 1024):.2f} MB")
+        if reemplazos and not aplicar:
+            print("💡 Ejecutá con --aplicar para borrar los duplicados y actualizar santos.csv")
+        print("-" * 60)
+        return reemplazos
+
+
+def main():
+    umbral = UMBRAL_HAMMING
+    aplicar = False
+    for arg in sys.argv[1:]:
+        if arg == '--aplicar':
+            aplicar = True
+        elif arg.startswith('--umbral='):
+            umbral = int(arg.split('=', 1)[1])
+        else:
+            print(f"❌ Argumento desconocido: {arg}")
+            sys.exit(1)
+
+    AlmacenImagenes().deduplicar(umbral=umbral, aplicar=aplicar)
+
+
+if __name__ == "__main__":
+    main()
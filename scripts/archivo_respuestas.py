@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Archivo de respuestas HTTP con modo replay
+==========================================
+Guarda comprimido el cuerpo de cada respuesta descargada por los scrapers,
+direccionado por contenido (sha256), e indexado por URL + fecha de descarga
+en una base SQLite (data/archivo_respuestas/indice.sqlite).
+
+Con el modo replay activado todas las peticiones se sirven desde el archivo
+sin tocar la red, de modo que se puede volver a parsear un año completo en
+segundos después de cambiar la lógica de extracción.
+
+El archivo tiene un tamaño máximo: al superarlo se eliminan los cuerpos
+usados hace más tiempo (LRU).
+
+Uso:
+    session = montar_archivo(requests.Session())    # archiva lo descargado
+    activar_replay()                                # desde aquí, solo archivo
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+DIRECTORIO_ARCHIVO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  "data", "archivo_respuestas")
+
+# Tamaño máximo por defecto de los cuerpos comprimidos
+TAMANO_MAXIMO_MB = 1024
+
+# Al recortar se deja el archivo por debajo de esta fracción del máximo
+_FRACCION_TRAS_RECORTE = 0.9
+
+_CABECERAS_EXCLUIDAS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'set-cookie'}
+
+
+class ArchivoRespuestas:
+    def __init__(self, directorio=DIRECTORIO_ARCHIVO, tamano_maximo_mb=TAMANO_MAXIMO_MB):
+        """
+        Args:
+            directorio (str): Carpeta del archivo (índice SQLite + objetos comprimidos)
+            tamano_maximo_mb (float): Tamaño máximo de los cuerpos comprimidos (LRU al superarlo)
+        """
+        self.directorio = directorio
+        self.tamano_maximo = int(tamano_maximo_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(self.directorio, 'objetos'), exist_ok=True)
+
+        self._conexion = sqlite3.connect(os.path.join(self.directorio, 'indice.sqlite'), check_same_thread=False)
+        self._conexion.execute('PRAGMA journal_mode=WAL')
+        self._conexion.execute('PRAGMA synchronous=NORMAL')
+        self._conexion.executescript('''
+            CREATE TABLE IF NOT EXISTS respuestas (
+                url TEXT NOT NULL,
+                fecha TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                PRIMARY KEY (url, fecha)
+            );
+            CREATE TABLE IF NOT EXISTS cuerpos (
+                hash TEXT PRIMARY KEY,
+                tamano INTEGER NOT NULL,
+                ultimo_uso REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_cuerpos_uso ON cuerpos (ultimo_uso);
+            CREATE INDEX IF NOT EXISTS idx_respuestas_hash ON respuestas (hash);
+        ''')
+        self._conexion.commit()
+        self.tamano_total = self._conexion.execute('SELECT COALESCE(SUM(tamano), 0) FROM cuerpos').fetchone()[0]
+
+    def _ruta_objeto(self, hash_cuerpo):
+        return os.path.join(self.directorio, 'objetos', hash_cuerpo[:2], hash_cuerpo + '.gz')
+
+    def guardar(self, url, response, fecha=None):
+        """Archiva el cuerpo de una respuesta bajo (url, fecha de descarga)"""
+        cuerpo = response.content
+        hash_cuerpo = hashlib.sha256(cuerpo).hexdigest()
+        fecha = fecha or date.today().isoformat()
+        cabeceras = {k: v for k, v in response.headers.items() if k.lower() not in _CABECERAS_EXCLUIDAS}
+
+        ruta = self._ruta_objeto(hash_cuerpo)
+        with self._lock:
+            existe = self._conexion.execute('SELECT 1 FROM cuerpos WHERE hash = ?', (hash_cuerpo,)).fetchone()
+            if not existe:
+                os.makedirs(os.path.dirname(ruta), exist_ok=True)
+                comprimido = gzip.compress(cuerpo)
+                temporal = f"{ruta}.{threading.get_ident()}.tmp"
+                with open(temporal, 'wb') as f:
+                    f.write(comprimido)
+                os.replace(temporal, ruta)
+                self._conexion.execute('INSERT INTO cuerpos (hash, tamano, ultimo_uso) VALUES (?, ?, ?)',
+                                       (hash_cuerpo, len(comprimido), time.time()))
+                self.tamano_total += len(comprimido)
+            else:
+                self._conexion.execute('UPDATE cuerpos SET ultimo_uso = ? WHERE hash = ?', (time.time(), hash_cuerpo))
+
+            self._conexion.execute(
+                'INSERT OR REPLACE INTO respuestas (url, fecha, hash, status, headers) VALUES (?, ?, ?, ?, ?)',
+                (url, fecha, hash_cuerpo, response.status_code, json.dumps(cabeceras, ensure_ascii=False)))
+            self._conexion.commit()
+
+            if self.tamano_total > self.tamano_maximo:
+                self._recortar()
+
+    def obtener(self, url, fecha=None):
+        """
+        Respuesta archivada más reciente para la URL (hasta la fecha indicada, si se indica)
+
+        Returns:
+            dict: {'status', 'headers', 'cuerpo', 'fecha'} o None
+        """
+        with self._lock:
+            consulta = 'SELECT fecha, hash, status, headers FROM respuestas WHERE url = ?'
+            parametros = [url]
+            if fecha:
+                consulta += ' AND fecha <= ?'
+                parametros.append(fecha)
+            fila = self._conexion.execute(consulta + ' ORDER BY fecha DESC LIMIT 1', parametros).fetchone()
+            if not fila:
+                return None
+
+            fecha_archivo, hash_cuerpo, status, cabeceras = fila
+            try:
+                with open(self._ruta_objeto(hash_cuerpo), 'rb') as f:
+                    cuerpo = gzip.decompress(f.read())
+            except OSError:
+                return None
+            self._conexion.execute('UPDATE cuerpos SET ultimo_uso = ? WHERE hash = ?', (time.time(), hash_cuerpo))
+            self._conexion.commit()
+
+        return {'status': status, 'headers': json.loads(cabeceras), 'cuerpo': cuerpo, 'fecha': fecha_archivo}
+
+    def ubicar(self, urls, fecha=None):
+        """
+        Objeto comprimido (gzip) de la respuesta 200 más reciente de cada URL, para
+        leerlo y parsearlo en otro proceso sin pasar el cuerpo por el índice
+
+        Args:
+            urls: URLs a buscar
+            fecha (str): 'AAAA-MM-DD' para usar lo archivado hasta ese día (default: lo más reciente)
+
+        Returns:
+            dict: {url: ruta} solo para las URLs archivadas
+        """
+        consulta = 'SELECT hash FROM respuestas WHERE url = ? AND status = 200'
+        if fecha:
+            consulta += ' AND fecha <= ?'
+        consulta += ' ORDER BY fecha DESC LIMIT 1'
+
+        rutas = {}
+        with self._lock:
+            usados = []
+            for url in urls:
+                fila = self._conexion.execute(consulta, (url, fecha) if fecha else (url,)).fetchone()
+                if fila:
+                    rutas[url] = self._ruta_objeto(fila[0])
+                    usados.append((time.time(), fila[0]))
+            self._conexion.executemany('UPDATE cuerpos SET ultimo_uso = ? WHERE hash = ?', usados)
+            self._conexion.commit()
+        return rutas
+
+    def _recortar(self):
+        """Elimina los cuerpos usados hace más tiempo hasta quedar bajo el máximo (con el lock tomado)"""
+        objetivo = self.tamano_maximo * _FRACCION_TRAS_RECORTE
+        eliminados = 0
+        for hash_cuerpo, tamano in self._conexion.execute(
+                'SELECT hash, tamano FROM cuerpos ORDER BY ultimo_uso').fetchall():
+            if self.tamano_total <= objetivo:
+                break
+            try:
+                os.remove(self._ruta_objeto(hash_cuerpo))
+            except OSError:
+                pass
+            self._conexion.execute('DELETE FROM respuestas WHERE hash = ?', (hash_cuerpo,))
+            self._conexion.execute('DELETE FROM cuerpos WHERE hash = ?', (hash_cuerpo,))
+            self.tamano_total -= tamano
+            eliminados += 1
+        self._conexion.commit()
+        print(f"  🗑️  Archivo de respuestas: eliminados {eliminados} cuerpo(s) por tamaño máximo")
+
+
+class AdaptadorArchivo(BaseAdapter):
+    def __init__(self, interno, archivo):
+        """
+        Args:
+            interno (BaseAdapter): Adaptador que hace la petición real
+            archivo (ArchivoRespuestas): Archivo donde se guardan las respuestas
+        """
+        super().__init__()
+        self.interno = interno
+        self.archivo = archivo
+
+    def send(self, request, stream=False, **kwargs):
+        if _replay['activo']:
+            if request.method == 'GET':
+                entrada = self.archivo.obtener(request.url, _replay['fecha'])
+                if entrada:
+                    return self._respuesta_desde_archivo(request, entrada)
+            raise requests.exceptions.ConnectionError(f"Sin respuesta archivada para {request.url} (modo replay)",
+                                                      request=request)
+
+        response = self.interno.send(request, stream=stream, **kwargs)
+        # Las descargas en streaming (imágenes) y los errores de la API de MediaWiki
+        # (que llegan con 200, ej: maxlag) no se archivan
+        if request.method == 'GET' and response.status_code == 200 and not stream \
+                and 'MediaWiki-API-Error' not in response.headers:
+            try:
+                self.archivo.guardar(request.url, response)
+            except (OSError, sqlite3.Error) as e:
+                print(f"  ⚠️ No se pudo archivar {request.url}: {e}")
+        return response
+
+    def _respuesta_desde_archivo(self, request, entrada):
+        response = requests.Response()
+        response.status_code = entrada['status']
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(entrada['headers'])
+        response._content = entrada['cuerpo']
+        response._content_consumed = True
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        self.interno.close()
+
+
+# Estado del modo replay, común a todas las sesiones del proceso
+_replay = {'activo': False, 'fecha': None}
+
+_archivo_compartido = None
+_lock_archivo_compartido = threading.Lock()
+
+
+def activar_replay(fecha=None):
+    """
+    Sirve todas las peticiones desde el archivo, sin red
+
+    Args:
+        fecha (str): 'AAAA-MM-DD' para usar lo archivado hasta ese día (default: lo más reciente)
+    """
+    _replay['activo'] = True
+    _replay['fecha'] = fecha
+
+
+def replay_activo():
+    return _replay['activo']
+
+
+def fecha_replay():
+    """Fecha límite del modo replay ('AAAA-MM-DD'), None si usa lo más reciente"""
+    return _replay['fecha']
+
+
+def archivo_compartido():
+    """Archivo único del proceso, compartido por todos los scrapers"""
+    global _archivo_compartido
+    with _lock_archivo_compartido:
+        if _archivo_compartido is None:
+            _archivo_compartido = ArchivoRespuestas()
+        return _archivo_compartido
+
+
+def montar_archivo(session, archivo=None):
+    """
+    Envuelve los adaptadores ya montados en la sesión (http y https) con el archivo
+
+    Returns:
+        requests.Session: la misma sesión
+    """
+    archivo = archivo or archivo_compartido()
+    for prefijo in ('https://', 'http://'):
+        session.mount(prefijo, AdaptadorArchivo(session.get_adapter(prefijo), archivo))
+    return session
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Base SQLite de santos
+=====================
+Copia opcional de santos.csv en SQLite (data/santos.db) para consultarla sin
+leer el CSV entero. santos.csv sigue siendo el archivo de verdad, el que
+escribe el scraper y el que se publica; la base es un espejo que se mantiene
+sincronizado con él:
+
+- Índices por (mes, dia), nombre y url_wikipedia: los santos de un día, un
+  nombre o un artículo se buscan sin leer ni parsear todo el CSV.
+- Modo WAL: un scraper puede escribir mientras otro proceso exporta o consulta
+  (los lectores ven la última transacción confirmada).
+- guardar() hace upsert por santo (clave mes-dia-nombre): una corrección
+  actualiza solo esas filas, sin reescribir nada más.
+- importar_csv() / exportar_csv() pasan de santos.csv a la base y de vuelta
+  con las mismas filas válidas, en el mismo orden y con los duplicados. No es
+  una copia byte a byte: las filas que leer_csv() saltea (vacías o mal
+  formadas) y las columnas que no son de CAMPOS no llegan a la base, y mes,
+  dia y prioridad se guardan como números (una prioridad "050" vuelve como
+  "50"). Para un santos.csv escrito por el scraper el resultado es idéntico.
+
+La base guarda la firma (tamaño y fecha de modificación) del santos.csv con
+el que quedó igual; sincronizar_csv() lo vuelve a importar solo si el CSV
+cambió por otro lado (ej: dedupe_santos.py o una edición a mano).
+
+Con SantosWikipediaScraper(base_sqlite=...) (o python3 main.py --sqlite ...)
+el scraper repite en la base cada día que agrega al CSV y cada eliminación,
+así la base queda al día mientras se scrapea.
+
+Uso:
+    python3 scripts/base_santos.py --importar              # data/santos.csv -> data/santos.db
+    python3 scripts/base_santos.py --exportar              # data/santos.db -> data/santos.csv
+    python3 scripts/base_santos.py --exportar=otro.csv     # exporta a otro archivo
+    python3 scripts/base_santos.py --dia 11 11             # santos de un día
+    python3 scripts/base_santos.py --nombre "San Martín de Tours"
+    python3 scripts/base_santos.py --url https://es.wikipedia.org/wiki/Martín_de_Tours
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+from contextlib import contextmanager
+
+from santo import Santo, escribir_csv, leer_csv
+from sumidero_csv import CAMPOS
+
+DIRECTORIO_BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ARCHIVO_BASE = os.path.join(DIRECTORIO_BASE, "data", "santos.db")
+ARCHIVO_CSV = os.path.join(DIRECTORIO_BASE, "data", "santos.csv")
+
+# id conserva el orden de las filas de santos.csv. Sin restricción UNIQUE en
+# (mes, dia, nombre): el CSV puede traer duplicados y la importación no los pierde
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS santos (
+    id INTEGER PRIMARY KEY,
+    mes INTEGER NOT NULL,
+    dia INTEGER NOT NULL,
+    nombre TEXT NOT NULL,
+    prioridad INTEGER,
+    descripcion TEXT NOT NULL DEFAULT '',
+    imagen TEXT NOT NULL DEFAULT '',
+    url_wikipedia TEXT NOT NULL DEFAULT '',
+    etiquetas TEXT NOT NULL DEFAULT '',
+    oracion TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_santos_dia ON santos (mes, dia);
+CREATE INDEX IF NOT EXISTS idx_santos_nombre ON santos (nombre);
+CREATE INDEX IF NOT EXISTS idx_santos_url ON santos (url_wikipedia);
+CREATE TABLE IF NOT EXISTS meta (
+    clave TEXT PRIMARY KEY,
+    valor TEXT
+);
+"""
+
+_COLUMNAS = ', '.join(CAMPOS)
+_INSERTAR = f"INSERT INTO santos ({_COLUMNAS}) VALUES ({', '.join('?' for _ in CAMPOS)})"
+_ACTUALIZAR = (f"UPDATE santos SET {', '.join(f'{campo} = ?' for campo in CAMPOS[3:])} "
+               f"WHERE mes = ? AND dia = ? AND nombre = ?")
+_SELECCIONAR = f"SELECT {_COLUMNAS} FROM santos"
+
+
+def firma_csv(ruta):
+    """Tamaño y fecha de modificación de un CSV ('' si no existe)"""
+    try:
+        estado = os.stat(ruta)
+    except FileNotFoundError:
+        return ''
+    return f"{estado.st_size}-{estado.st_mtime_ns}"
+
+
+def _valores(santo):
+    return tuple(getattr(santo, campo) for campo in CAMPOS)
+
+
+class BaseSantos:
+    def __init__(self, ruta=ARCHIVO_BASE):
+        """
+        Abre (o crea) la base
+
+        Args:
+            ruta (str): Archivo SQLite
+        """
+        self.ruta = ruta
+        directorio = os.path.dirname(ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        # Una conexión compartida por los hilos del scraper, siempre bajo self._lock;
+        # las transacciones se abren a mano (isolation_level=None)
+        self._conexion = sqlite3.connect(ruta, timeout=30, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conexion.execute("PRAGMA journal_mode=WAL")
+        # En WAL, NORMAL no pierde integridad ante un corte (a lo sumo la última transacción)
+        self._conexion.execute("PRAGMA synchronous=NORMAL")
+        self._conexion.executescript(ESQUEMA)
+
+    @contextmanager
+    def _transaccion(self, escritura=True):
+        """Transacción (BEGIN IMMEDIATE para escribir): confirma al salir, deshace si hay error"""
+        with self._lock:
+            self._conexion.execute("BEGIN IMMEDIATE" if escritura else "BEGIN")
+            try:
+                yield self._conexion
+            except BaseException:
+                self._conexion.execute("ROLLBACK")
+                raise
+            self._conexion.execute("COMMIT")
+
+    def __len__(self):
+        with self._lock:
+            return self._conexion.execute("SELECT COUNT(*) FROM santos").fetchone()[0]
+
+    def agregar(self, santos):
+        """
+        Agrega filas al final, como el CSV (no mira si la clave ya existe)
+
+        Args:
+            santos (list): Santo o filas del scraper
+        """
+        filas = [_valores(s if isinstance(s, Santo) else Santo.desde_fila(s)) for s in santos]
+        if filas:
+            with self._transaccion() as conexion:
+                conexion.executemany(_INSERTAR, filas)
+
+    def guardar(self, santos):
+        """
+        Upsert por santo: actualiza las filas con su clave mes-dia-nombre o lo agrega al final
+
+        Args:
+            santos (list): Santo o filas del scraper
+
+        Returns:
+            tuple: (actualizados, agregados)
+        """
+        actualizados = agregados = 0
+        with self._transaccion() as conexion:
+            for santo in santos:
+                if not isinstance(santo, Santo):
+                    santo = Santo.desde_fila(santo)
+                valores = _valores(santo)
+                if conexion.execute(_ACTUALIZAR, valores[3:] + valores[:3]).rowcount:
+                    actualizados += 1
+                else:
+                    conexion.execute(_INSERTAR, valores)
+                    agregados += 1
+        return actualizados, agregados
+
+    def eliminar(self, claves):
+        """
+        Elimina los santos con las claves "mes-dia-nombre" indicadas
+
+        Returns:
+            int: filas eliminadas
+        """
+        eliminadas = 0
+        with self._transaccion() as conexion:
+            for clave in claves:
+                mes, dia, nombre = clave.split('-', 2)
+                eliminadas += conexion.execute("DELETE FROM santos WHERE mes = ? AND dia = ? AND nombre = ?",
+                                               (int(mes), int(dia), nombre)).rowcount
+        return eliminadas
+
+    def _consultar(self, condicion='', parametros=()):
+        with self._transaccion(escritura=False) as conexion:
+            filas = conexion.execute(f"{_SELECCIONAR} {condicion} ORDER BY id", parametros).fetchall()
+        return [Santo(*fila) for fila in filas]
+
+    def todos(self):
+        """Todos los santos, en el orden del CSV"""
+        return self._consultar()
+
+    def del_dia(self, mes, dia):
+        return self._consultar("WHERE mes = ? AND dia = ?", (mes, dia))
+
+    def por_nombre(self, nombre):
+        return self._consultar("WHERE nombre = ?", (nombre,))
+
+    def por_url(self, url_wikipedia):
+        return self._consultar("WHERE url_wikipedia = ?", (url_wikipedia,))
+
+    def reemplazar(self, santos):
+        """Reemplaza todo el contenido por los santos indicados (una sola transacción)"""
+        filas = [_valores(s if isinstance(s, Santo) else Santo.desde_fila(s)) for s in santos]
+        with self._transaccion() as conexion:
+            conexion.execute("DELETE FROM santos")
+            conexion.executemany(_INSERTAR, filas)
+        return len(filas)
+
+    def _firma(self, ruta_csv):
+        with self._lock:
+            fila = self._conexion.execute("SELECT valor FROM meta WHERE clave = ?",
+                                          (f"firma:{os.path.abspath(ruta_csv)}",)).fetchone()
+        return fila[0] if fila else None
+
+    def marcar_sincronizada(self, ruta_csv):
+        """Anota que la base tiene el mismo contenido que ese CSV"""
+        # Solo vale la del último CSV: la base cambió respecto de cualquier otro
+        with self._transaccion() as conexion:
+            conexion.execute("DELETE FROM meta WHERE clave LIKE 'firma:%'")
+            conexion.execute("INSERT INTO meta (clave, valor) VALUES (?, ?)",
+                             (f"firma:{os.path.abspath(ruta_csv)}", firma_csv(ruta_csv)))
+
+    def importar_csv(self, ruta_csv=ARCHIVO_CSV):
+        """
+        Reemplaza el contenido de la base por el de un santos.csv (las filas de leer_csv)
+
+        Returns:
+            int: santos importados
+        """
+        cantidad = self.reemplazar(leer_csv(ruta_csv))
+        self.marcar_sincronizada(ruta_csv)
+        return cantidad
+
+    def exportar_csv(self, ruta_csv=ARCHIVO_CSV):
+        """
+        Escribe santos.csv desde la base (escritura atómica). Solo lee: con un scraper
+        escribiendo en otro proceso, exporta la última transacción confirmada
+
+        Returns:
+            int: santos exportados
+        """
+        santos = self.todos()
+        escribir_csv(ruta_csv, santos)
+        return len(santos)
+
+    def sincronizar_csv(self, ruta_csv=ARCHIVO_CSV):
+        """
+        Vuelve a importar el CSV si cambió desde la última importación o exportación
+
+        Returns:
+            bool: True si lo importó
+        """
+        if not os.path.exists(ruta_csv) or self._firma(ruta_csv) == firma_csv(ruta_csv):
+            return False
+        cantidad = self.importar_csv(ruta_csv)
+        print(f"🗄️  Base {self.ruta} sincronizada con {ruta_csv}: {cantidad} santos")
+        return True
+
+    def cerrar(self):
+        with self._lock:
+            self._conexion.close()
+
+
+# Base activada para todo el proceso (python3 main.py --sqlite)
+_base = {'ruta': None}
+
+
+def activar_base(ruta=ARCHIVO_BASE):
+    """Los scrapers y scripts que se creen desde ahora mantienen también esta base"""
+    _base['ruta'] = ruta
+
+
+def ruta_base_activa():
+    """Ruta de la base activada con activar_base(), None si solo se usa el CSV"""
+    return _base['ruta']
+
+
+def _imprimir(santos):
+    for santo in santos:
+        print(f"  {santo.dia:02d}/{santo.mes:02d} [{santo.prioridad if santo.prioridad is not None else '-':>3}] "
+              f"{santo.nombre} {santo.url_wikipedia}")
+    print(f"✅ {len(santos)} santo(s)")
+
+
+def main():
+    argumentos = sys.argv[1:]
+    if not argumentos:
+        print(__doc__)
+        sys.exit(1)
+
+    base = BaseSantos()
+    opcion = argumentos[0]
+    try:
+        if opcion == '--importar':
+            ruta = argumentos[1] if len(argumentos) > 1 else ARCHIVO_CSV
+            print(f"📥 {base.importar_csv(ruta)} santos importados de {ruta} a {base.ruta}")
+        elif opcion.startswith('--exportar'):
+            ruta = opcion.split('=', 1)[1] if '=' in opcion else ARCHIVO_CSV
+            print(f"📤 {base.exportar_csv(ruta)} santos exportados de {base.ruta} a {ruta}")
+        elif opcion == '--dia' and len(argumentos) == 3:
+            _imprimir(base.del_dia(int(argumentos[1]), int(argumentos[2])))
+        elif opcion == '--nombre' and len(argumentos) == 2:
+            _imprimir(base.por_nombre(argumentos[1]))
+        elif opcion == '--url' and len(argumentos) == 2:
+            _imprimir(base.por_url(argumentos[1]))
+        else:
+            print(f"❌ Argumentos no válidos: {' '.join(argumentos)}")
+            print(__doc__)
+            sys.exit(1)
+    finally:
+        base.cerrar()
+
+
+if __name__ == "__main__":
+    main()
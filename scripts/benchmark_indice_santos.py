@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark del índice por día de santos_existentes
+=================================================
+Compara, para los 366 días del año, buscar los santos guardados de cada día
+recorriendo todas las filas (como hacía procesar_dia) contra la búsqueda en
+el índice (mes, dia) de SantosExistentes, con CSVs sintéticos de distintos
+tamaños y con data/santos.csv si existe.
+
+Uso:
+    python3 scripts/benchmark_indice_santos.py                 # 5.000, 50.000 y 200.000 filas
+    python3 scripts/benchmark_indice_santos.py 10000 100000    # tamaños a medir
+"""
+
+import csv
+import os
+import sys
+import time
+
+from santos_existentes import SantosExistentes
+from sumidero_csv import clave_santo
+
+ARCHIVO_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "santos.csv")
+
+TAMAÑOS_POR_DEFECTO = [5000, 50000, 200000]
+
+DIAS_DEL_AÑO = [(mes, dia) for mes, dias in enumerate([31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31], start=1)
+                for dia in range(1, dias + 1)]
+
+
+def filas_sinteticas(cantidad):
+    """Filas como las de csv.DictReader (todo texto), repartidas entre los 366 días"""
+    filas = []
+    for i in range(cantidad):
+        mes, dia = DIAS_DEL_AÑO[i % len(DIAS_DEL_AÑO)]
+        filas.append({'mes': str(mes), 'dia': str(dia), 'nombre': f"San Ejemplo {i}", 'prioridad': '50',
+                      'descripcion': '', 'imagen': '', 'url_wikipedia': '', 'etiquetas': '', 'oracion': ''})
+    return filas
+
+
+def _medir(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return time.perf_counter() - inicio, resultado
+
+
+def comparar(filas, titulo):
+    """Mide las 366 búsquedas por día con recorrido completo y con el índice"""
+    existentes = {clave_santo(fila): fila for fila in filas}
+    segundos_indexar, indice = _medir(lambda: SantosExistentes(existentes))
+
+    def recorrido():
+        return [len([s for s in existentes.values() if int(s['mes']) == mes and int(s['dia']) == dia])
+                for mes, dia in DIAS_DEL_AÑO]
+
+    def con_indice():
+        return [len(indice.del_dia(mes, dia)) for mes, dia in DIAS_DEL_AÑO]
+
+    segundos_recorrido, por_recorrido = _medir(recorrido)
+    segundos_indice, por_indice = _medir(con_indice)
+    if por_recorrido != por_indice:
+        print(f"❌ {titulo}: el índice no coincide con el recorrido")
+        return False
+
+    aceleracion = segundos_recorrido / segundos_indice if segundos_indice else float('inf')
+    print(f"📊 {titulo}: {len(existentes)} santos")
+    print(f"   🐢 Recorrido completo x366: {segundos_recorrido * 1000:10.1f} ms")
+    print(f"   ⚡ Índice (mes, dia) x366:  {segundos_indice * 1000:10.3f} ms  "
+          f"(x{aceleracion:,.0f}; armar el índice: {segundos_indexar * 1000:.1f} ms, una vez)")
+    return True
+
+
+def main():
+    tamaños = []
+    for arg in sys.argv[1:]:
+        if not arg.isdigit():
+            print(f"❌ Argumento desconocido: {arg}")
+            sys.exit(1)
+        tamaños.append(int(arg))
+
+    correcto = True
+    if os.path.exists(ARCHIVO_CSV):
+        with open(ARCHIVO_CSV, 'r', encoding='utf-8') as f:
+            correcto &= comparar(list(csv.DictReader(f)), "data/santos.csv")
+    for cantidad in tamaños or TAMAÑOS_POR_DEFECTO:
+        correcto &= comparar(filas_sinteticas(cantidad), f"CSV sintético de {cantidad:,} filas")
+    sys.exit(0 if correcto else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de Santo y ColumnasSantos
+===================================
+Compara las filas como dicts de csv.DictReader contra los registros Santo
+(santo.py):
+
+- Memoria por santo (tracemalloc), para data/santos.csv y CSVs sintéticos.
+- Consultas masivas: santos con una etiqueta y los 3 de mayor prioridad de
+  cada día, recorriendo los dicts en Python contra ColumnasSantos (NumPy si
+  está instalado). Verifica que los resultados coincidan.
+
+Uso:
+    python3 scripts/benchmark_registros_santos.py                # 5.000, 50.000 y 200.000 filas
+    python3 scripts/benchmark_registros_santos.py 10000 100000   # tamaños a medir
+"""
+
+import csv
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+import santo as modulo_santo
+from santo import ColumnasSantos, Santo
+from sumidero_csv import CAMPOS
+
+ARCHIVO_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "santos.csv")
+
+TAMAÑOS_POR_DEFECTO = [5000, 50000, 200000]
+
+ETIQUETAS = ['', '', '', '', '', '', 'festividad', 'santo_argentino', 'santo_scout', 'festividad,santo_scout']
+
+
+def csv_sintetico(cantidad):
+    """Texto CSV con filas parecidas a las reales, repartidas entre los 366 días"""
+    salida = io.StringIO()
+    writer = csv.DictWriter(salida, fieldnames=CAMPOS)
+    writer.writeheader()
+    for i in range(cantidad):
+        writer.writerow({'mes': i % 12 + 1, 'dia': i % 29 + 1, 'nombre': f"San Ejemplo {i}",
+                         'prioridad': (50, 50, 50, 70, 80, 100)[i % 6],
+                         'descripcion': f"Descripción de ejemplo número {i} con algo de texto.",
+                         'imagen': f"san_ejemplo_{i}.jpg", 'url_wikipedia': f"https://es.wikipedia.org/wiki/San_{i}",
+                         'etiquetas': ETIQUETAS[i % len(ETIQUETAS)], 'oracion': ''})
+    return salida.getvalue()
+
+
+def _memoria(funcion):
+    """(resultado, bytes que quedan ocupados por el resultado)"""
+    tracemalloc.start()
+    resultado = funcion()
+    ocupados, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, ocupados
+
+
+def _medir(funcion, repeticiones=3):
+    mejor = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        segundos = time.perf_counter() - inicio
+        mejor = segundos if mejor is None else min(mejor, segundos)
+    return mejor, resultado
+
+
+def top_con_dicts(filas, k):
+    """Los k de mayor prioridad por día, como se haría con las filas de DictReader"""
+    por_dia = {}
+    for fila in filas:
+        por_dia.setdefault((int(fila['mes']), int(fila['dia'])), []).append(fila)
+    return {fecha: [f['nombre'] for f in sorted(por_dia[fecha], key=lambda f: -int(f['prioridad'] or 0))[:k]]
+            for fecha in sorted(por_dia)}
+
+
+def comparar(texto, titulo):
+    dicts, memoria_dicts = _memoria(lambda: list(csv.DictReader(io.StringIO(texto))))
+    santos, memoria_santos = _memoria(lambda: [Santo.desde_fila(f) for f in csv.DictReader(io.StringIO(texto))])
+    columnas = ColumnasSantos(santos)
+    n = len(santos)
+
+    print(f"📊 {titulo}: {n} santos")
+    print(f"   💾 Memoria por santo: dict {memoria_dicts / n:7.0f} B | Santo {memoria_santos / n:7.0f} B "
+          f"(-{100 - 100 * memoria_santos / memoria_dicts:.0f}%)")
+
+    segundos_dicts, por_dicts = _medir(
+        lambda: [f['nombre'] for f in dicts if 'santo_scout' in f['etiquetas'].split(',')])
+    segundos_columnas, por_columnas = _medir(
+        lambda: [s.nombre for s in columnas.filtrar(etiqueta='santo_scout')])
+    correcto = por_dicts == por_columnas
+    print(f"   🔎 Filtro por etiqueta:  dicts {segundos_dicts * 1000:8.2f} ms | "
+          f"columnas {segundos_columnas * 1000:8.2f} ms {'✅' if correcto else '❌ distinto'}")
+
+    segundos_dicts, por_dicts = _medir(lambda: top_con_dicts(dicts, 3))
+    segundos_columnas, por_columnas = _medir(
+        lambda: {fecha: [s.nombre for s in lista] for fecha, lista in columnas.top_por_dia(3).items()})
+    correcto_top = por_dicts == por_columnas
+    print(f"   🏆 Top 3 por día:        dicts {segundos_dicts * 1000:8.2f} ms | "
+          f"columnas {segundos_columnas * 1000:8.2f} ms {'✅' if correcto_top else '❌ distinto'}")
+    return correcto and correcto_top
+
+
+def main():
+    tamaños = []
+    for arg in sys.argv[1:]:
+        if not arg.isdigit():
+            print(f"❌ Argumento desconocido: {arg}")
+            sys.exit(1)
+        tamaños.append(int(arg))
+
+    print(f"🧮 Consultas por columnas con {'NumPy' if modulo_santo.numpy is not None else 'array (sin NumPy)'}")
+    correcto = True
+    if os.path.exists(ARCHIVO_CSV):
+        with open(ARCHIVO_CSV, 'r', encoding='utf-8') as f:
+            correcto &= comparar(f.read(), "data/santos.csv")
+    for cantidad in tamaños or TAMAÑOS_POR_DEFECTO:
+        correcto &= comparar(csv_sintetico(cantidad), f"CSV sintético de {cantidad:,} filas")
+    sys.exit(0 if correcto else 1)
+
+
+if __name__ == "__main__":
+    main()
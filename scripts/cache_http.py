@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Caché HTTP en disco con validadores (ETag / Last-Modified)
+==========================================================
+Adaptador para requests.Session que guarda el cuerpo de las respuestas junto
+con sus validadores y, en la siguiente petición a la misma URL, envía
+If-None-Match / If-Modified-Since. Si el servidor responde 304 se devuelve
+el cuerpo guardado, así los RSS, páginas de días y artículos sin cambios no
+se vuelven a descargar.
+
+La caché se comparte entre todos los scrapers (data/cache_http/) y lleva la
+cuenta por host de:
+
+    aciertos     -> respuesta aún fresca (Cache-Control: max-age), sin petición
+    revalidados  -> el servidor respondió 304 Not Modified
+    fallos       -> descarga completa
+
+Las descargas en streaming (imágenes) no pasan por la caché.
+
+Uso:
+    session = requests.Session()
+    montar_cache(session)
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+DIRECTORIO_CACHE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cache_http")
+
+# Cabeceras que no se guardan: el cuerpo se almacena ya descomprimido
+_CABECERAS_EXCLUIDAS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'set-cookie'}
+
+_RE_MAX_AGE = re.compile(r'max-age=(\d+)')
+
+
+def _max_age(cabeceras):
+    """Segundos de frescura indicados por Cache-Control (0 si hay que revalidar siempre)"""
+    cache_control = cabeceras.get('Cache-Control', '').lower()
+    if 'no-cache' in cache_control or 'no-store' in cache_control:
+        return 0
+    m = _RE_MAX_AGE.search(cache_control)
+    return int(m.group(1)) if m else 0
+
+
+class CacheHTTP:
+    def __init__(self, directorio=DIRECTORIO_CACHE):
+        """
+        Args:
+            directorio (str): Carpeta donde se guardan metadatos y cuerpos
+        """
+        self.directorio = directorio
+        self.estadisticas = {}  # host -> {'aciertos': n, 'revalidados': n, 'fallos': n}
+        self._lock = threading.Lock()
+        os.makedirs(self.directorio, exist_ok=True)
+
+    def _rutas(self, url):
+        clave = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.directorio, clave[:2], clave)
+        return base + '.json', base + '.cuerpo'
+
+    def obtener(self, url):
+        """Entrada guardada para la URL (metadatos + cuerpo) o None"""
+        ruta_meta, ruta_cuerpo = self._rutas(url)
+        try:
+            with open(ruta_meta, 'r', encoding='utf-8') as f:
+                entrada = json.load(f)
+            with open(ruta_cuerpo, 'rb') as f:
+                entrada['cuerpo'] = f.read()
+            return entrada
+        except (OSError, ValueError):
+            return None
+
+    def guardar(self, url, response):
+        """Guarda una respuesta 200 si trae validadores o tiempo de frescura"""
+        cabeceras = response.headers
+        if 'no-store' in cabeceras.get('Cache-Control', '').lower():
+            return
+        entrada = {
+            'url': url,
+            'status': response.status_code,
+            'etag': cabeceras.get('ETag'),
+            'last_modified': cabeceras.get('Last-Modified'),
+            'max_age': _max_age(cabeceras),
+            'guardado': time.time(),
+            'headers': {k: v for k, v in cabeceras.items() if k.lower() not in _CABECERAS_EXCLUIDAS},
+        }
+        if not (entrada['etag'] or entrada['last_modified'] or entrada['max_age']):
+            return
+
+        ruta_meta, ruta_cuerpo = self._rutas(url)
+        os.makedirs(os.path.dirname(ruta_meta), exist_ok=True)
+        # Escritura atómica: primero el cuerpo, después los metadatos que lo referencian
+        for ruta, modo, contenido in ((ruta_cuerpo, 'wb', response.content),
+                                      (ruta_meta, 'w', json.dumps(entrada, ensure_ascii=False))):
+            temporal = f"{ruta}.{threading.get_ident()}.tmp"
+            with open(temporal, modo, **({} if 'b' in modo else {'encoding': 'utf-8'})) as f:
+                f.write(contenido)
+            os.replace(temporal, ruta)
+
+    def actualizar_frescura(self, url, entrada, response_304):
+        """Tras un 304, renueva la fecha de guardado (y max-age si el servidor lo envía)"""
+        ruta_meta, _ = self._rutas(url)
+        entrada = {k: v for k, v in entrada.items() if k != 'cuerpo'}
+        entrada['guardado'] = time.time()
+        if 'Cache-Control' in response_304.headers:
+            entrada['max_age'] = _max_age(response_304.headers)
+        temporal = f"{ruta_meta}.{threading.get_ident()}.tmp"
+        try:
+            with open(temporal, 'w', encoding='utf-8') as f:
+                json.dump(entrada, f, ensure_ascii=False)
+            os.replace(temporal, ruta_meta)
+        except OSError:
+            pass
+
+    def registrar(self, url, resultado):
+        """Suma un acierto, revalidado o fallo al host de la URL"""
+        host = urlparse(url).netloc
+        with self._lock:
+            contadores = self.estadisticas.setdefault(host, {'aciertos': 0, 'revalidados': 0, 'fallos': 0})
+            contadores[resultado] += 1
+
+    def imprimir_resumen(self):
+        if not self.estadisticas:
+            return
+        print("-" * 60)
+        print("🗄️  CACHÉ HTTP (aciertos / revalidados 304 / descargas completas)")
+        with self._lock:
+            for host, contadores in sorted(self.estadisticas.items()):
+                print(f"  {host:<30} {contadores['aciertos']:>5} / {contadores['revalidados']:>5} / "
+                      f"{contadores['fallos']:>5}")
+        print("-" * 60)
+
+
+class AdaptadorCacheHTTP(BaseAdapter):
+    def __init__(self, interno, cache):
+        """
+        Args:
+            interno (BaseAdapter): Adaptador que hace la petición real (ej: HTTPAdapter)
+            cache (CacheHTTP): Caché donde se guardan las respuestas
+        """
+        super().__init__()
+        self.interno = interno
+        self.cache = cache
+
+    def send(self, request, stream=False, **kwargs):
+        if request.method != 'GET' or stream:
+            return self.interno.send(request, stream=stream, **kwargs)
+
+        url = request.url
+        entrada = self.cache.obtener(url)
+
+        if entrada and entrada['max_age'] and time.time() - entrada['guardado'] < entrada['max_age']:
+            self.cache.registrar(url, 'aciertos')
+            return self._respuesta_desde_cache(request, entrada)
+
+        if entrada:
+            request = request.copy()
+            if entrada.get('etag'):
+                request.headers['If-None-Match'] = entrada['etag']
+            if entrada.get('last_modified'):
+                request.headers['If-Modified-Since'] = entrada['last_modified']
+
+        response = self.interno.send(request, stream=stream, **kwargs)
+
+        if response.status_code == 304 and entrada:
+            self.cache.registrar(url, 'revalidados')
+            self.cache.actualizar_frescura(url, entrada, response)
+            respuesta = self._respuesta_desde_cache(request, entrada)
+            respuesta.elapsed = response.elapsed
+            response.close()
+            return respuesta
+
+        self.cache.registrar(url, 'fallos')
+        if response.status_code == 200:
+            try:
+                self.cache.guardar(url, response)
+            except OSError as e:
+                print(f"  ⚠️ No se pudo guardar en caché {url}: {e}")
+        return response
+
+    def _respuesta_desde_cache(self, request, entrada):
+        response = requests.Response()
+        response.status_code = entrada['status']
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(entrada['headers'])
+        response._content = entrada['cuerpo']
+        response._content_consumed = True
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.from_cache = True
+        return response
+
+    def close(self):
+        self.interno.close()
+
+
+_cache_compartida = None
+_lock_cache_compartida = threading.Lock()
+
+
+def cache_compartida():
+    """Caché única del proceso, compartida por todos los scrapers"""
+    global _cache_compartida
+    with _lock_cache_compartida:
+        if _cache_compartida is None:
+            _cache_compartida = CacheHTTP()
+        return _cache_compartida
+
+
+def montar_cache(session, adaptador=None, cache=None):
+    """
+    Monta la caché HTTP en una sesión de requests (http y https)
+
+    Args:
+        session (requests.Session): Sesión a modificar
+        adaptador (BaseAdapter): Adaptador interno (default: HTTPAdapter())
+        cache (CacheHTTP): Caché a usar (default: la compartida)
+
+    Returns:
+        requests.Session: la misma sesión
+    """
+    adaptador_cache = AdaptadorCacheHTTP(adaptador or HTTPAdapter(), cache or cache_compartida())
+    session.mount('https://', adaptador_cache)
+    session.mount('http://', adaptador_cache)
+    return session
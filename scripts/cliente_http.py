@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cliente HTTP compartido
+=======================
+Arma las sesiones de requests de todos los scrapers con la misma cadena de
+adaptadores, de afuera hacia adentro:
+
+    archivo de respuestas -> caché HTTP -> resiliencia -> limitador -> pool de conexiones
+
+- Pool keep-alive por host, dimensionado según los hilos que van a usarlo:
+  un backfill de muchas fechas reutiliza la conexión TCP/TLS en vez de abrir
+  una por día.
+- Timeout por defecto (conexión, lectura) para toda petición que no indique
+  uno propio.
+- Cabeceras comunes (User-Agent) y compresión transparente: requests pide
+  gzip/deflate y también br si está instalado el paquete opcional brotli
+  (pip install brotli); el cuerpo llega siempre descomprimido.
+
+Uso:
+    session = crear_sesion(hilos=8)      # sesión propia con pool para 8 hilos
+    session = sesion_compartida()        # sesión única para los scrapers de evangelios
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+
+from archivo_respuestas import montar_archivo
+from cache_http import montar_cache
+from limitador import adaptador_limitado
+from resiliencia import adaptador_resiliente
+
+# Timeout por defecto: (segundos para conectar, segundos entre bytes recibidos)
+TIMEOUT = (5, 15)
+
+# Hosts distintos con conexiones guardadas, y conexiones mínimas por host
+POOL_HOSTS = 10
+POOL_CONEXIONES = 10
+
+CABECERAS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    # "gzip, deflate" y ", br" / ", zstd" según los paquetes instalados
+    'Accept-Encoding': DEFAULT_ACCEPT_ENCODING,
+}
+
+
+class AdaptadorPool(HTTPAdapter):
+    def __init__(self, hilos=1, timeout=TIMEOUT):
+        """
+        Args:
+            hilos (int): Hilos que comparten la sesión (conexiones abiertas por host)
+            timeout (float | tuple): Timeout para las peticiones que no indiquen uno
+        """
+        self.timeout = timeout
+        super().__init__(pool_connections=POOL_HOSTS, pool_maxsize=max(POOL_CONEXIONES, hilos))
+
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=self.timeout if timeout is None else timeout, **kwargs)
+
+
+def crear_sesion(hilos=1, limitador=None, timeout=TIMEOUT):
+    """
+    Crea una sesión con pool de conexiones y la cadena completa de adaptadores
+
+    Args:
+        hilos (int): Hilos que van a usar la sesión a la vez
+        limitador (LimitadorPeticiones): Limitador a respetar (default: el compartido)
+        timeout (float | tuple): Timeout por defecto (conexión, lectura)
+
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+    session.headers.update(CABECERAS)
+    adaptador = adaptador_resiliente(adaptador_limitado(AdaptadorPool(hilos, timeout), limitador))
+    return montar_archivo(montar_cache(session, adaptador))
+
+
+_sesion_compartida = None
+_lock_sesion_compartida = threading.Lock()
+
+
+def sesion_compartida():
+    """Sesión única del proceso: los scrapers que la usan comparten conexiones abiertas"""
+    global _sesion_compartida
+    with _lock_sesion_compartida:
+        if _sesion_compartida is None:
+            _sesion_compartida = crear_sesion()
+        return _sesion_compartida
@@ -3,51 +3,43 @@
 """
 Elimina filas duplicadas en santos.csv manteniendo la primera aparición.
 Clave: mes-dia-nombre
+
+Con --sqlite también deja data/santos.db (ver base_santos.py) con las mismas filas.
 """
-import csv
 import os
-from collections import OrderedDict
+import shutil
+import sys
+
+from base_santos import BaseSantos
+from santo import escribir_csv, leer_csv
 
 # Rutas relativas al directorio raíz del proyecto
 directorio_base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 csv_path = os.path.join(directorio_base, "data", "santos.csv")
 backup_path = os.path.join(directorio_base, "backups", "santos.csv.bak")
 
-rows = []
-with open(csv_path, 'r', encoding='utf-8') as f:
-    reader = csv.reader(f)
-    header = next(reader)
-    for r in reader:
-        if not any(cell.strip() for cell in r):
-            continue
-        rows.append(r)
+# Filas como Santo (mes y dia ya enteros); las vacías o mal formadas se saltean al leer
+# (con un aviso) y las columnas que no son de CAMPOS se conservan
+rows = leer_csv(csv_path)
 
 seen = set()
 unique = []
 for r in rows:
-    # Asegurar que hay al menos 3 columnas
-    if len(r) < 3:
-        continue
-    try:
-        mes = r[0].strip()
-        dia = r[1].strip()
-        nombre = r[2].strip()
-    except Exception:
-        continue
-    key = f"{mes}-{dia}-{nombre}"
+    key = f"{r.mes}-{r.dia}-{r.nombre.strip()}"
     if key in seen:
         continue
     seen.add(key)
     unique.append(r)
 
 # Hacer backup
-import shutil
 shutil.copyfile(csv_path, backup_path)
 
-with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-    writer = csv.writer(f)
-    writer.writerow(header)
-    for r in unique:
-        writer.writerow(r)
+escribir_csv(csv_path, unique)
+
+if '--sqlite' in sys.argv[1:]:
+    base = BaseSantos()
+    base.importar_csv(csv_path)
+    base.cerrar()
+    print(f"Base {base.ruta} actualizada.")
 
 print(f"Hecho. {len(rows)} filas leídas, {len(unique)} filas únicas escritas. Backup en {backup_path}.")
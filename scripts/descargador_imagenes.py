@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Descargador de imágenes en paralelo
+===================================
+Descarga las imágenes de los santos con un pool de hilos propio:
+
+- Límite de conexiones simultáneas por host (upload.wikimedia.org).
+- Escritura atómica: se descarga a "<archivo>.<hash de la URL>.part" y recién
+  al terminar se renombra, así nunca queda una imagen truncada en web/images.
+  Cada URL candidata (miniatura, la recibida, el original) tiene su propio
+  ".part": si una se corta y se prueba la siguiente, lo ya bajado no se pierde.
+- Reanudación: si quedó un ".part" de una ejecución anterior se pide el resto
+  con una cabecera Range. Al lado del ".part" queda "<...>.part.json" con
+  la URL y el ETag / Last-Modified que lo produjeron: el resto se pide con
+  If-Range (si el archivo cambió, el servidor manda el archivo entero) y un
+  ".part" sin validador se descarta en lugar de completarlo.
+- Si la imagen ya existe con el mismo tamaño (o el mismo hash, si se conoce)
+  no se vuelve a descargar.
+- Las URLs de upload.wikimedia.org se piden como miniatura al ancho
+  configurado (las tarjetas del sitio miden 300 px), en lugar del original o
+  del tamaño que traiga la ficha.
+- Con un AlmacenImagenes, una imagen cuyo contenido ya está guardado con
+  otro nombre no se duplica: se usa el archivo existente.
+- Con un ManifiestoImagenes (URL de origen -> archivo, tamaño, hash, fecha)
+  una imagen cuya URL ya se descargó y cuyo archivo sigue intacto se reutiliza
+  sin ninguna petición, ni siquiera un HEAD.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urlparse
+
+TAMANO_BLOQUE = 64 * 1024
+
+# Cada cuántas descargas nuevas se guarda el manifiesto (además de al cerrar)
+GUARDAR_MANIFIESTO_CADA = 50
+
+# Ancho por defecto de las imágenes guardadas (ancho máximo de las tarjetas del sitio)
+ANCHO_IMAGEN = 300
+
+# Formatos que Wikimedia puede escalar sin cambiar de tipo
+_FORMATOS_ESCALABLES = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+
+_RE_UPLOAD_WIKIMEDIA = re.compile(
+    r'^(?:https?:)?//upload\.wikimedia\.org/(?P<proyecto>wikipedia/[^/]+)/(?P<thumb>thumb/)?'
+    r'(?P<hash>[0-9a-f]/[0-9a-f]{2})/(?P<archivo>[^/]+)(?:/(?P<miniatura>[^/]+))?$')
+
+EXTENSIONES_POR_TIPO = {
+    'jpeg': '.jpg',
+    'jpg': '.jpg',
+    'png': '.png',
+}
+
+
+def hash_archivo(ruta, algoritmo='sha1'):
+    """Hash hexadecimal del contenido de un archivo (sha1 es el que usa Commons)"""
+    h = hashlib.new(algoritmo)
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(TAMANO_BLOQUE), b''):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+def miniatura_wikimedia(url, ancho=ANCHO_IMAGEN):
+    """
+    Reescribe una URL de upload.wikimedia.org a la miniatura del ancho indicado
+
+    '.../commons/thumb/a/ab/Foo.jpg/220px-Foo.jpg' -> '.../commons/thumb/a/ab/Foo.jpg/300px-Foo.jpg'
+    '.../commons/a/ab/Foo.jpg'                     -> '.../commons/thumb/a/ab/Foo.jpg/300px-Foo.jpg'
+
+    Otras URLs (y formatos que no se pueden escalar) se devuelven sin cambios.
+    """
+    m = _RE_UPLOAD_WIKIMEDIA.match(url or '')
+    if not m or not ancho:
+        return url
+
+    archivo = m.group('archivo')
+    base = f"https://upload.wikimedia.org/{m.group('proyecto')}/thumb/{m.group('hash')}/{archivo}"
+    if m.group('thumb'):
+        if not m.group('miniatura'):
+            return url
+        miniatura, reemplazos = re.subn(r'\d+px-', f'{ancho}px-', m.group('miniatura'), count=1)
+        return f"{base}/{miniatura}" if reemplazos else url
+
+    extension = os.path.splitext(archivo)[1].lower()
+    if extension == '.svg':
+        # Las miniaturas de SVG se sirven como PNG
+        return f"{base}/{ancho}px-{archivo}.png"
+    if extension in _FORMATOS_ESCALABLES:
+        return f"{base}/{ancho}px-{archivo}"
+    return url
+
+
+def original_wikimedia(url):
+    """
+    URL del archivo original a partir de la de una miniatura. Si no es una
+    miniatura, o el original no es una imagen que el sitio pueda mostrar
+    (SVG, TIFF, PDF...), devuelve la misma URL.
+    """
+    m = _RE_UPLOAD_WIKIMEDIA.match(url or '')
+    if not m or not m.group('thumb'):
+        return url
+    if os.path.splitext(m.group('archivo'))[1].lower() not in _FORMATOS_ESCALABLES:
+        return url
+    return f"https://upload.wikimedia.org/{m.group('proyecto')}/{m.group('hash')}/{m.group('archivo')}"
+
+
+def extension_por_url(url):
+    """Extensión esperada según la URL (las miniaturas de SVG se sirven como PNG)"""
+    return '.png' if urlparse(url).path.lower().endswith('.png') else '.jpg'
+
+
+def extension_por_tipo(content_type, por_defecto='.jpg'):
+    for clave, extension in EXTENSIONES_POR_TIPO.items():
+        if clave in content_type:
+            return extension
+    return por_defecto
+
+
+class ManifiestoImagenes:
+    def __init__(self, ruta):
+        """
+        Args:
+            ruta (str): JSON con {url_origen: {'archivo', 'tamano', 'hash', 'fecha'}}
+        """
+        self.ruta = ruta
+        self._lock = threading.Lock()
+        self._sin_guardar = 0
+        self.entradas = {}
+        if os.path.exists(ruta):
+            try:
+                with open(ruta, 'r', encoding='utf-8') as f:
+                    self.entradas = json.load(f)
+            except Exception as e:
+                print(f"⚠️ Error leyendo el manifiesto de imágenes: {e}")
+
+    def obtener(self, url):
+        with self._lock:
+            return self.entradas.get(url)
+
+    def registrar(self, url, archivo, ruta_archivo):
+        """Asocia la URL de origen con el archivo local recién descargado"""
+        entrada = {
+            'archivo': archivo,
+            'tamano': os.path.getsize(ruta_archivo),
+            'hash': hash_archivo(ruta_archivo),
+            'fecha': datetime.now().isoformat(timespec='seconds'),
+        }
+        with self._lock:
+            self.entradas[url] = entrada
+            self._sin_guardar += 1
+            guardar = self._sin_guardar >= GUARDAR_MANIFIESTO_CADA
+        if guardar:
+            self.guardar()
+
+    def olvidar_archivo(self, archivo):
+        """Quita las URLs que apuntan a un archivo borrado"""
+        with self._lock:
+            for url in [u for u, e in self.entradas.items() if e['archivo'] == archivo]:
+                del self.entradas[url]
+                self._sin_guardar += 1
+
+    def guardar(self):
+        with self._lock:
+            if not self._sin_guardar:
+                return
+            contenido = json.dumps(self.entradas, ensure_ascii=False, indent=1, sort_keys=True)
+            self._sin_guardar = 0
+        temporal = f"{self.ruta}.{threading.get_ident()}.tmp"
+        try:
+            with open(temporal, 'w', encoding='utf-8') as f:
+                f.write(contenido)
+            os.replace(temporal, self.ruta)
+        except OSError as e:
+            print(f"  ⚠️ No se pudo guardar el manifiesto de imágenes: {e}")
+
+
+class DescargadorImagenes:
+    def __init__(self, session, directorio, hilos=8, conexiones_por_host=4, timeout=30,
+                 ancho=ANCHO_IMAGEN, almacen=None, manifiesto=None):
+        """
+        Args:
+            session (requests.Session): Sesión HTTP a reutilizar (con su limitador de ritmo montado)
+            directorio (str): Carpeta de destino de las imágenes
+            hilos (int): Descargas en paralelo del pool
+            conexiones_por_host (int): Máximo de descargas simultáneas contra un mismo host
+            timeout (float): Timeout de cada petición en segundos
+            ancho (int): Ancho de las miniaturas de Wikimedia a guardar (None guarda la URL tal cual)
+            almacen (AlmacenImagenes): Índice por contenido para no guardar duplicados (opcional)
+            manifiesto (ManifiestoImagenes): URL de origen -> archivo local, para no repetir descargas (opcional)
+        """
+        self.session = session
+        self.directorio = directorio
+        self.hilos = max(1, int(hilos))
+        self.conexiones_por_host = max(1, int(conexiones_por_host))
+        self.timeout = timeout
+        self.ancho = ancho
+        self.almacen = almacen
+        self.manifiesto = manifiesto
+
+        self.estadisticas = {'descargadas': 0, 'reanudadas': 0, 'sin_cambios': 0, 'omitidas': 0, 'duplicadas': 0,
+                             'fallidas': 0, 'bytes': 0}
+        self._almacen_sincronizado = False
+        self._lock_almacen = threading.Lock()
+        self._lock = threading.Lock()
+        self._semaforos = {}
+        self._locks_destino = {}
+        self._pool = None
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    def descargar(self, url_imagen, nombre_archivo, hash_esperado=None):
+        """
+        Descarga una imagen en el hilo actual
+
+        Args:
+            url_imagen (str): URL de la imagen
+            nombre_archivo (str): Nombre de destino sin extensión
+            hash_esperado (str): sha1 conocido de la imagen (opcional)
+
+        Returns:
+            str: nombre del archivo guardado (con extensión) o "" si falló
+        """
+        if not url_imagen:
+            return ""
+
+        if url_imagen.startswith('//'):
+            url_imagen = 'https:' + url_imagen
+        url_miniatura = miniatura_wikimedia(url_imagen, self.ancho)
+        # Si la miniatura falla (ej: el original es más chico que el ancho pedido)
+        # se prueba con la URL recibida y luego con el original
+        candidatas = list(dict.fromkeys([url_miniatura, url_imagen, original_wikimedia(url_miniatura)]))
+
+        # Un mismo destino nunca se escribe desde dos hilos a la vez
+        with self._lock_destino(nombre_archivo):
+            vigente = self._desde_manifiesto(url_miniatura, hash_esperado)
+            if vigente:
+                self._contar('sin_cambios')
+                return vigente
+
+            with self._semaforo(url_imagen):
+                for url in candidatas:
+                    try:
+                        nombre_completo = self._descargar(url, nombre_archivo, hash_esperado)
+                    except Exception as e:
+                        error = e
+                        continue
+                    if self.manifiesto is not None:
+                        self.manifiesto.registrar(url_miniatura, nombre_completo,
+                                                  os.path.join(self.directorio, nombre_completo))
+                    return nombre_completo
+                self._contar('fallidas')
+                print(f"  ⚠️ Error descargando imagen: {error}")
+                return ""
+
+    def enviar(self, url_imagen, nombre_archivo, hash_esperado=None):
+        """Encola la descarga en el pool y retorna un Future con el nombre del archivo"""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.hilos, thread_name_prefix='imagenes')
+        return self._pool.submit(self.descargar, url_imagen, nombre_archivo, hash_esperado)
+
+    def descargar_lote(self, trabajos):
+        """
+        Descarga muchas imágenes en paralelo
+
+        Args:
+            trabajos: iterable de tuplas (clave, url_imagen, nombre_archivo)
+
+        Returns:
+            dict: {clave: nombre del archivo guardado o ""}
+        """
+        futuros = {clave: self.enviar(url, nombre) for clave, url, nombre in trabajos}
+        return {clave: futuro.result() for clave, futuro in futuros.items()}
+
+    def cerrar(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+        if self.almacen is not None and self._almacen_sincronizado:
+            self.almacen.guardar_indice()
+        if self.manifiesto is not None:
+            self.manifiesto.guardar()
+
+    def imprimir_resumen(self):
+        e = self.estadisticas
+        if not any(e.values()):
+            return
+        print(f"🖼️  Imágenes: {e['descargadas']} descargadas ({e['reanudadas']} reanudadas), "
+              f"{e['sin_cambios']} sin cambios en el origen, {e['omitidas']} ya existentes, {e['duplicadas']} duplicadas, {e['fallidas']} con error, "
+              f"{e['bytes'] / (1024 * 1024):.1f} MB")
+
+    # ------------------------------------------------------------------
+    # Implementación
+    # ------------------------------------------------------------------
+
+    def _semaforo(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._semaforos:
+                self._semaforos[host] = threading.BoundedSemaphore(self.conexiones_por_host)
+            return self._semaforos[host]
+
+    def _lock_destino(self, nombre_archivo):
+        with self._lock:
+            return self._locks_destino.setdefault(nombre_archivo, threading.Lock())
+
+    def _contar(self, clave, cantidad=1):
+        with self._lock:
+            self.estadisticas[clave] += cantidad
+
+    def _desde_manifiesto(self, url_imagen, hash_esperado):
+        """Archivo local de una URL ya descargada, si sigue en disco sin cambios (o None)"""
+        if self.manifiesto is None:
+            return None
+        entrada = self.manifiesto.obtener(url_imagen)
+        if not entrada:
+            return None
+        ruta = os.path.join(self.directorio, entrada['archivo'])
+        if not os.path.exists(ruta) or os.path.getsize(ruta) != entrada['tamano']:
+            return None
+        if hash_esperado and entrada['hash'] != hash_esperado.lower():
+            return None
+        return entrada['archivo']
+
+    def _ya_descargada(self, ruta, url_imagen, hash_esperado):
+        """True si la imagen de destino existe y coincide en hash (si se conoce) o en tamaño"""
+        if not os.path.exists(ruta) or os.path.getsize(ruta) == 0:
+            return False
+        if hash_esperado:
+            return hash_archivo(ruta) == hash_esperado.lower()
+
+        try:
+            response = self.session.head(url_imagen, timeout=self.timeout, allow_redirects=True)
+        except Exception:
+            return False
+        if response.status_code != 200:
+            return False
+        tamano = response.headers.get('Content-Length')
+        # Sin Content-Length no hay con qué comparar: se da por buena la existente
+        return tamano is None or int(tamano) == os.path.getsize(ruta)
+
+    @staticmethod
+    def _ruta_parcial(ruta, url_imagen):
+        """.part de la descarga de url_imagen hacia ruta (uno por URL candidata)"""
+        return f"{ruta}.{hashlib.sha1(url_imagen.encode('utf-8')).hexdigest()[:12]}.part"
+
+    @classmethod
+    def _descartar_parciales(cls, ruta):
+        """Borra los .part que quedaron de las otras candidatas de un destino ya descargado"""
+        for parcial in glob.glob(glob.escape(ruta) + '.*part') + glob.glob(glob.escape(ruta) + '.*part.json'):
+            cls._descartar_parcial(parcial[:-len('.json')] if parcial.endswith('.json') else parcial)
+
+    def _origen_parcial(self, parcial, url_imagen):
+        """
+        Validador para reanudar un .part (ETag o Last-Modified), o None
+
+        Un .part de otra URL, sin validador o sin registro de origen no sirve para
+        reanudar: se borra y la descarga empieza de cero
+        """
+        if not os.path.exists(parcial):
+            return None
+        validador = None
+        try:
+            with open(parcial + '.json', 'r', encoding='utf-8') as f:
+                origen = json.load(f)
+            if origen.get('url') == url_imagen:
+                etag = origen.get('etag') or ''
+                # If-Range no admite ETags débiles: en ese caso vale la fecha
+                validador = etag if etag and not etag.startswith('W/') else origen.get('last_modified')
+        except (OSError, ValueError):
+            pass
+        if not validador:
+            self._descartar_parcial(parcial)
+        return validador
+
+    @staticmethod
+    def _registrar_origen_parcial(parcial, url_imagen, response):
+        with open(parcial + '.json', 'w', encoding='utf-8') as f:
+            json.dump({'url': url_imagen, 'etag': response.headers.get('ETag'),
+                       'last_modified': response.headers.get('Last-Modified')}, f)
+
+    @staticmethod
+    def _descartar_parcial(parcial):
+        for ruta in (parcial, parcial + '.json'):
+            try:
+                os.remove(ruta)
+            except FileNotFoundError:
+                pass
+
+    def _descargar(self, url_imagen, nombre_archivo, hash_esperado):
+        nombre_completo = nombre_archivo + extension_por_url(url_imagen)
+        for extension in ('.jpg', '.png'):
+            # Una descarga anterior pudo guardarla con la extensión del content-type
+            if os.path.exists(os.path.join(self.directorio, nombre_archivo + extension)):
+                nombre_completo = nombre_archivo + extension
+                break
+        ruta = os.path.join(self.directorio, nombre_completo)
+
+        if self._ya_descargada(ruta, url_imagen, hash_esperado):
+            self._contar('omitidas')
+            print(f"  ⏭️  Imagen ya descargada: {nombre_completo}")
+            return nombre_completo
+
+        parcial = self._ruta_parcial(ruta, url_imagen)
+        validador = self._origen_parcial(parcial, url_imagen)
+        inicio = os.path.getsize(parcial) if validador else 0
+        cabeceras = {'Range': f'bytes={inicio}-', 'If-Range': validador} if inicio else {}
+
+        response = self.session.get(url_imagen, headers=cabeceras, stream=True, timeout=self.timeout)
+        try:
+            if response.status_code == 416 and inicio:
+                # El servidor no tiene más bytes: el .part ya estaba completo
+                total = inicio
+                modo = None
+            else:
+                response.raise_for_status()
+                reanudada = response.status_code == 206
+                modo = 'ab' if reanudada else 'wb'
+                if reanudada:
+                    self._contar('reanudadas')
+                else:
+                    inicio = 0
+                total = self._tamano_total(response, inicio)
+
+                # El tipo real manda sobre la extensión deducida de la URL
+                extension = extension_por_tipo(response.headers.get('content-type', ''),
+                                               extension_por_url(url_imagen))
+                if not nombre_completo.endswith(extension):
+                    nombre_completo = nombre_archivo + extension
+                    ruta_nueva = os.path.join(self.directorio, nombre_completo)
+                    parcial_nuevo = self._ruta_parcial(ruta_nueva, url_imagen)
+                    if modo == 'ab':
+                        os.replace(parcial, parcial_nuevo)
+                    self._descartar_parcial(parcial)
+                    ruta, parcial = ruta_nueva, parcial_nuevo
+                # Antes de escribir un byte: qué URL y qué versión produce este .part
+                self._registrar_origen_parcial(parcial, url_imagen, response)
+
+            if modo:
+                with open(parcial, modo) as f:
+                    for bloque in response.iter_content(chunk_size=TAMANO_BLOQUE):
+                        f.write(bloque)
+                        self._contar('bytes', len(bloque))
+        finally:
+            response.close()
+
+        tamano = os.path.getsize(parcial)
+        if total is not None and tamano != total:
+            # Se conserva el .part para reanudar en la próxima ejecución
+            raise IOError(f"descarga incompleta ({tamano} de {total} bytes)")
+        if hash_esperado and hash_archivo(parcial) != hash_esperado.lower():
+            self._descartar_parcial(parcial)
+            raise IOError("el hash de la imagen no coincide")
+
+        os.replace(parcial, ruta)
+        self._descartar_parciales(ruta)
+        self._contar('descargadas')
+        print(f"  📥 Imagen descargada: {nombre_completo}")
+        return self._canonico(nombre_completo)
+
+    def _canonico(self, nombre_completo):
+        """Nombre del archivo que ya tenía el mismo contenido (la copia nueva se borra)"""
+        if self.almacen is None:
+            return nombre_completo
+        # Los demás hilos esperan a que el índice esté completo antes de registrar
+        with self._lock_almacen:
+            if not self._almacen_sincronizado:
+                # Primera descarga de la ejecución: indexar lo que ya hay en la carpeta
+                self.almacen.actualizar()
+                self._almacen_sincronizado = True
+        canonico = self.almacen.registrar(nombre_completo)
+        if canonico != nombre_completo:
+            self._contar('duplicadas')
+            print(f"  🟰 Misma imagen que {canonico}, se reutiliza")
+        return canonico
+
+    def _tamano_total(self, response, inicio):
+        """Tamaño final esperado según Content-Range / Content-Length (None si no se sabe)"""
+        rango = response.headers.get('Content-Range', '')
+        if '/' in rango and not rango.endswith('/*'):
+            return int(rango.rsplit('/', 1)[1])
+        longitud = response.headers.get('Content-Length')
+        # Si el cuerpo llega comprimido, Content-Length no es el tamaño en disco
+        if longitud is not None and not response.headers.get('Content-Encoding'):
+            return inicio + int(longitud)
+        return None
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Generador de variantes responsive de las imágenes de santos
+===========================================================
+Convierte cada imagen de web/images en varias anchuras, en WebP y en JPEG
+progresivo (como respaldo), sin metadatos. Las variantes quedan en
+web/images/variantes/ y un manifiesto (variantes/manifest.json) asocia cada
+nombre de la columna 'imagen' de santos.csv con sus archivos, para que la
+web pida solo el tamaño que muestra.
+
+- Usa todos los núcleos (un proceso por imagen).
+- Es incremental: solo procesa imágenes nuevas o modificadas (tamaño, fecha
+  y, si cambiaron, hash) y borra las variantes de imágenes que ya no existen.
+- Nunca agranda: los anchos mayores que el original se omiten y se usa en
+  su lugar el ancho original.
+- Las variantes llevan el nombre completo del original (pedro.jpg-300.webp),
+  así pedro.jpg y pedro.png no comparten archivos.
+
+Requiere Pillow (pip install Pillow).
+
+Uso:
+    python3 scripts/generar_variantes_imagenes.py            # incremental
+    python3 scripts/generar_variantes_imagenes.py --todo     # regenera todo
+"""
+
+import csv
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Dependencia opcional: solo la necesita este script
+    Image = None
+
+# Rutas relativas al directorio raíz del proyecto
+DIRECTORIO_BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIRECTORIO_IMAGENES = os.path.join(DIRECTORIO_BASE, "web", "images")
+ARCHIVO_CSV = os.path.join(DIRECTORIO_BASE, "data", "santos.csv")
+
+SUBDIRECTORIO_VARIANTES = "variantes"
+
+# Anchos generados (las tarjetas miden hasta 300 px; 600 cubre pantallas 2x)
+ANCHOS = (150, 300, 600)
+CALIDAD_WEBP = 80
+CALIDAD_JPEG = 82
+
+# Sube cuando cambia cómo se nombran las variantes: el manifiesto anterior se descarta
+VERSION_MANIFIESTO = 2
+
+EXTENSIONES_ORIGEN = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+
+
+def _hash_archivo(ruta):
+    h = hashlib.sha1()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(64 * 1024), b''):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+def _a_rgb(imagen):
+    """Convierte a RGB; las transparencias se apoyan sobre fondo blanco (JPEG no tiene alfa)"""
+    if imagen.mode in ('RGBA', 'LA') or (imagen.mode == 'P' and 'transparency' in imagen.info):
+        imagen = imagen.convert('RGBA')
+        fondo = Image.new('RGB', imagen.size, (255, 255, 255))
+        fondo.paste(imagen, mask=imagen.getchannel('A'))
+        return fondo
+    return imagen.convert('RGB')
+
+
+def generar_variantes(ruta_origen, directorio_salida, base, anchos=ANCHOS):
+    """
+    Genera las variantes de una imagen (se ejecuta en un proceso trabajador)
+
+    Args:
+        ruta_origen (str): Imagen original
+        directorio_salida (str): Carpeta de variantes
+        base (str): Prefijo de los archivos generados (nombre del original, con extensión)
+        anchos (tuple): Anchos deseados
+
+    Returns:
+        dict: {'ancho_original': int, 'variantes': {ancho: {'webp': nombre, 'jpg': nombre}}, 'bytes': int}
+    """
+    with Image.open(ruta_origen) as original:
+        # Respetar la orientación EXIF antes de descartar los metadatos
+        imagen = _a_rgb(ImageOps.exif_transpose(original))
+
+    ancho_original = imagen.width
+    anchos_validos = {a for a in anchos if a <= ancho_original}
+    if ancho_original < max(anchos):
+        # El ancho original también es una variante útil (ej: 250 px entre 150 y 300)
+        anchos_validos.add(ancho_original)
+    anchos_validos = sorted(anchos_validos)
+
+    variantes = {}
+    total_bytes = 0
+    for ancho in anchos_validos:
+        if ancho == ancho_original:
+            escalada = imagen
+        else:
+            alto = max(1, round(imagen.height * ancho / ancho_original))
+            escalada = imagen.resize((ancho, alto), Image.LANCZOS)
+
+        nombres = {}
+        for formato, extension, opciones in (
+                ('WEBP', 'webp', {'quality': CALIDAD_WEBP, 'method': 6}),
+                ('JPEG', 'jpg', {'quality': CALIDAD_JPEG, 'optimize': True, 'progressive': True})):
+            nombre = f"{base}-{ancho}.{extension}"
+            ruta = os.path.join(directorio_salida, nombre)
+            temporal = ruta + '.tmp'
+            # Sin exif/icc: se guardan solo los píxeles
+            escalada.save(temporal, formato, **opciones)
+            os.replace(temporal, ruta)
+            total_bytes += os.path.getsize(ruta)
+            nombres[extension] = f"{SUBDIRECTORIO_VARIANTES}/{nombre}"
+        variantes[str(ancho)] = nombres
+
+    return {'ancho_original': ancho_original, 'variantes': variantes, 'bytes': total_bytes}
+
+
+class GeneradorVariantes:
+    def __init__(self, directorio_imagenes=DIRECTORIO_IMAGENES, anchos=ANCHOS, procesos=None):
+        """
+        Args:
+            directorio_imagenes (str): Carpeta con las imágenes originales (web/images)
+            anchos (tuple): Anchos a generar
+            procesos (int): Procesos en paralelo. Default: os.cpu_count()
+        """
+        self.directorio_imagenes = directorio_imagenes
+        self.directorio_variantes = os.path.join(directorio_imagenes, SUBDIRECTORIO_VARIANTES)
+        self.archivo_manifiesto = os.path.join(self.directorio_variantes, "manifest.json")
+        self.anchos = tuple(sorted(anchos))
+        self.procesos = procesos or os.cpu_count() or 1
+
+    def _cargar_manifiesto(self):
+        if os.path.exists(self.archivo_manifiesto):
+            try:
+                with open(self.archivo_manifiesto, 'r', encoding='utf-8') as f:
+                    manifiesto = json.load(f)
+                if (manifiesto.get('anchos') == list(self.anchos)
+                        and manifiesto.get('version') == VERSION_MANIFIESTO):
+                    return manifiesto
+                print("ℹ️  Cambiaron los anchos o los nombres: se regeneran todas las variantes")
+                # Los archivos del manifiesto anterior no los va a reutilizar nadie
+                for entrada in manifiesto.get('imagenes', {}).values():
+                    self._eliminar_variantes(entrada)
+            except Exception as e:
+                print(f"⚠️ Error leyendo el manifiesto, se regenera: {e}")
+        return {'version': VERSION_MANIFIESTO, 'anchos': list(self.anchos), 'imagenes': {}}
+
+    def _guardar_manifiesto(self, manifiesto):
+        temporal = self.archivo_manifiesto + '.tmp'
+        with open(temporal, 'w', encoding='utf-8') as f:
+            json.dump(manifiesto, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(temporal, self.archivo_manifiesto)
+
+    def _variantes_presentes(self, entrada):
+        return all(os.path.exists(os.path.join(self.directorio_imagenes, ruta))
+                   for formatos in entrada.get('variantes', {}).values() for ruta in formatos.values())
+
+    def _pendientes(self, manifiesto, imagenes, todo):
+        """Imágenes nuevas o modificadas desde la última ejecución"""
+        pendientes = []
+        for imagen in imagenes:
+            ruta = os.path.join(self.directorio_imagenes, imagen)
+            estado = os.stat(ruta)
+            entrada = manifiesto['imagenes'].get(imagen)
+            if todo or not entrada or not self._variantes_presentes(entrada):
+                pendientes.append(imagen)
+                continue
+
+            origen = entrada['origen']
+            if origen['tamano'] == estado.st_size and origen['mtime'] == int(estado.st_mtime):
+                continue
+            # Cambió la fecha o el tamaño: el hash decide si cambió el contenido
+            if origen['tamano'] == estado.st_size and origen['sha1'] == _hash_archivo(ruta):
+                origen['mtime'] = int(estado.st_mtime)
+                continue
+            pendientes.append(imagen)
+        return pendientes
+
+    @staticmethod
+    def _archivos(entrada):
+        return {ruta for formatos in entrada.get('variantes', {}).values() for ruta in formatos.values()}
+
+    def _eliminar_variantes(self, entrada, manifiesto=None, conservar=()):
+        """
+        Borra los archivos de variantes de una entrada
+
+        Args:
+            entrada (dict): Entrada del manifiesto
+            manifiesto (dict): Si se indica, no se borran los archivos que otra entrada sigue usando
+            conservar (set): Archivos que tampoco se borran
+        """
+        en_uso = set(conservar)
+        if manifiesto is not None:
+            for otra in manifiesto['imagenes'].values():
+                if otra is not entrada:
+                    en_uso |= self._archivos(otra)
+        for ruta in self._archivos(entrada) - en_uso:
+            try:
+                os.remove(os.path.join(self.directorio_imagenes, ruta))
+            except OSError:
+                pass
+
+    def ejecutar(self, todo=False):
+        """
+        Genera las variantes que falten y actualiza el manifiesto
+
+        Args:
+            todo (bool): Si True, regenera todas las imágenes aunque no hayan cambiado
+
+        Returns:
+            dict: manifiesto actualizado
+        """
+        if Image is None:
+            raise RuntimeError("Falta Pillow: instalalo con 'pip install Pillow'")
+
+        print("=" * 60)
+        print("🖼️  GENERADOR DE VARIANTES DE IMÁGENES")
+        print("=" * 60)
+        os.makedirs(self.directorio_variantes, exist_ok=True)
+        manifiesto = self._cargar_manifiesto()
+
+        imagenes = sorted(nombre for nombre in os.listdir(self.directorio_imagenes)
+                          if nombre.lower().endswith(EXTENSIONES_ORIGEN)
+                          and os.path.isfile(os.path.join(self.directorio_imagenes, nombre)))
+
+        # Imágenes borradas: se quitan sus variantes
+        for imagen in [i for i in manifiesto['imagenes'] if i not in set(imagenes)]:
+            self._eliminar_variantes(manifiesto['imagenes'].pop(imagen), manifiesto)
+            print(f"  🗑️  Variantes eliminadas: {imagen}")
+
+        pendientes = self._pendientes(manifiesto, imagenes, todo)
+        print(f"📋 {len(imagenes)} imagen(es), {len(pendientes)} a procesar con {self.procesos} proceso(s)")
+
+        errores = 0
+        with ProcessPoolExecutor(max_workers=self.procesos) as executor:
+            futuros = {}
+            for imagen in pendientes:
+                ruta = os.path.join(self.directorio_imagenes, imagen)
+                futuros[executor.submit(generar_variantes, ruta, self.directorio_variantes, imagen, self.anchos)] = imagen
+
+            for i, futuro in enumerate(as_completed(futuros), 1):
+                imagen = futuros[futuro]
+                ruta = os.path.join(self.directorio_imagenes, imagen)
+                try:
+                    resultado = futuro.result()
+                except Exception as e:
+                    errores += 1
+                    print(f"  ⚠️ Error procesando {imagen}: {e}")
+                    continue
+
+                anterior = manifiesto['imagenes'].get(imagen)
+                if anterior:
+                    # Variantes de anchos que ya no se generan (ej: la imagen se achicó)
+                    self._eliminar_variantes(anterior, manifiesto, conservar=self._archivos(resultado))
+
+                estado = os.stat(ruta)
+                manifiesto['imagenes'][imagen] = {
+                    'origen': {'tamano': estado.st_size, 'mtime': int(estado.st_mtime), 'sha1': _hash_archivo(ruta)},
+                    'ancho_original': resultado['ancho_original'],
+                    'variantes': resultado['variantes'],
+                }
+                if i % 100 == 0:
+                    print(f"  ⏱️  {i}/{len(pendientes)} procesadas")
+                    self._guardar_manifiesto(manifiesto)
+
+        self._guardar_manifiesto(manifiesto)
+        self._imprimir_resumen(manifiesto, len(pendientes) - errores, errores)
+        return manifiesto
+
+    def _imprimir_resumen(self, manifiesto, procesadas, errores):
+        bytes_originales = 0
+        bytes_tarjeta = 0
+        ancho_tarjeta = str(min(self.anchos, key=lambda a: abs(a - 300)))
+        for imagen, entrada in manifiesto['imagenes'].items():
+            bytes_originales += entrada['origen']['tamano']
+            variantes = entrada['variantes']
+            # La variante que pediría una tarjeta: la de 300 px o la más grande disponible
+            clave = ancho_tarjeta if ancho_tarjeta in variantes else max(variantes, key=int)
+            ruta = os.path.join(self.directorio_imagenes, variantes[clave]['webp'])
+            if os.path.exists(ruta):
+                bytes_tarjeta += os.path.getsize(ruta)
+
+        en_csv = set()
+        if os.path.exists(ARCHIVO_CSV):
+            with open(ARCHIVO_CSV, 'r', encoding='utf-8') as f:
+                en_csv = {row['imagen'] for row in csv.DictReader(f) if row.get('imagen')}
+        sin_variantes = en_csv - set(manifiesto['imagenes'])
+
+        print("-" * 60)
+        print(f"✅ Procesadas: {procesadas} | ❌ Errores: {errores}")
+        print(f"📦 Originales: {bytes_originales / (1024 * 1024):.1f} MB → "
+              f"WebP {ancho_tarjeta}px: {bytes_tarjeta / (1024 * 1024):.1f} MB")
+        if sin_variantes:
+            print(f"⚠️  {len(sin_variantes)} imagen(es) de santos.csv sin archivo en web/images")
+        print(f"📝 Manifiesto: {self.archivo_manifiesto}")
+        print("-" * 60)
+
+
+def main():
+    todo = '--todo' in sys.argv[1:]
+    try:
+        GeneradorVariantes().ejecutar(todo=todo)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Limitador de peticiones compartido y adaptativo
+===============================================
+Reparte los turnos de petición entre todos los hilos (y todos los scrapers
+del proceso) con un token bucket por host (ejemplo: es.wikipedia.org), sin
+importar cuántas descargas haya en curso al mismo tiempo.
+
+El ritmo de cada host se ajusta solo (AIMD):
+
+- Mientras las respuestas son sanas, sube de a poco (suma fija cada tantas
+  respuestas correctas) hasta un máximo.
+- Ante 429 Too Many Requests, 503 Service Unavailable o un error "maxlag" de
+  MediaWiki se reduce a la mitad y el host queda en pausa el tiempo que
+  indique Retry-After.
+
+Se aplica como adaptador de requests (AdaptadorLimitador), debajo de la caché
+HTTP: las respuestas servidas desde la caché o el archivo no gastan turnos.
+
+Uso:
+    session = requests.Session()
+    montar_cache(session, adaptador_limitado())
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+# Ritmo inicial de un host nuevo y límites del ajuste (peticiones por segundo)
+RITMO_INICIAL = 2.0
+RITMO_MINIMO = 0.2
+RITMO_MAXIMO = 8.0
+
+# Peticiones que se pueden hacer seguidas tras un rato sin actividad
+RAFAGA = 2
+
+# Subida aditiva: +INCREMENTO_RITMO cada RESPUESTAS_PARA_SUBIR respuestas sanas seguidas
+RESPUESTAS_PARA_SUBIR = 5
+INCREMENTO_RITMO = 0.5
+
+# Bajada multiplicativa ante una señal de sobrecarga
+FACTOR_BAJADA = 0.5
+
+# Pausa cuando el servidor pide bajar el ritmo sin Retry-After, y pausa máxima aceptada
+PAUSA_POR_DEFECTO = 5.0
+PAUSA_MAXIMA = 120.0
+
+# Reintentos de una misma petición tras 429/503/maxlag
+MAX_REINTENTOS = 3
+
+
+def _segundos_retry_after(valor):
+    """'120' o una fecha HTTP -> segundos a esperar (None si no se entiende)"""
+    if not valor:
+        return None
+    valor = valor.strip()
+    if valor.isdigit():
+        return float(valor)
+    try:
+        return max(0.0, parsedate_to_datetime(valor).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def motivo_para_frenar(response):
+    """Descripción de la señal de sobrecarga de una respuesta, o None si es sana"""
+    if response.headers.get('MediaWiki-API-Error') == 'maxlag':
+        return "maxlag"
+    if response.status_code == 429:
+        return "429"
+    if response.status_code == 503:
+        return "503"
+    return None
+
+
+class LimitadorPeticiones:
+    def __init__(self, peticiones_por_segundo=RITMO_INICIAL, minimo=RITMO_MINIMO, maximo=RITMO_MAXIMO,
+                 rafaga=RAFAGA):
+        """
+        Inicializa el limitador
+
+        Args:
+            peticiones_por_segundo (float): Ritmo inicial por host.
+                                            0 o negativo desactiva el límite.
+            minimo (float): Ritmo mínimo al que puede bajar un host
+            maximo (float): Ritmo máximo al que puede subir un host
+            rafaga (int): Capacidad del token bucket
+        """
+        self.ritmo_inicial = max(0.0, peticiones_por_segundo)
+        self.minimo = min(minimo, self.ritmo_inicial) if self.ritmo_inicial else minimo
+        self.maximo = max(maximo, self.ritmo_inicial)
+        self.rafaga = max(1, rafaga)
+        self._lock = threading.Lock()
+        self._hosts = {}  # host -> {'ritmo', 'tokens', 'recarga', 'sanas', 'frenadas', 'peticiones'}
+
+    @property
+    def activo(self):
+        return self.ritmo_inicial > 0
+
+    def _estado(self, host, ahora):
+        estado = self._hosts.get(host)
+        if estado is None:
+            estado = {'ritmo': self.ritmo_inicial, 'tokens': float(self.rafaga), 'recarga': ahora,
+                      'sanas': 0, 'frenadas': 0, 'peticiones': 0}
+            self._hosts[host] = estado
+        return estado
+
+    def esperar(self, url):
+        """Bloquea el hilo actual hasta que le toque su turno para el host de la URL"""
+        if not self.activo:
+            return
+
+        host = urlparse(url).netloc
+        while True:
+            with self._lock:
+                ahora = time.monotonic()
+                estado = self._estado(host, ahora)
+                # 'recarga' puede estar en el futuro si el host está en pausa
+                if ahora > estado['recarga']:
+                    estado['tokens'] = min(self.rafaga,
+                                           estado['tokens'] + (ahora - estado['recarga']) * estado['ritmo'])
+                    estado['recarga'] = ahora
+                # Se reserva el token aunque falte: los hilos quedan en fila
+                estado['tokens'] -= 1
+                espera = (estado['recarga'] - ahora) + max(0.0, -estado['tokens']) / estado['ritmo']
+                frenadas = estado['frenadas']
+
+            if espera > 0:
+                time.sleep(espera)
+            with self._lock:
+                # Si el host pidió frenar mientras se esperaba, el turno reservado ya no vale
+                if estado['frenadas'] == frenadas:
+                    estado['peticiones'] += 1
+                    return
+
+    def registrar(self, url, response):
+        """
+        Ajusta el ritmo del host según la respuesta recibida
+
+        Returns:
+            str: motivo si el servidor pidió bajar el ritmo (la petición conviene
+                 reintentarla tras la pausa), None si la respuesta fue sana
+        """
+        if not self.activo:
+            return None
+
+        motivo = motivo_para_frenar(response)
+        host = urlparse(url).netloc
+        with self._lock:
+            ahora = time.monotonic()
+            estado = self._estado(host, ahora)
+            if motivo is None:
+                if response.status_code < 500:
+                    estado['sanas'] += 1
+                    if estado['sanas'] >= RESPUESTAS_PARA_SUBIR:
+                        estado['ritmo'] = min(self.maximo, estado['ritmo'] + INCREMENTO_RITMO)
+                        estado['sanas'] = 0
+                return None
+
+            pausa = _segundos_retry_after(response.headers.get('Retry-After'))
+            pausa = min(PAUSA_MAXIMA, PAUSA_POR_DEFECTO if pausa is None else pausa)
+            estado['ritmo'] = max(self.minimo, estado['ritmo'] * FACTOR_BAJADA)
+            estado['sanas'] = 0
+            estado['frenadas'] += 1
+            # Las reservas pendientes se rehacen (ver esperar): al terminar la pausa
+            # sale una petición y el resto al nuevo ritmo
+            estado['tokens'] = 1.0
+            estado['recarga'] = max(estado['recarga'], ahora + pausa)
+            ritmo = estado['ritmo']
+
+        print(f"  ⏳ {host} pidió bajar el ritmo ({motivo}): pausa de {pausa:.0f} s, "
+              f"ahora {ritmo:.1f} peticiones/s")
+        return motivo
+
+    def describir(self):
+        """Describe el ritmo para mostrarlo por pantalla"""
+        if not self.activo:
+            return "sin límite"
+        return (f"adaptativo por host, desde {self.ritmo_inicial:.1f} peticiones/s "
+                f"(entre {self.minimo:.1f} y {self.maximo:.1f})")
+
+    def imprimir_resumen(self):
+        with self._lock:
+            hosts = {host: dict(estado) for host, estado in self._hosts.items()}
+        if not hosts:
+            return
+        print("-" * 60)
+        print("🚦 RITMO POR HOST (peticiones / ritmo final / veces que pidió frenar)")
+        for host, estado in sorted(hosts.items()):
+            print(f"  {host:<30} {estado['peticiones']:>5} / {estado['ritmo']:>4.1f}/s / {estado['frenadas']:>3}")
+        print("-" * 60)
+
+
+class AdaptadorLimitador(BaseAdapter):
+    def __init__(self, interno, limitador, reintentos=MAX_REINTENTOS):
+        """
+        Args:
+            interno (BaseAdapter): Adaptador que hace la petición real (ej: HTTPAdapter)
+            limitador (LimitadorPeticiones): Limitador a respetar
+            reintentos (int): Reintentos tras 429/503/maxlag (después de la pausa pedida)
+        """
+        super().__init__()
+        self.interno = interno
+        self.limitador = limitador
+        self.reintentos = reintentos
+
+    def send(self, request, stream=False, **kwargs):
+        for intento in range(self.reintentos + 1):
+            self.limitador.esperar(request.url)
+            response = self.interno.send(request, stream=stream, **kwargs)
+            if self.limitador.registrar(request.url, response) is None or intento == self.reintentos:
+                return response
+            # El reintento espera en limitador.esperar() hasta que termine la pausa
+            response.close()
+        return response
+
+    def close(self):
+        self.interno.close()
+
+
+_limitador_compartido = None
+_lock_limitador_compartido = threading.Lock()
+
+
+def limitador_compartido():
+    """Limitador único del proceso, compartido por todos los scrapers"""
+    global _limitador_compartido
+    with _lock_limitador_compartido:
+        if _limitador_compartido is None:
+            _limitador_compartido = LimitadorPeticiones()
+        return _limitador_compartido
+
+
+def adaptador_limitado(adaptador=None, limitador=None):
+    """
+    Adaptador de transporte que respeta el limitador (para montar debajo de la caché)
+
+    Args:
+        adaptador (BaseAdapter): Adaptador interno (default: HTTPAdapter())
+        limitador (LimitadorPeticiones): Limitador a usar (default: el compartido)
+
+    Returns:
+        AdaptadorLimitador
+    """
+    return AdaptadorLimitador(adaptador or HTTPAdapter(), limitador or limitador_compartido())
@@ -6,14 +6,25 @@ Script para migrar santos.csv agregando la columna 'etiquetas'
 ================================================================
 Este script lee el CSV existente, agrega la columna 'etiquetas' vacía
 y reescribe el archivo con el nuevo formato.
+
+Con --sqlite también deja data/santos.db (ver base_santos.py) con las mismas filas.
 """
 
 import csv
 import os
 import sys
 
-def migrar_csv():
-    """Migra el CSV existente agregando la columna etiquetas"""
+from base_santos import BaseSantos
+from santo import escribir_csv, leer_csv
+from sumidero_csv import CAMPOS
+
+def migrar_csv(sqlite=False):
+    """
+    Migra el CSV existente agregando la columna etiquetas
+    
+    Args:
+        sqlite (bool): Si True, también actualiza data/santos.db
+    """
     # Rutas relativas al directorio raíz del proyecto
     directorio_base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     archivo_csv = os.path.join(directorio_base, "data", "santos.csv")
@@ -31,31 +42,27 @@ def migrar_csv():
     
     # Leer datos existentes
     print(f"📖 Leyendo {archivo_csv}...")
-    santos = []
     with open(archivo_csv, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        campos_originales = reader.fieldnames
+        campos_originales = csv.DictReader(f).fieldnames
         print(f"  Campos originales: {campos_originales}")
-        
-        for row in reader:
-            # Agregar campo etiquetas vacío si no existe
-            if 'etiquetas' not in row:
-                row['etiquetas'] = ''
-            santos.append(row)
+    
+    # Cada fila como Santo: el campo etiquetas queda vacío si no existía
+    santos = leer_csv(archivo_csv)
     
     print(f"✅ Leídos {len(santos)} santos")
     
     # Escribir con nuevo formato
     print(f"📝 Reescribiendo {archivo_csv} con columna 'etiquetas'...")
-    campos_nuevos = ['mes', 'dia', 'nombre', 'prioridad', 'descripcion', 'imagen', 'url_wikipedia', 'etiquetas', 'oracion']
+    escribir_csv(archivo_csv, santos)
     
-    with open(archivo_csv, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=campos_nuevos, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(santos)
+    if sqlite:
+        base = BaseSantos()
+        base.importar_csv(archivo_csv)
+        base.cerrar()
+        print(f"🗄️  Base {base.ruta} actualizada")
     
     print(f"✅ Migración completada!")
-    print(f"  Campos nuevos: {campos_nuevos}")
+    print(f"  Campos nuevos: {CAMPOS}")
     print(f"  Total santos: {len(santos)}")
     print(f"\n💡 Ahora puedes ejecutar el scraper para llenar las etiquetas")
     
@@ -63,7 +70,7 @@ def migrar_csv():
 
 if __name__ == "__main__":
     try:
-        exito = migrar_csv()
+        exito = migrar_csv(sqlite='--sqlite' in sys.argv[1:])
         sys.exit(0 if exito else 1)
     except Exception as e:
         print(f"❌ Error durante la migración: {e}")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parseo de HTML acotado
+======================
+Capa fina sobre BeautifulSoup para las páginas de Wikipedia:
+
+- Usa lxml si está instalado (pip install lxml), que es varias veces más
+  rápido que html.parser; si no, cae a html.parser sin cambiar el resultado.
+- Con un SoupStrainer arma solo el subárbol que interesa (el contenido del
+  artículo, las tablas de un anexo) y descarta cabecera, menús, scripts y pie.
+- documento() es un context manager que libera el árbol con decompose() al
+  salir, así en corridas de todo el año no se acumulan árboles enteros
+  esperando al recolector de basura.
+
+Uso:
+    with documento(response.content, CONTENIDO_ARTICULO) as soup:
+        infobox = soup.find('table', class_='infobox')
+"""
+
+import re
+from contextlib import contextmanager
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
+
+
+def _con_clase(clase):
+    """Patrón para class_ en un SoupStrainer: al filtrar, el atributo class llega sin
+    separar ('mw-content-ltr mw-parser-output') y un texto simple no coincidiría"""
+    return re.compile(rf'(?:^|\s){re.escape(clase)}(?:\s|$)')
+
+
+# Cuerpo del artículo (párrafos, infobox, secciones); deja afuera menús y pie
+CONTENIDO_ARTICULO = SoupStrainer('div', class_=_con_clase('mw-parser-output'))
+
+# Tablas de datos de los anexos ('wikitable sortable', etc.)
+TABLAS_WIKI = SoupStrainer('table', class_=_con_clase('wikitable'))
+
+
+def parsear(html, solo=None):
+    """
+    Parsea HTML con el parser más rápido disponible
+
+    Args:
+        html (bytes | str): Documento
+        solo (SoupStrainer): Parte del documento a construir (default: todo)
+
+    Returns:
+        BeautifulSoup
+    """
+    return BeautifulSoup(html, PARSER, parse_only=solo)
+
+
+@contextmanager
+def documento(html, solo=None):
+    """Como parsear(), pero libera el árbol (decompose) al salir del bloque"""
+    soup = parsear(html, solo)
+    try:
+        yield soup
+    finally:
+        soup.decompose()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pipeline por etapas para el scraper de santos
+=============================================
+Divide el trabajo de SantosWikipediaScraper en etapas conectadas por colas
+acotadas, cada una con su propia cantidad de trabajadores:
+
+    santoral   -> lista los santos de cada día (es.wikipedia.org)
+    articulos  -> descripción y URL de imagen de cada santo (es.wikipedia.org)
+    imagenes   -> descarga de imágenes (upload.wikimedia.org)
+    escritura  -> arma las filas y las agrupa por día
+
+Así una imagen lenta no frena al siguiente santo ni al siguiente día.
+Durante la ejecución se muestra la profundidad de cada cola y el ritmo de
+cada etapa.
+"""
+
+import queue
+import threading
+import time
+
+# Marca de fin de trabajo que recorre las colas
+FIN = object()
+
+TRABAJADORES_POR_DEFECTO = {
+    'santoral': 2,
+    'articulos': 4,
+    'imagenes': 4,
+}
+
+
+class Etapa:
+    def __init__(self, nombre, funcion, trabajadores, entrada, salida=None, al_fallar=None):
+        """
+        Args:
+            nombre (str): Nombre de la etapa (para el reporte)
+            funcion (callable): Recibe un elemento y retorna una lista de elementos de salida
+            trabajadores (int): Cantidad de hilos de la etapa
+            entrada (queue.Queue): Cola de la que consume
+            salida (queue.Queue): Cola a la que produce (None en la última etapa)
+            al_fallar (callable): Recibe el elemento cuando funcion lanza una excepción
+                                  (el elemento no sigue a la próxima etapa)
+        """
+        self.nombre = nombre
+        self.funcion = funcion
+        self.al_fallar = al_fallar
+        self.trabajadores = max(1, int(trabajadores))
+        self.entrada = entrada
+        self.salida = salida
+        self.procesados = 0
+        self.segundos_ocupado = 0.0
+        self.inicio = None
+        self._lock = threading.Lock()
+        self._hilos = []
+
+    def iniciar(self):
+        self.inicio = time.monotonic()
+        for i in range(self.trabajadores):
+            hilo = threading.Thread(target=self._bucle, name=f"{self.nombre}-{i}", daemon=True)
+            hilo.start()
+            self._hilos.append(hilo)
+
+    def finalizar(self):
+        """Envía una marca de fin por trabajador y espera a que terminen"""
+        for _ in self._hilos:
+            self.entrada.put(FIN)
+        for hilo in self._hilos:
+            hilo.join()
+
+    def _bucle(self):
+        while True:
+            elemento = self.entrada.get()
+            if elemento is FIN:
+                break
+
+            t0 = time.monotonic()
+            try:
+                salidas = self.funcion(elemento)
+            except Exception as e:
+                print(f"  ⚠️ Error en etapa {self.nombre}: {e}")
+                if self.al_fallar is not None:
+                    self.al_fallar(elemento)
+                salidas = []
+            with self._lock:
+                self.procesados += 1
+                self.segundos_ocupado += time.monotonic() - t0
+
+            if self.salida is not None:
+                for salida in salidas:
+                    self.salida.put(salida)
+
+    def ritmo(self):
+        """Elementos procesados por segundo desde el inicio de la etapa"""
+        if not self.inicio:
+            return 0.0
+        transcurrido = time.monotonic() - self.inicio
+        return self.procesados / transcurrido if transcurrido > 0 else 0.0
+
+
+class PipelineSantos:
+    def __init__(self, scraper, trabajadores=None, capacidad_colas=100, intervalo_reporte=10):
+        """
+        Args:
+            scraper (SantosWikipediaScraper): Scraper que aporta los pasos de cada etapa
+            trabajadores (dict): Hilos por etapa ('santoral', 'articulos', 'imagenes')
+            capacidad_colas (int): Tamaño máximo de cada cola entre etapas
+            intervalo_reporte (float): Segundos entre reportes de colas (0 desactiva)
+        """
+        self.scraper = scraper
+        self.trabajadores = dict(TRABAJADORES_POR_DEFECTO)
+        if trabajadores:
+            self.trabajadores.update(trabajadores)
+        self.capacidad_colas = capacidad_colas
+        self.intervalo_reporte = intervalo_reporte
+        self.resultados_por_dia = {}
+        self._pendientes_por_dia = {}
+
+    # ------------------------------------------------------------------
+    # Funciones de cada etapa
+    # ------------------------------------------------------------------
+
+    def _etapa_santoral(self, fecha):
+        mes, dia = fecha
+        try:
+            santos_info = self.scraper.extraer_santoral_del_dia(mes, dia)
+        except Exception as e:
+            print(f"  ⚠️ Error listando santos del {dia:02d}/{mes:02d}: {e}")
+            # El día no se da por terminado: se reintenta al retomar o en la próxima ejecución
+            self.scraper._dias_con_error.add((mes, dia))
+            santos_info = []
+
+        if not santos_info:
+            # Día vacío: se avisa directamente a la escritura para que lo cierre
+            return [{'mes': mes, 'dia': dia, 'indice': None, 'total': 0, 'trabajo': None}]
+
+        # En modo 'api' la información de todo el día se resuelve en una sola consulta
+        self.scraper._precargar_info_santos(santos_info)
+
+        elementos = []
+        for indice, santo_info in enumerate(santos_info):
+            try:
+                trabajo = self.scraper._preparar_santo(mes, dia, santo_info)
+            except Exception as e:
+                print(f"  ⚠️ Error preparando {santo_info.get('nombre')}: {e}")
+                trabajo = None
+            elementos.append({
+                'mes': mes,
+                'dia': dia,
+                'indice': indice,
+                'total': len(santos_info),
+                'trabajo': trabajo
+            })
+        return elementos
+
+    def _etapa_articulos(self, elemento):
+        if elemento['trabajo'] is not None:
+            try:
+                self.scraper._enriquecer_santo(elemento['trabajo'])
+            except Exception as e:
+                print(f"  ⚠️ Error enriqueciendo {elemento['trabajo']['nombre']}: {e}")
+        return [elemento]
+
+    def _etapa_imagenes(self, elemento):
+        if elemento['trabajo'] is not None:
+            try:
+                self.scraper._descargar_imagen_santo(elemento['trabajo'])
+            except Exception as e:
+                print(f"  ⚠️ Error descargando imagen de {elemento['trabajo']['nombre']}: {e}")
+        return [elemento]
+
+    def _etapa_escritura(self, elemento):
+        clave_dia = (elemento['mes'], elemento['dia'])
+        pendientes = self._pendientes_por_dia.setdefault(clave_dia, {'total': elemento['total'], 'filas': []})
+
+        if elemento['trabajo'] is not None:
+            try:
+                resultado = self.scraper._completar_santo(elemento['trabajo'])
+                pendientes['filas'].append((elemento['indice'], resultado))
+            except Exception as e:
+                print(f"  ⚠️ Error completando {elemento['trabajo']['nombre']}: {e}")
+
+        pendientes['total'] -= 1
+        if pendientes['total'] <= 0:
+            # Día completo: se ordenan los santos como aparecen en Wikipedia
+            del self._pendientes_por_dia[clave_dia]
+            filas = [fila for _, fila in sorted(pendientes['filas'], key=lambda x: x[0])]
+            self.resultados_por_dia[clave_dia] = filas
+            self._dia_completado(clave_dia, filas)
+        return []
+
+    def _elemento_fallido(self, elemento):
+        """
+        Una etapa no pudo procesar el elemento: su día queda con error, así no se asienta
+        en el diario de progreso y se reintenta al retomar o en la próxima ejecución
+        """
+        if isinstance(elemento, tuple):
+            mes, dia = elemento
+        else:
+            mes, dia = elemento['mes'], elemento['dia']
+        self.scraper._dias_con_error.add((mes, dia))
+
+    def _dia_completado(self, clave_dia, filas):
+        mes, dia = clave_dia
+        print(f"  📦 Día {dia:02d}/{mes:02d} completo ({len(filas)} santos nuevos)")
+        # Queda asentado en el diario de progreso antes de seguir con el próximo
+        self.scraper._dia_terminado(mes, dia, filas)
+
+    # ------------------------------------------------------------------
+    # Ejecución
+    # ------------------------------------------------------------------
+
+    def ejecutar(self, dias):
+        """
+        Procesa la lista de días (tuplas (mes, dia)) y retorna las filas en orden de día
+        """
+        cola_dias = queue.Queue(maxsize=self.capacidad_colas)
+        cola_articulos = queue.Queue(maxsize=self.capacidad_colas)
+        cola_imagenes = queue.Queue(maxsize=self.capacidad_colas)
+        cola_escritura = queue.Queue(maxsize=self.capacidad_colas)
+
+        self.etapas = [
+            Etapa('santoral', self._etapa_santoral, self.trabajadores['santoral'], cola_dias, cola_articulos,
+                  al_fallar=self._elemento_fallido),
+            Etapa('articulos', self._etapa_articulos, self.trabajadores['articulos'], cola_articulos, cola_imagenes,
+                  al_fallar=self._elemento_fallido),
+            Etapa('imagenes', self._etapa_imagenes, self.trabajadores['imagenes'], cola_imagenes, cola_escritura,
+                  al_fallar=self._elemento_fallido),
+            # Una sola escritora: agrupa por día sin necesidad de locks
+            Etapa('escritura', self._etapa_escritura, 1, cola_escritura, al_fallar=self._elemento_fallido),
+        ]
+
+        print("🏭 Pipeline: " + " → ".join(f"{e.nombre}({e.trabajadores})" for e in self.etapas))
+
+        for etapa in self.etapas:
+            etapa.iniciar()
+
+        detener_reporte = threading.Event()
+        reporte = None
+        if self.intervalo_reporte:
+            reporte = threading.Thread(target=self._bucle_reporte, args=(detener_reporte,), daemon=True)
+            reporte.start()
+
+        try:
+            for fecha in dias:
+                cola_dias.put(fecha)
+
+            # Cada etapa termina cuando la anterior ya entregó todo su trabajo
+            for etapa in self.etapas:
+                etapa.finalizar()
+        finally:
+            detener_reporte.set()
+            if reporte is not None:
+                reporte.join()
+
+        self.imprimir_resumen()
+
+        todos = []
+        for fecha in dias:
+            todos.extend(self.resultados_por_dia.get(fecha, []))
+        return todos
+
+    def estado_colas(self):
+        """Profundidad actual de la cola de entrada de cada etapa"""
+        return {etapa.nombre: etapa.entrada.qsize() for etapa in self.etapas}
+
+    def _bucle_reporte(self, detener):
+        while not detener.wait(self.intervalo_reporte):
+            colas = " | ".join(f"{nombre}: {tam}" for nombre, tam in self.estado_colas().items())
+            ritmos = " | ".join(f"{e.nombre}: {e.ritmo():.2f}/s" for e in self.etapas)
+            print(f"📊 Colas → {colas}")
+            print(f"⏱️  Ritmo → {ritmos}")
+
+    def imprimir_resumen(self):
+        print("-" * 60)
+        print("📊 RESUMEN DEL PIPELINE")
+        for etapa in self.etapas:
+            ocupacion = etapa.segundos_ocupado / etapa.procesados if etapa.procesados else 0.0
+            print(f"  {etapa.nombre:<10} {etapa.procesados:>6} elementos | "
+                  f"{etapa.ritmo():6.2f}/s | {ocupacion:5.2f}s por elemento | {etapa.trabajadores} hilo(s)")
+        print("-" * 60)
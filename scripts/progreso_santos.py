@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Diario de progreso de las ejecuciones de santos
+===============================================
+Archivo JSONL de solo agregado (data/santos_progreso.jsonl) donde
+SantosWikipediaScraper.ejecutar() deja constancia de cada día terminado
+apenas sus filas quedan escritas en santos.csv (ver sumidero_csv.py), junto
+con la posición del CSV hasta la que llegan:
+
+    {"tipo": "inicio", "fecha": "...", "rango": [1, 1, 12, 31], "incremental": false,
+     "dias": [[1, 1], [1, 2], ...], "refrescar": [{fila del CSV}, ...],
+     "csv": {"bytes": n, "filas": n, "inodo": n}}
+    {"tipo": "eliminar", "claves": ["1-1-San ..."], "filas": n}
+    {"tipo": "dia", "mes": 1, "dia": 1, "filas": [{fila del CSV}, ...], "csv": {"bytes": n, "filas": n}}
+    {"tipo": "refresco", "filas": [...], "csv": {...}}
+    {"tipo": "compactado", "csv": {"inodo": n, "bytes": n, "sha256": "..."}}
+
+Cada línea se escribe con flush + fsync, así que un corte (Ctrl-C, caída,
+corte de luz) pierde a lo sumo el día en curso. Si la ejecución termina bien
+el diario se borra; si no, la próxima ejecución con el mismo rango lo lee,
+recorta el CSV hasta el último día asentado, vuelve a aplicar las
+eliminaciones pendientes, retoma desde el primer día sin terminar y no
+vuelve a pedir nada de los días ya hechos. Una última línea cortada a medio
+escribir se descarta.
+
+Si santos.csv cambió por fuera desde entonces (ej. dedupe_santos.py) el
+diario ya no sirve y se descarta: el CSV tiene que seguir teniendo las filas
+asentadas, o ser exactamente el que dejó la compactación final (línea
+"compactado") si la ejecución se cortó después de ella.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+
+ARCHIVO_PROGRESO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "data", "santos_progreso.jsonl")
+
+
+class DiarioProgreso:
+    def __init__(self, ruta=ARCHIVO_PROGRESO):
+        """
+        Args:
+            ruta (str): Archivo JSONL del diario
+        """
+        self.ruta = ruta
+        self._archivo = None
+        self._lock = threading.Lock()
+        # Bytes válidos (hasta la última línea completa) según la última lectura
+        self._largo_valido = 0
+
+    def leer(self):
+        """
+        Lee el diario de una ejecución que no terminó
+
+        Returns:
+            dict: {'inicio': línea de inicio, 'dias': {(mes, dia): filas}, 'refresco': filas o None,
+                   'eliminaciones': [(claves, filas)], 'csv': última posición asentada del CSV,
+                   'compactado': huella del CSV compactado o None}
+                  o None si no hay diario (o no tiene una línea de inicio legible)
+        """
+        if not os.path.exists(self.ruta):
+            return None
+
+        pendiente = None
+        self._largo_valido = 0
+        try:
+            with open(self.ruta, 'rb') as f:
+                for linea in f:
+                    if not linea.endswith(b'\n'):
+                        break
+                    try:
+                        registro = json.loads(linea)
+                    except ValueError:
+                        break
+                    self._largo_valido += len(linea)
+
+                    if registro['tipo'] == 'inicio':
+                        pendiente = {'inicio': registro, 'dias': {}, 'refresco': None,
+                                     'eliminaciones': [], 'csv': registro['csv'], 'compactado': None}
+                    elif pendiente is None:
+                        break
+                    elif registro['tipo'] == 'eliminar':
+                        pendiente['eliminaciones'].append((registro['claves'], registro['filas']))
+                    elif registro['tipo'] == 'dia':
+                        pendiente['dias'][(registro['mes'], registro['dia'])] = registro['filas']
+                        pendiente['csv'] = registro['csv']
+                    elif registro['tipo'] == 'refresco':
+                        pendiente['refresco'] = registro['filas']
+                        pendiente['csv'] = registro['csv']
+                    elif registro['tipo'] == 'compactado':
+                        pendiente['compactado'] = registro['csv']
+        except Exception as e:
+            print(f"⚠️ Error leyendo el diario de progreso: {e}")
+            return None
+        return pendiente
+
+    def iniciar(self, rango, incremental, dias, refrescar, csv):
+        """
+        Empieza un diario nuevo (reemplaza al anterior)
+
+        Args:
+            rango (list): [mes_inicio, dia_inicio, mes_fin, dia_fin] pedidos
+            incremental (bool): Si la ejecución es incremental
+            dias (list): Días (mes, dia) a procesar, ya planificados
+            refrescar (list): Filas del CSV cuyo artículo se vuelve a procesar
+            csv (dict): Posición inicial del CSV ({'bytes', 'filas'}) e 'inodo' del archivo
+        """
+        self.cerrar(borrar=False)
+        self._archivo = open(self.ruta, 'wb')
+        self._escribir({
+            'tipo': 'inicio',
+            'fecha': datetime.now().isoformat(timespec='seconds'),
+            'rango': list(rango),
+            'incremental': incremental,
+            'dias': [list(fecha) for fecha in dias],
+            'refrescar': refrescar,
+            'csv': csv,
+        })
+
+    def reanudar(self):
+        """Sigue agregando al diario leído con leer(), descartando una línea final cortada"""
+        self.cerrar(borrar=False)
+        self._archivo = open(self.ruta, 'r+b')
+        self._archivo.truncate(self._largo_valido)
+        self._archivo.seek(self._largo_valido)
+
+    def registrar_eliminacion(self, claves, filas):
+        self._escribir({'tipo': 'eliminar', 'claves': list(claves), 'filas': filas})
+
+    def registrar_dia(self, mes, dia, filas, csv):
+        self._escribir({'tipo': 'dia', 'mes': mes, 'dia': dia, 'filas': filas, 'csv': csv})
+
+    def registrar_refresco(self, filas, csv):
+        self._escribir({'tipo': 'refresco', 'filas': filas, 'csv': csv})
+
+    def registrar_compactado(self, huella):
+        self._escribir({'tipo': 'compactado', 'csv': huella})
+
+    def _escribir(self, registro):
+        """Agrega una línea y la lleva a disco antes de volver"""
+        linea = (json.dumps(registro, ensure_ascii=False) + '\n').encode('utf-8')
+        with self._lock:
+            if self._archivo is None:
+                return
+            self._archivo.write(linea)
+            self._archivo.flush()
+            os.fsync(self._archivo.fileno())
+
+    def cerrar(self, borrar=True):
+        """
+        Cierra el diario
+
+        Args:
+            borrar (bool): Si True (ejecución terminada), borra el archivo
+        """
+        with self._lock:
+            if self._archivo is not None:
+                self._archivo.close()
+                self._archivo = None
+        if borrar and os.path.exists(self.ruta):
+            os.remove(self.ruta)
+
+
+def describir_pendiente(ruta=ARCHIVO_PROGRESO):
+    """
+    Texto que describe la ejecución interrumpida del diario, o None si no hay
+
+    Returns:
+        str: ej. "Ejecución del 2026-10-16T10:00:00 interrumpida: 120 de 366 días listos, sigue desde el 30/04"
+    """
+    pendiente = DiarioProgreso(ruta).leer()
+    if pendiente is None:
+        return None
+    dias = [tuple(fecha) for fecha in pendiente['inicio']['dias']]
+    faltantes = [fecha for fecha in dias if fecha not in pendiente['dias']]
+    texto = (f"Ejecución del {pendiente['inicio']['fecha']} interrumpida: "
+             f"{len(dias) - len(faltantes)} de {len(dias)} días listos")
+    if faltantes:
+        mes, dia = faltantes[0]
+        texto += f", sigue desde el {dia:02d}/{mes:02d}"
+    return texto
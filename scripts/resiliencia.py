@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Capa de resiliencia para las peticiones HTTP
+============================================
+Adaptador para requests.Session que envuelve al limitador de ritmo y agrega:
+
+- Reintentos acotados con backoff exponencial y jitter para fallos
+  transitorios (conexión caída, timeout, 500/502/504). Solo GET y HEAD.
+- Cortacircuitos por host: tras varios fallos seguidos deja de pedirle al
+  host durante un rato y falla al instante (CircuitoAbierto); pasado ese
+  tiempo deja pasar una petición de prueba. Cuentan como fallo los errores
+  de red, los 500/502/504 y los 429/503 que siguen después de los
+  reintentos del limitador.
+- Un 500 de una miniatura de upload.wikimedia.org (la respuesta cuando se
+  pide más ancha que el original) no se reintenta ni cuenta como fallo del
+  host: el descargador de imágenes pasa directo al original.
+- Caché negativa persistente (data/cache_negativa.json): las URLs que dieron
+  404/410 se responden como 404 sin tocar la red hasta que vence su plazo,
+  así las fechas sin evangelio o las miniaturas inexistentes no se vuelven a
+  pedir en cada ejecución. Se guarda cada tantas URLs nuevas y al terminar
+  el proceso, no en cada 404.
+
+Uso:
+    montar_cache(session, adaptador_resiliente(adaptador_limitado()))
+"""
+
+import atexit
+import json
+import os
+import random
+import re
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+ARCHIVO_CACHE_NEGATIVA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                      "data", "cache_negativa.json")
+
+# Reintentos y backoff (segundos): espera aleatoria entre 0 y min(BACKOFF_MAXIMO, BACKOFF_BASE * 2^intento)
+MAX_REINTENTOS = 3
+BACKOFF_BASE = 1.0
+BACKOFF_MAXIMO = 30.0
+
+# Respuestas que se consideran fallos transitorios (429/503 los maneja el limitador)
+ESTADOS_TRANSITORIOS = {500, 502, 504}
+
+# Sobrecarga: el limitador ya pausó y reintentó; si llegan hasta acá, el host sigue
+# sin atender y cuentan como fallo (sin más reintentos)
+ESTADOS_SOBRECARGA = {429, 503}
+
+# Respuestas que se recuerdan en la caché negativa
+ESTADOS_NEGATIVOS = {404, 410}
+
+# Fallos seguidos que abren el circuito de un host, y segundos que queda abierto
+FALLOS_PARA_CORTAR = 5
+ENFRIAMIENTO_CIRCUITO = 60.0
+
+# Horas que una URL inexistente se da por inexistente
+TTL_NEGATIVO_HORAS = 7 * 24
+
+# Cada cuántas URLs nuevas se guarda la caché negativa (además de al terminar)
+GUARDAR_NEGATIVA_CADA = 50
+
+_METODOS_IDEMPOTENTES = {'GET', 'HEAD'}
+
+_RE_MINIATURA_WIKIMEDIA = re.compile(r'^https?://upload\.wikimedia\.org/[^?]*/thumb/')
+
+
+class CircuitoAbierto(requests.exceptions.ConnectionError):
+    """El host falló demasiadas veces seguidas: se evita pedirle por un rato"""
+
+
+class CortaCircuitos:
+    def __init__(self, fallos_para_cortar=FALLOS_PARA_CORTAR, enfriamiento=ENFRIAMIENTO_CIRCUITO):
+        """
+        Args:
+            fallos_para_cortar (int): Fallos seguidos que abren el circuito de un host
+            enfriamiento (float): Segundos que el circuito queda abierto antes de probar de nuevo
+        """
+        self.fallos_para_cortar = fallos_para_cortar
+        self.enfriamiento = enfriamiento
+        self._lock = threading.Lock()
+        self._hosts = {}  # host -> {'fallos': n, 'abierto_hasta': t, 'probando': bool, 'cortes': n}
+
+    def _estado(self, host):
+        return self._hosts.setdefault(host, {'fallos': 0, 'abierto_hasta': 0.0, 'probando': False, 'cortes': 0})
+
+    def permitir(self, url):
+        """Lanza CircuitoAbierto si el host está cortado; deja pasar una sola prueba al vencer el enfriamiento"""
+        host = urlparse(url).netloc
+        with self._lock:
+            estado = self._estado(host)
+            if estado['fallos'] < self.fallos_para_cortar:
+                return
+            restante = estado['abierto_hasta'] - time.monotonic()
+            if restante <= 0 and not estado['probando']:
+                estado['probando'] = True
+                return
+        raise CircuitoAbierto(f"Circuito abierto para {host} tras {self.fallos_para_cortar} fallos seguidos "
+                              f"(se reintenta en {max(0.0, restante):.0f} s)")
+
+    def exito(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            estado = self._estado(host)
+            if estado['fallos'] >= self.fallos_para_cortar:
+                print(f"  🔌 {host} responde de nuevo: circuito cerrado")
+            estado['fallos'] = 0
+            estado['probando'] = False
+
+    def fallo(self, url):
+        """Cuenta un fallo del host; devuelve True si su circuito quedó abierto"""
+        host = urlparse(url).netloc
+        with self._lock:
+            estado = self._estado(host)
+            estado['fallos'] += 1
+            estado['probando'] = False
+            if estado['fallos'] >= self.fallos_para_cortar:
+                if estado['fallos'] == self.fallos_para_cortar:
+                    estado['cortes'] += 1
+                    print(f"  🔌 {host} falló {estado['fallos']} veces seguidas: "
+                          f"circuito abierto por {self.enfriamiento:.0f} s")
+                estado['abierto_hasta'] = time.monotonic() + self.enfriamiento
+                return True
+        return False
+
+    def cortes(self):
+        with self._lock:
+            return {host: estado['cortes'] for host, estado in self._hosts.items() if estado['cortes']}
+
+
+class CacheNegativa:
+    def __init__(self, ruta=ARCHIVO_CACHE_NEGATIVA, ttl_horas=TTL_NEGATIVO_HORAS):
+        """
+        Args:
+            ruta (str): JSON con {url: {'status': 404, 'fecha': epoch}}
+            ttl_horas (float): Horas que se recuerda cada URL inexistente
+        """
+        self.ruta = ruta
+        self.ttl = ttl_horas * 3600
+        self._lock = threading.Lock()
+        self._sin_guardar = 0
+        self.entradas = {}
+        if os.path.exists(ruta):
+            try:
+                with open(ruta, 'r', encoding='utf-8') as f:
+                    self.entradas = json.load(f)
+            except Exception as e:
+                print(f"⚠️ Error leyendo la caché negativa: {e}")
+
+    def obtener(self, url):
+        """Status recordado para la URL (404/410) o None si no está o ya venció"""
+        with self._lock:
+            entrada = self.entradas.get(url)
+            if entrada and time.time() - entrada['fecha'] < self.ttl:
+                return entrada['status']
+        return None
+
+    def registrar(self, url, status):
+        with self._lock:
+            self.entradas[url] = {'status': status, 'fecha': time.time()}
+            self._sin_guardar += 1
+            guardar = self._sin_guardar >= GUARDAR_NEGATIVA_CADA
+        if guardar:
+            self.guardar()
+
+    def olvidar(self, url):
+        with self._lock:
+            if self.entradas.pop(url, None) is not None:
+                self._sin_guardar += 1
+
+    def guardar(self):
+        """Escritura atómica de los cambios pendientes, descartando lo vencido"""
+        with self._lock:
+            if not self._sin_guardar:
+                return
+            ahora = time.time()
+            self.entradas = {u: e for u, e in self.entradas.items() if ahora - e['fecha'] < self.ttl}
+            contenido = json.dumps(self.entradas, ensure_ascii=False)
+            self._sin_guardar = 0
+        temporal = f"{self.ruta}.{threading.get_ident()}.tmp"
+        try:
+            with open(temporal, 'w', encoding='utf-8') as f:
+                f.write(contenido)
+            os.replace(temporal, self.ruta)
+        except OSError as e:
+            print(f"  ⚠️ No se pudo guardar la caché negativa: {e}")
+
+
+class AdaptadorResiliente(BaseAdapter):
+    def __init__(self, interno, cortacircuitos=None, cache_negativa=None, reintentos=MAX_REINTENTOS):
+        """
+        Args:
+            interno (BaseAdapter): Adaptador que hace la petición (ej: AdaptadorLimitador)
+            cortacircuitos (CortaCircuitos): Cortacircuitos por host (default: el compartido)
+            cache_negativa (CacheNegativa): URLs inexistentes conocidas (default: la compartida)
+            reintentos (int): Reintentos ante fallos transitorios
+        """
+        super().__init__()
+        self.interno = interno
+        self.cortacircuitos = cortacircuitos or cortacircuitos_compartido()
+        self.cache_negativa = cache_negativa or cache_negativa_compartida()
+        self.reintentos = reintentos
+
+    def send(self, request, stream=False, **kwargs):
+        if request.method not in _METODOS_IDEMPOTENTES:
+            return self.interno.send(request, stream=stream, **kwargs)
+
+        url = request.url
+        status_negativo = self.cache_negativa.obtener(url)
+        if status_negativo:
+            _estadisticas['negativas'] += 1
+            return self._respuesta_negativa(request, status_negativo)
+
+        for intento in range(self.reintentos + 1):
+            self.cortacircuitos.permitir(url)
+            try:
+                response = self.interno.send(request, stream=stream, **kwargs)
+            except Exception as e:
+                # Cualquier error cuenta (y libera la petición de prueba si esta lo era);
+                # solo los de red se reintentan
+                transitorio = isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+                if self.cortacircuitos.fallo(url) or not transitorio or intento == self.reintentos:
+                    raise
+                self._esperar(url, intento, type(e).__name__)
+                continue
+
+            if response.status_code == 500 and _RE_MINIATURA_WIKIMEDIA.match(url):
+                # Miniatura más ancha que el original: el host está bien, la URL no sirve
+                return response
+
+            if response.status_code in ESTADOS_SOBRECARGA:
+                self.cortacircuitos.fallo(url)
+                return response
+
+            if response.status_code in ESTADOS_TRANSITORIOS:
+                if self.cortacircuitos.fallo(url) or intento == self.reintentos:
+                    return response
+                response.close()
+                self._esperar(url, intento, str(response.status_code))
+                continue
+
+            self.cortacircuitos.exito(url)
+            if response.status_code in ESTADOS_NEGATIVOS:
+                self.cache_negativa.registrar(url, response.status_code)
+            return response
+
+    def _esperar(self, url, intento, motivo):
+        espera = random.uniform(0, min(BACKOFF_MAXIMO, BACKOFF_BASE * 2 ** intento))
+        _estadisticas['reintentos'] += 1
+        print(f"  🔁 {motivo} en {urlparse(url).netloc}: reintento {intento + 1}/{self.reintentos} "
+              f"en {espera:.1f} s")
+        time.sleep(espera)
+
+    def _respuesta_negativa(self, request, status):
+        response = requests.Response()
+        response.status_code = status
+        response.reason = 'Not Found' if status == 404 else 'Gone'
+        response.headers = CaseInsensitiveDict()
+        response._content = b''
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.desde_cache_negativa = True
+        return response
+
+    def close(self):
+        self.cache_negativa.guardar()
+        self.interno.close()
+
+
+_estadisticas = {'reintentos': 0, 'negativas': 0}
+
+_cortacircuitos_compartido = None
+_cache_negativa_compartida = None
+_lock_compartidos = threading.Lock()
+
+
+def cortacircuitos_compartido():
+    """Cortacircuitos único del proceso, compartido por todos los scrapers"""
+    global _cortacircuitos_compartido
+    with _lock_compartidos:
+        if _cortacircuitos_compartido is None:
+            _cortacircuitos_compartido = CortaCircuitos()
+        return _cortacircuitos_compartido
+
+
+def cache_negativa_compartida():
+    """Caché negativa única del proceso, compartida por todos los scrapers"""
+    global _cache_negativa_compartida
+    with _lock_compartidos:
+        if _cache_negativa_compartida is None:
+            _cache_negativa_compartida = CacheNegativa()
+            # Lo que quede sin guardar se escribe al terminar el proceso
+            atexit.register(_cache_negativa_compartida.guardar)
+        return _cache_negativa_compartida
+
+
+def adaptador_resiliente(adaptador=None):
+    """
+    Adaptador con reintentos, cortacircuitos y caché negativa compartidos
+
+    Args:
+        adaptador (BaseAdapter): Adaptador interno (default: HTTPAdapter())
+
+    Returns:
+        AdaptadorResiliente
+    """
+    return AdaptadorResiliente(adaptador or HTTPAdapter())
+
+
+def imprimir_resumen_resiliencia():
+    cortes = cortacircuitos_compartido().cortes() if _cortacircuitos_compartido else {}
+    if not (_estadisticas['reintentos'] or _estadisticas['negativas'] or cortes):
+        return
+    print(f"🛟 Resiliencia: {_estadisticas['reintentos']} reintento(s), "
+          f"{_estadisticas['negativas']} petición(es) evitadas por caché negativa"
+          + (f", circuitos abiertos: {', '.join(f'{h} ({n})' for h, n in sorted(cortes.items()))}" if cortes else ""))
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Registro compacto de santos
+===========================
+Santo es el tipo de fila compartido por el scraper y los scripts de
+mantenimiento, en lugar de un dict de textos por fila:
+
+- __slots__ en vez de un dict por instancia (bastante menos memoria por santo).
+- mes, dia y prioridad se guardan como int al leer el CSV, una sola vez.
+- Las etiquetas se internan: las pocas combinaciones distintas ('',
+  'festividad', ...) son el mismo objeto en todas las filas.
+- Se comporta como un dict de solo esas columnas (santo['mes'], .get(),
+  csv.DictWriter), así el código que ya usaba filas sigue funcionando.
+- Las columnas que no son de CAMPOS se guardan aparte (extras) y se vuelven
+  a escribir: reescribir el CSV no pierde columnas agregadas a mano.
+
+leer_csv() saltea, con un aviso, las filas que no se pueden leer (mes o día
+vacíos o que no son números, filas cortadas o sin nombre), en lugar de cortar
+la lectura.
+
+ColumnasSantos arma además una vista por columnas (mes, dia y prioridad en
+arrays compactos) para filtrar y sacar los k santos de mayor prioridad de
+cada día. Con NumPy instalado (pip install numpy) esas consultas se hacen
+vectorizadas, sin recorrer las filas en Python; sin NumPy se usan los mismos
+arrays con un recorrido simple y el resultado es el mismo.
+
+Uso:
+    santos = leer_csv('data/santos.csv')
+    columnas = ColumnasSantos(santos)
+    argentinos = columnas.filtrar(etiqueta='santo_argentino')
+    destacados = columnas.top_por_dia(3)     # {(mes, dia): [Santo, ...]}
+    escribir_csv('data/santos.csv', santos)
+"""
+
+import csv
+import os
+import sys
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from sumidero_csv import CAMPOS
+
+_ENTEROS = ('mes', 'dia', 'prioridad')
+
+# keys() de un Santo: una vista de claves, como la de un dict (csv.DictWriter le resta los campos)
+_CLAVES = dict.fromkeys(CAMPOS).keys()
+
+
+def _entero(valor):
+    """int de una celda; None si está vacía (se vuelve a escribir vacía)"""
+    if valor is None or valor == '':
+        return None
+    return int(valor)
+
+
+class Santo:
+    __slots__ = tuple(CAMPOS) + ('extras',)
+
+    def __init__(self, mes, dia, nombre, prioridad=None, descripcion='', imagen='', url_wikipedia='',
+                 etiquetas='', oracion='', extras=None):
+        self.mes = mes
+        self.dia = dia
+        self.nombre = nombre
+        self.prioridad = prioridad
+        self.descripcion = descripcion
+        self.imagen = imagen
+        self.url_wikipedia = url_wikipedia
+        self.etiquetas = sys.intern(etiquetas)
+        self.oracion = oracion
+        self.extras = extras or None  # {columna: valor} de las columnas que no son de CAMPOS
+
+    @classmethod
+    def desde_fila(cls, fila):
+        """
+        Args:
+            fila (dict): Fila de csv.DictReader (textos) o del scraper (ya con int)
+
+        Returns:
+            Santo
+
+        Raises:
+            ValueError: si mes, dia o prioridad no son números
+        """
+        extras = {campo: valor or '' for campo, valor in fila.items()
+                  if campo is not None and campo not in CAMPOS}
+        return cls(_entero(fila['mes']), _entero(fila['dia']), fila.get('nombre') or '',
+                   prioridad=_entero(fila.get('prioridad')),
+                   descripcion=fila.get('descripcion') or '',
+                   imagen=fila.get('imagen') or '',
+                   url_wikipedia=fila.get('url_wikipedia') or '',
+                   etiquetas=fila.get('etiquetas') or '',
+                   oracion=fila.get('oracion') or '',
+                   extras=extras)
+
+    @property
+    def clave(self):
+        """Clave "mes-dia-nombre" (la de santos_existentes)"""
+        return f"{self.mes}-{self.dia}-{self.nombre}"
+
+    def a_dict(self):
+        fila = {campo: getattr(self, campo) for campo in CAMPOS}
+        fila.update(self.extras or {})
+        return fila
+
+    # Acceso como dict, para el código que trabaja con filas del CSV
+
+    def __getitem__(self, campo):
+        if campo in CAMPOS:
+            return getattr(self, campo)
+        if self.extras and campo in self.extras:
+            return self.extras[campo]
+        raise KeyError(campo)
+
+    def __setitem__(self, campo, valor):
+        if campo not in CAMPOS:
+            if not (self.extras and campo in self.extras):
+                raise KeyError(campo)
+            self.extras[campo] = valor
+            return
+        if campo in _ENTEROS:
+            valor = _entero(valor)
+        elif campo == 'etiquetas':
+            valor = sys.intern(valor or '')
+        setattr(self, campo, valor)
+
+    def __contains__(self, campo):
+        return campo in CAMPOS or bool(self.extras and campo in self.extras)
+
+    def get(self, campo, default=None):
+        if campo in CAMPOS:
+            return getattr(self, campo)
+        return self.extras.get(campo, default) if self.extras else default
+
+    def keys(self):
+        if self.extras:
+            return dict.fromkeys(CAMPOS + list(self.extras)).keys()
+        return _CLAVES
+
+    def __eq__(self, otro):
+        return (isinstance(otro, Santo) and all(getattr(self, c) == getattr(otro, c) for c in CAMPOS)
+                and (self.extras or {}) == (otro.extras or {}))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Santo({self.mes}/{self.dia} {self.nombre!r}, prioridad={self.prioridad})"
+
+
+def desde_filas(filas, origen='santos.csv'):
+    """
+    Santo de cada fila del CSV: ignora las vacías y saltea con un aviso las que no
+    se pueden leer (fecha vacía, que no es un número o fuera de rango, fila cortada o sin nombre)
+
+    Args:
+        filas: filas de csv.DictReader (o de SumideroCSV.leer())
+        origen (str): Nombre del archivo para los avisos
+
+    Returns:
+        list
+    """
+    santos = []
+    for fila in filas:
+        if not any((valor or '').strip() for valor in fila.values() if isinstance(valor, str)):
+            continue
+        try:
+            santo = Santo.desde_fila(fila)
+            if santo.mes is None or santo.dia is None or not (1 <= santo.mes <= 12 and 1 <= santo.dia <= 31):
+                raise ValueError(f"fecha inválida ({fila.get('mes')!r}/{fila.get('dia')!r})")
+            if not santo.nombre.strip():
+                raise ValueError("fila sin nombre")
+        except (ValueError, TypeError) as e:
+            # csv.DictReader sabe en qué línea está; las filas del sumidero no
+            linea = getattr(filas, 'line_num', None)
+            print(f"  ⚠️ Fila {'de ' if linea is None else f'{linea} de '}{origen} ignorada: {e}")
+            continue
+        santos.append(santo)
+    return santos
+
+
+def leer_csv(ruta):
+    """
+    Lee santos.csv como lista de Santo (ver desde_filas)
+
+    Returns:
+        list
+    """
+    with open(ruta, 'r', newline='', encoding='utf-8') as f:
+        return desde_filas(csv.DictReader(f), os.path.basename(ruta))
+
+
+def escribir_csv(ruta, santos):
+    """Escribe santos.csv completo (escritura atómica), con las columnas extra que traigan las filas"""
+    campos = list(CAMPOS)
+    for santo in santos:
+        for campo in santo.keys():
+            if campo not in campos:
+                campos.append(campo)
+    temporal = ruta + '.tmp'
+    with open(temporal, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=campos)
+        writer.writeheader()
+        writer.writerows(santos)
+    os.replace(temporal, ruta)
+
+
+class ColumnasSantos:
+    def __init__(self, santos):
+        """
+        Args:
+            santos (list): Santo (o filas) a indexar por columnas
+        """
+        self.santos = [s if isinstance(s, Santo) else Santo.desde_fila(s) for s in santos]
+        # Un santo sin fecha (None) queda con 0, que no coincide con ningún día
+        self.mes = array('b', (s.mes or 0 for s in self.santos))
+        self.dia = array('b', (s.dia or 0 for s in self.santos))
+        self.prioridad = array('h', (s.prioridad or 0 for s in self.santos))
+        # Cada combinación de etiquetas distinta tiene un código
+        codigos = {}
+        self.codigo_etiquetas = array('H', (codigos.setdefault(s.etiquetas, len(codigos)) for s in self.santos))
+        self.etiquetas = list(codigos)
+
+    def __len__(self):
+        return len(self.santos)
+
+    def _codigos_con(self, etiqueta):
+        return [codigo for codigo, etiquetas in enumerate(self.etiquetas) if etiqueta in etiquetas.split(',')]
+
+    def indices(self, mes=None, dia=None, prioridad_minima=None, etiqueta=None):
+        """
+        Posiciones de los santos que cumplen todos los filtros indicados
+
+        Returns:
+            list: índices en self.santos, en orden
+        """
+        codigos = None if etiqueta is None else self._codigos_con(etiqueta)
+        if numpy is not None:
+            mascara = numpy.ones(len(self.santos), dtype=bool)
+            if mes is not None:
+                mascara &= numpy.frombuffer(self.mes, dtype=numpy.int8) == mes
+            if dia is not None:
+                mascara &= numpy.frombuffer(self.dia, dtype=numpy.int8) == dia
+            if prioridad_minima is not None:
+                mascara &= numpy.frombuffer(self.prioridad, dtype=numpy.int16) >= prioridad_minima
+            if codigos is not None:
+                mascara &= numpy.isin(numpy.frombuffer(self.codigo_etiquetas, dtype=numpy.uint16), codigos)
+            return numpy.flatnonzero(mascara).tolist()
+
+        codigos = None if codigos is None else set(codigos)
+        return [i for i in range(len(self.santos))
+                if (mes is None or self.mes[i] == mes)
+                and (dia is None or self.dia[i] == dia)
+                and (prioridad_minima is None or self.prioridad[i] >= prioridad_minima)
+                and (codigos is None or self.codigo_etiquetas[i] in codigos)]
+
+    def filtrar(self, **filtros):
+        """Como indices(), pero devuelve los Santo"""
+        return [self.santos[i] for i in self.indices(**filtros)]
+
+    def top_por_dia(self, k):
+        """
+        Los k santos de mayor prioridad de cada día (a igual prioridad, en orden del CSV)
+
+        Returns:
+            dict: {(mes, dia): [Santo, ...]} con los días en orden de calendario
+        """
+        if not self.santos:
+            return {}
+        if numpy is not None:
+            mes = numpy.frombuffer(self.mes, dtype=numpy.int8)
+            dia = numpy.frombuffer(self.dia, dtype=numpy.int8)
+            prioridad = numpy.frombuffer(self.prioridad, dtype=numpy.int16).astype(numpy.int32)
+            # lexsort ordena por la última clave primero y es estable: día, prioridad descendente, posición
+            orden = numpy.lexsort((-prioridad, dia, mes))
+            fecha = mes[orden].astype(numpy.int32) * 32 + dia[orden]
+            inicio_grupo = numpy.flatnonzero(numpy.r_[True, fecha[1:] != fecha[:-1]])
+            rango = numpy.arange(len(orden)) - numpy.repeat(inicio_grupo, numpy.diff(numpy.r_[inicio_grupo, len(orden)]))
+            elegidos = orden[rango < k].tolist()
+        else:
+            por_dia = {}
+            for i in range(len(self.santos)):
+                por_dia.setdefault((self.mes[i], self.dia[i]), []).append(i)
+            elegidos = []
+            for fecha in sorted(por_dia):
+                elegidos.extend(sorted(por_dia[fecha], key=lambda i: -self.prioridad[i])[:k])
+
+        resultado = {}
+        for i in elegidos:
+            santo = self.santos[i]
+            resultado.setdefault((santo.mes, santo.dia), []).append(santo)
+        return resultado
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lectura del santoral y de los artículos desde HTML
+==================================================
+Funciones puras (sin red ni estado) sobre el HTML de Wikipedia, para poder
+correrlas en otros procesos:
+
+    parsear_santoral_html(html) -> (items, problema), cada ítem:
+        {'url': 'https://es.wikipedia.org/wiki/...', 'texto_enlace': '...', 'texto': '...'}
+        ('url' es None si la viñeta no enlaza a un artículo)
+    parsear_articulo_html(html) -> {'parrafos': [str], 'url_imagen': str}
+
+La limpieza de nombres y la elección de la descripción las hace
+SantosWikipediaScraper, igual que con el wikitext y el volcado.
+
+FuenteArchivoHTML reparsea las páginas guardadas en el archivo de respuestas
+con un pool de procesos (uno por CPU): cada proceso lee, descomprime y
+parsea sus páginas, y los resultados se juntan en el orden pedido.
+"""
+
+import gzip
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import requests
+
+from archivo_respuestas import archivo_compartido
+from parseo_html import CONTENIDO_ARTICULO, documento
+from santoral_wikitext import SECCIONES_IGNORAR
+
+URL_WIKIPEDIA = 'https://es.wikipedia.org'
+
+# Páginas por tarea enviada a un proceso
+PAGINAS_POR_TAREA = 16
+
+_RE_ENLACE_AÑO = re.compile(r'/wiki/\d{3,4}$')
+
+
+def _listas_del_santoral(encabezado):
+    """Listas (ul/ol) que siguen al encabezado del santoral, hasta la próxima sección"""
+    listas = []
+    actual = encabezado.find_next_sibling()
+    while actual and actual.name not in ['h2', 'h3']:
+        # Un subtítulo de secciones que no son santos corta la búsqueda
+        if actual.name in ['h3', 'h4', 'p', 'b', 'strong']:
+            texto = actual.get_text(strip=True).lower()
+            if any(seccion in texto for seccion in SECCIONES_IGNORAR):
+                break
+
+        if actual.name in ['ul', 'ol']:
+            listas.append(actual)
+        # También buscar listas dentro de divs
+        elif actual.name in ['div', 'figure']:
+            listas.extend(actual.find_all(['ul', 'ol'], recursive=False))
+
+        actual = actual.find_next_sibling()
+
+    # Si no hay listas como hermanos (ej: encabezado dentro de <div class="mw-heading">),
+    # se toman las primeras 2 listas entre el encabezado y el siguiente, en orden de documento
+    if not listas:
+        siguiente = encabezado.find_next(['h2', 'h3'])
+        if siguiente:
+            for elemento in encabezado.find_all_next(['ul', 'ol', 'h2', 'h3']):
+                if elemento is siguiente:
+                    break
+                if elemento.name in ('ul', 'ol'):
+                    listas.append(elemento)
+                if len(listas) >= 2:
+                    break
+    return listas
+
+
+def parsear_santoral_html(html):
+    """
+    Extrae los ítems del santoral católico de la página HTML de un día
+
+    Returns:
+        tuple: (items, problema) donde problema es None o el texto a registrar
+               en wikiproblematica.csv
+    """
+    with documento(html, CONTENIDO_ARTICULO) as soup:
+        encabezado = None
+        for heading in soup.find_all(['h2', 'h3']):
+            texto_heading = heading.get_text(strip=True)
+            if 'Santoral' in texto_heading and 'católico' in texto_heading:
+                encabezado = heading
+                break
+        if encabezado is None:
+            return [], "No se encontró sección 'Santoral católico'"
+
+        items = []
+        for lista in _listas_del_santoral(encabezado):
+            for item in lista.find_all('li', recursive=False):
+                # Primer enlace a un artículo (no a años)
+                enlace_valido = None
+                for enlace in item.find_all('a'):
+                    href = enlace.get('href', '')
+                    if href.startswith('/wiki/') and not _RE_ENLACE_AÑO.match(href):
+                        enlace_valido = enlace
+                        break
+
+                items.append({
+                    'url': URL_WIKIPEDIA + enlace_valido['href'] if enlace_valido else None,
+                    'texto_enlace': enlace_valido.get_text(strip=True) if enlace_valido else None,
+                    'texto': item.get_text(strip=True)
+                })
+
+    return items, None
+
+
+def parsear_articulo_html(html):
+    """
+    Extrae los párrafos de primer nivel y la imagen del infobox de un artículo
+
+    Returns:
+        dict: {'parrafos': [str], 'url_imagen': str} ('' si no hay imagen en el infobox)
+    """
+    with documento(html, CONTENIDO_ARTICULO) as soup:
+        parrafos = []
+        contenido = soup.find('div', class_='mw-parser-output')
+        if contenido:
+            parrafos = [p.get_text(separator=' ', strip=True) for p in contenido.find_all('p', recursive=False)]
+
+        url_imagen = ""
+        infobox = soup.find('table', class_='infobox')
+        if infobox:
+            img = infobox.find('img')
+            if img and img.get('src'):
+                src = img['src']
+                url_imagen = 'https:' + src if src.startswith('//') else src
+
+    return {'parrafos': parrafos, 'url_imagen': url_imagen}
+
+
+def _url_preparada(url):
+    """URL tal como la envía requests, que es como queda guardada en el archivo"""
+    return requests.Request('GET', url).prepare().url
+
+
+_PARSERS = {'dia': parsear_santoral_html, 'articulo': parsear_articulo_html}
+
+
+def _parsear_archivados(tipo, rutas):
+    """Lee, descomprime y parsea en este proceso varias páginas archivadas"""
+    resultados = []
+    for ruta in rutas:
+        try:
+            with open(ruta, 'rb') as f:
+                resultados.append(_PARSERS[tipo](gzip.decompress(f.read())))
+        except Exception as e:
+            resultados.append(e)
+    return resultados
+
+
+class FuenteArchivoHTML:
+    def __init__(self, archivo=None, fecha=None, procesos=None):
+        """
+        Args:
+            archivo (ArchivoRespuestas): Archivo de respuestas (default: el compartido)
+            fecha (str): 'AAAA-MM-DD' para usar lo archivado hasta ese día (default: lo más reciente)
+            procesos (int): Procesos de parseo. Default: os.cpu_count()
+        """
+        self.archivo = archivo or archivo_compartido()
+        self.fecha = fecha
+        self.procesos = procesos or os.cpu_count() or 1
+
+    def _parsear(self, tipo, urls):
+        """
+        Parsea en paralelo las páginas archivadas de las URLs
+
+        Returns:
+            dict: {url: resultado} en el orden de urls, solo para las archivadas y legibles
+        """
+        preparadas = {url: _url_preparada(url) for url in urls}
+        archivadas = self.archivo.ubicar(preparadas.values(), self.fecha)
+        rutas = {url: archivadas[preparada] for url, preparada in preparadas.items() if preparada in archivadas}
+        pendientes = [url for url in urls if url in rutas]
+        tareas = [pendientes[i:i + PAGINAS_POR_TAREA] for i in range(0, len(pendientes), PAGINAS_POR_TAREA)]
+
+        resultados = {}
+        errores = 0
+        with ProcessPoolExecutor(max_workers=self.procesos) as executor:
+            # map devuelve las tareas en el orden enviado: el resultado no depende
+            # de qué proceso termina primero
+            lotes = executor.map(_parsear_archivados, [tipo] * len(tareas),
+                                 [[rutas[url] for url in tarea] for tarea in tareas])
+            for tarea, lote in zip(tareas, lotes):
+                for url, resultado in zip(tarea, lote):
+                    if isinstance(resultado, Exception):
+                        errores += 1
+                        print(f"  ⚠️ No se pudo parsear {url}: {resultado}")
+                    else:
+                        resultados[url] = resultado
+
+        if len(pendientes) < len(urls) or errores:
+            print(f"  ⚠️ {len(urls) - len(pendientes)} página(s) sin archivar, {errores} con error")
+        return resultados
+
+    def santorales(self, urls_por_dia):
+        """
+        Args:
+            urls_por_dia: {(mes, dia): url de la página del día}
+
+        Returns:
+            dict: {(mes, dia): (items, problema)} como parsear_santoral_html,
+                  solo para los días archivados
+        """
+        print(f"📼 Reparseando {len(urls_por_dia)} día(s) archivados ({self.procesos} proceso(s))...")
+        paginas = self._parsear('dia', list(urls_por_dia.values()))
+        return {fecha: paginas[url] for fecha, url in urls_por_dia.items() if url in paginas}
+
+    def articulos(self, urls):
+        """
+        Returns:
+            dict: {url: {'parrafos': [str], 'url_imagen': str}} solo para los artículos archivados
+        """
+        urls = list(dict.fromkeys(url for url in urls if url))
+        print(f"📼 Reparseando {len(urls)} artículo(s) archivados ({self.procesos} proceso(s))...")
+        return self._parsear('articulo', urls)
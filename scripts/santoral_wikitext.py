@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lectura del santoral desde wikitext
+===================================
+Funciones puras (sin red) para extraer la sección "Santoral católico" del
+wikitext de una página de día (ejemplo: "4 de noviembre") y convertir cada
+viñeta en un ítem crudo:
+
+    {'titulo': 'Carlos Borromeo', 'texto_enlace': 'San Carlos Borromeo', 'texto': '...'}
+
+'titulo' es el destino del primer enlace válido (None si el ítem no tiene
+enlace) y 'texto' es la viñeta completa en texto plano. La limpieza de
+nombres la hace SantosWikipediaScraper, igual que con el HTML.
+"""
+
+import re
+
+MESES = ['enero', 'febrero', 'marzo', 'abril', 'mayo', 'junio',
+         'julio', 'agosto', 'septiembre', 'octubre', 'noviembre', 'diciembre']
+
+# Subtítulos que indican que ya no siguen santos
+SECCIONES_IGNORAR = ['por países', 'por país', 'celebraciones', 'festividades', 'tradiciones']
+
+# Espacios de nombres que no son artículos de santos
+_PREFIJOS_NO_ARTICULO = ('archivo:', 'file:', 'imagen:', 'image:', 'categoría:', 'category:',
+                         'anexo:', 'wikipedia:', 'plantilla:', 'template:', ':')
+
+_RE_ENCABEZADO = re.compile(r'^(={2,6})\s*(.*?)\s*\1\s*$')
+_RE_COMENTARIO = re.compile(r'<!--.*?-->', re.DOTALL)
+_RE_REF = re.compile(r'<ref[^>/]*/>|<ref[^>]*>.*?</ref>', re.DOTALL | re.IGNORECASE)
+_RE_ETIQUETA_HTML = re.compile(r'</?[a-zA-Z][^>]*>')
+_RE_ENLACE = re.compile(r'\[\[([^\[\]|]*)(?:\|([^\[\]]*))?\]\]([a-záéíóúñü]*)')
+_RE_ENLACE_EXTERNO = re.compile(r'\[(?:https?:)?//[^\s\]]+(?:\s+([^\]]*))?\]')
+_RE_NEGRITA_CURSIVA = re.compile(r"'{2,5}")
+_RE_AÑO = re.compile(r'^\d{3,4}$')
+
+
+def titulo_pagina_dia(mes, dia):
+    """(11, 4) -> '4 de noviembre'"""
+    return f"{dia} de {MESES[mes - 1]}"
+
+
+def _quitar_anidados(texto, apertura, cierre, conservar=None):
+    """
+    Elimina bloques anidados (plantillas {{...}} o archivos [[Archivo:...]]).
+    conservar(bloque) puede devolver un texto de reemplazo; None elimina el bloque.
+    """
+    resultado = []
+    profundidad = 0
+    inicio = 0
+    i = 0
+    while i < len(texto):
+        if texto.startswith(apertura, i):
+            if profundidad == 0:
+                resultado.append(texto[inicio:i])
+                inicio = i
+            profundidad += 1
+            i += len(apertura)
+        elif texto.startswith(cierre, i) and profundidad:
+            profundidad -= 1
+            i += len(cierre)
+            if profundidad == 0:
+                reemplazo = conservar(texto[inicio:i]) if conservar else None
+                if reemplazo:
+                    resultado.append(reemplazo)
+                inicio = i
+        else:
+            i += 1
+    if profundidad == 0:
+        resultado.append(texto[inicio:])
+    return ''.join(resultado)
+
+
+def _es_enlace_a_archivo(bloque):
+    destino = bloque[2:].lstrip().lower()
+    return destino.startswith(('archivo:', 'file:', 'imagen:', 'image:', 'categoría:', 'category:'))
+
+
+def limpiar_wikitext(texto):
+    """Quita comentarios, referencias, plantillas, archivos y etiquetas HTML (conserva enlaces)"""
+    texto = _RE_COMENTARIO.sub('', texto)
+    texto = _RE_REF.sub('', texto)
+    texto = _quitar_anidados(texto, '{{', '}}')
+    texto = _quitar_anidados(texto, '{|', '|}')
+    texto = _quitar_anidados(texto, '[[', ']]',
+                             conservar=lambda bloque: None if _es_enlace_a_archivo(bloque) else bloque)
+    texto = _RE_ETIQUETA_HTML.sub('', texto)
+    return texto
+
+
+def texto_plano(texto):
+    """Convierte wikitext en texto plano: [[a|b]] -> b, '''x''' -> x, sin plantillas"""
+    texto = limpiar_wikitext(texto)
+    texto = _RE_ENLACE.sub(lambda m: (m.group(2) if m.group(2) is not None else m.group(1)) + m.group(3), texto)
+    texto = _RE_ENLACE_EXTERNO.sub(lambda m: m.group(1) or '', texto)
+    texto = _RE_NEGRITA_CURSIVA.sub('', texto)
+    texto = texto.replace('&nbsp;', ' ')
+    return re.sub(r'[ \t]+', ' ', texto).strip()
+
+
+def extraer_seccion_santoral(wikitext):
+    """
+    Retorna las líneas de la sección "Santoral católico" o None si la página no la tiene
+    """
+    lineas = wikitext.split('\n')
+    inicio = None
+    for i, linea in enumerate(lineas):
+        encabezado = _RE_ENCABEZADO.match(linea.strip())
+        if encabezado:
+            titulo = texto_plano(encabezado.group(2))
+            if 'Santoral' in titulo and 'católico' in titulo:
+                inicio = i + 1
+                break
+
+    if inicio is None:
+        return None
+
+    seccion = []
+    for linea in lineas[inicio:]:
+        linea_limpia = linea.strip()
+        encabezado = _RE_ENCABEZADO.match(linea_limpia)
+        if encabezado:
+            nivel = len(encabezado.group(1))
+            if nivel <= 3:
+                break
+            # Subtítulo menor: se corta si introduce secciones que no son santos
+            if any(s in texto_plano(encabezado.group(2)).lower() for s in SECCIONES_IGNORAR):
+                break
+            continue
+
+        if linea_limpia and not linea_limpia.startswith(('*', '#', ':')):
+            # Párrafo o texto en negrita que introduce otra subsección
+            if any(s in texto_plano(linea_limpia).lower() for s in SECCIONES_IGNORAR):
+                break
+
+        seccion.append(linea)
+    return seccion
+
+
+def _primer_enlace_valido(texto):
+    """Primer enlace interno que apunta a un artículo (no años, archivos ni anexos)"""
+    for m in _RE_ENLACE.finditer(texto):
+        destino = m.group(1).strip()
+        if not destino or destino.lower().startswith(_PREFIJOS_NO_ARTICULO):
+            continue
+        if _RE_AÑO.match(destino.replace('_', ' ')):
+            continue
+        etiqueta = m.group(2) if m.group(2) is not None else destino
+        return destino, texto_plano(etiqueta + m.group(3))
+    return None, None
+
+
+def parsear_santoral_wikitext(wikitext):
+    """
+    Extrae los ítems del santoral católico de una página de día
+
+    Returns:
+        tuple: (items, problema) donde problema es None o el texto a registrar
+               en wikiproblematica.csv
+    """
+    seccion = extraer_seccion_santoral(wikitext)
+    if seccion is None:
+        return [], "No se encontró sección 'Santoral católico'"
+
+    items = []
+    for linea in seccion:
+        linea = linea.strip()
+        # Solo viñetas de primer nivel (las anidadas son detalle del ítem anterior)
+        if not linea.startswith(('*', '#')) or linea.startswith(('**', '##', '*:', '#:')):
+            continue
+
+        contenido = limpiar_wikitext(linea[1:])
+        titulo, texto_enlace = _primer_enlace_valido(contenido)
+        if titulo:
+            # MediaWiki siempre capitaliza la primera letra del título
+            titulo = titulo.replace('_', ' ').strip()
+            titulo = titulo[:1].upper() + titulo[1:]
+
+        items.append({
+            'titulo': titulo,
+            'texto_enlace': texto_enlace,
+            'texto': texto_plano(contenido)
+        })
+
+    if not items:
+        return [], "Sección encontrada pero sin santos listados"
+    return items, None
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Santos ya guardados, con índice por día
+=======================================
+SantosExistentes es el dict clave "mes-dia-nombre" -> fila que usa el
+scraper para saber qué hay en santos.csv, con un índice secundario por
+(mes, dia) que se mantiene al agregar y al quitar filas:
+
+    existentes = SantosExistentes()
+    existentes[clave] = fila
+    existentes.del_dia(11, 11)   # {clave: fila} de ese día, sin recorrer el resto
+
+Así preparar o limpiar un día cuesta lo que tiene ese día y no todo el CSV,
+y un año completo deja de ser O(366 × N). Las filas son Santo (santo.py),
+con mes y día ya convertidos a int.
+
+Ver benchmark_indice_santos.py para la comparación con el recorrido completo.
+"""
+
+from santo import Santo
+
+_VACIO = {}
+
+
+def _dia_de(fila):
+    if isinstance(fila, Santo):
+        return fila.mes, fila.dia
+    return int(fila['mes']), int(fila['dia'])
+
+
+class SantosExistentes(dict):
+    def __init__(self, filas=()):
+        """
+        Args:
+            filas: Pares (clave, fila) o dict iniciales
+        """
+        super().__init__()
+        self._por_dia = {}  # (mes, dia) -> {clave: fila}, en orden de inserción
+        self.update(filas)
+
+    def __setitem__(self, clave, fila):
+        anterior = self.get(clave)
+        if anterior is not None:
+            self._desindexar(clave, anterior)
+        super().__setitem__(clave, fila)
+        self._por_dia.setdefault(_dia_de(fila), {})[clave] = fila
+
+    def __delitem__(self, clave):
+        self._desindexar(clave, self[clave])
+        super().__delitem__(clave)
+
+    def pop(self, clave, *default):
+        if clave in self:
+            fila = self[clave]
+            del self[clave]
+            return fila
+        return super().pop(clave, *default)
+
+    def update(self, filas=(), **kwargs):
+        for clave, fila in (filas.items() if isinstance(filas, dict) else filas):
+            self[clave] = fila
+        for clave, fila in kwargs.items():
+            self[clave] = fila
+
+    def setdefault(self, clave, fila=None):
+        if clave not in self:
+            self[clave] = fila
+        return self[clave]
+
+    def popitem(self):
+        clave, fila = super().popitem()
+        self._desindexar(clave, fila)
+        return clave, fila
+
+    def clear(self):
+        super().clear()
+        self._por_dia.clear()
+
+    def del_dia(self, mes, dia):
+        """
+        Filas guardadas de un día, en tiempo constante
+
+        Returns:
+            dict: {clave: fila} (no modificar: es el índice mismo)
+        """
+        return self._por_dia.get((mes, dia), _VACIO)
+
+    def _desindexar(self, clave, fila):
+        fecha = _dia_de(fila)
+        del_dia = self._por_dia.get(fecha)
+        if del_dia is not None:
+            del_dia.pop(clave, None)
+            if not del_dia:
+                del self._por_dia[fecha]
@@ -4,7 +4,6 @@
 Scraper para obtener el Evangelio del Día desde Vatican News (RSS)
 """
 
-import requests
 from bs4 import BeautifulSoup
 import json
 from datetime import datetime
@@ -12,6 +11,8 @@ import re
 import warnings
 from bs4 import XMLParsedAsHTMLWarning
 
+from cliente_http import sesion_compartida
+
 # Suprimir warning de XML parseado como HTML
 warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
 
@@ -20,9 +21,9 @@ class EvangelioScraper:
         # Página HTML directa en vez de RSS
         self.url = "https://www.vaticannews.va/es/evangelio-de-hoy.html"
         self.rss_url = "https://www.vaticannews.va/content/vaticannews/es/evangelio-de-hoy.rss.xml"
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        # Sesión compartida (ver cliente_http.py): conexiones keep-alive, timeouts comunes,
+        # caché HTTP, reintentos, limitador de ritmo por host y archivo de respuestas
+        self.session = sesion_compartida()
         # Rutas relativas al directorio raíz del proyecto
         import os
         self.directorio_base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -44,7 +45,7 @@ class EvangelioScraper:
         """Obtiene el evangelio desde la página HTML de Vatican News"""
         try:
             print("🔍 Obteniendo evangelio del día desde Vatican News (página HTML)...")
-            response = requests.get(self.url, headers=self.headers, timeout=10)
+            response = self.session.get(self.url)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -149,7 +150,7 @@ class EvangelioScraper:
         """
         try:
             print("🔍 Obteniendo evangelio del día desde Vatican News RSS...")
-            response = requests.get(self.rss_url, headers=self.headers, timeout=10)
+            response = self.session.get(self.rss_url)
             response.raise_for_status()
             
             # Usar html.parser en lugar de xml
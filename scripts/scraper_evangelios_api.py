@@ -5,13 +5,12 @@ Scraper que usa API pública de lecturas litúrgicas
 Permite descargar evangelios de CUALQUIER fecha del año litúrgico
 """
 
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import csv
 import os
-import time
-import json
+
+from cliente_http import sesion_compartida
 
 class APILiturgicaScraper:
     """
@@ -23,9 +22,9 @@ class APILiturgicaScraper:
         # API de CalAPI - Calendario Litúrgico en español
         self.base_url = "http://calapi.inadiutorium.cz/api/v0/es/calendars/default"
         self.csv_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'evangelios.csv')
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        # Sesión compartida (ver cliente_http.py): conexiones keep-alive, timeouts comunes,
+        # caché HTTP, reintentos, limitador de ritmo por host y archivo de respuestas
+        self.session = sesion_compartida()
     
     def obtener_leccionario_fecha(self, fecha):
         """Obtiene información del leccionario para una fecha específica"""
@@ -35,7 +34,7 @@ class APILiturgicaScraper:
             
             print(f"📖 Consultando API para {fecha.strftime('%d/%m/%Y')}...")
             
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = self.session.get(url)
             response.raise_for_status()
             
             data = response.json()
@@ -86,7 +85,7 @@ class APILiturgicaScraper:
             
             print(f"  📥 Descargando: {referencia}...")
             
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = self.session.get(url)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -170,9 +169,6 @@ class APILiturgicaScraper:
                 else:
                     errores += 1
                     print(f"  ❌ No disponible para esta fecha")
-                
-                # Delay para no sobrecargar el servidor
-                time.sleep(2)
             else:
                 saltados += 1
                 print(f"⏭️  {fecha_actual.strftime('%d/%m/%Y')} (ya existe)")
@@ -10,16 +10,20 @@ from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import csv
 import os
-import time
 import re
 
+from cliente_http import sesion_compartida
+from cache_http import cache_compartida
+from limitador import limitador_compartido
+from resiliencia import imprimir_resumen_resiliencia
+
 class EvangelizioScraper:
     def __init__(self):
         # URL base de Evangelizo
         self.base_url = "https://evangelizo.org"
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        # Sesión compartida (ver cliente_http.py): conexiones keep-alive, timeouts comunes,
+        # caché HTTP, reintentos, limitador de ritmo por host y archivo de respuestas
+        self.session = sesion_compartida()
         self.csv_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'evangelios.csv')
     
     def obtener_evangelio_fecha(self, fecha):
@@ -31,7 +35,7 @@ class EvangelizioScraper:
             
             print(f"📖 Obteniendo evangelio del {fecha.strftime('%d/%m/%Y')}...")
             
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = self.session.get(url)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -170,14 +174,13 @@ class EvangelizioScraper:
         print(f"\n✅ CSV actualizado: {self.csv_path}")
         print(f"📊 Total de evangelios: {len(evangelios_ordenados)}")
     
-    def descargar_rango_fechas(self, fecha_inicio, fecha_fin, delay=2):
+    def descargar_rango_fechas(self, fecha_inicio, fecha_fin):
         """Descarga evangelios para un rango de fechas"""
         print("=" * 70)
         print("📥 DESCARGANDO EVANGELIOS DESDE EVANGELIZO.ORG")
         print("=" * 70)
         print(f"Fecha inicio: {fecha_inicio.strftime('%d/%m/%Y')}")
         print(f"Fecha fin: {fecha_fin.strftime('%d/%m/%Y')}")
-        print(f"Delay entre requests: {delay} segundos")
         print()
         
         # Cargar evangelios existentes
@@ -211,9 +214,6 @@ class EvangelizioScraper:
                     evangelios_map[key] = evangelio_data
                 else:
                     errores += 1
-                
-                # Delay para no sobrecargar el servidor
-                time.sleep(delay)
             else:
                 print(f"⏭️  Saltando {fecha_actual.strftime('%d/%m/%Y')} (ya existe con contenido)")
             
@@ -226,6 +226,9 @@ class EvangelizioScraper:
         print(f"🆕 Nuevos: {nuevos}")
         print(f"🔄 Actualizados: {actualizados}")
         print(f"❌ Errores: {errores}")
+        cache_compartida().imprimir_resumen()
+        limitador_compartido().imprimir_resumen()
+        imprimir_resumen_resiliencia()
 
 def main():
     import sys
@@ -271,7 +274,7 @@ def main():
                 fecha_inicio = datetime(año, 1, 1)
                 fecha_fin = datetime(año, 12, 31)
                 
-                scraper.descargar_rango_fechas(fecha_inicio, fecha_fin, delay=1.5)
+                scraper.descargar_rango_fechas(fecha_inicio, fecha_fin)
             else:
                 print("Uso: python3 scraper_evangelios_evangelizo.py --año AÑO")
                 print("Ejemplo: python3 scraper_evangelios_evangelizo.py --año 2025")
@@ -328,7 +331,7 @@ def main():
             confirmar = input("¿Continuar? (s/n): ").strip().lower()
             
             if confirmar == 's':
-                scraper.descargar_rango_fechas(fecha_inicio, fecha_fin, delay=1.5)
+                scraper.descargar_rango_fechas(fecha_inicio, fecha_fin)
         
         elif opcion == '3':
             print("\nFecha inicio:")
@@ -5,7 +5,6 @@ Scraper para obtener evangelios históricos de Vatican News
 Guarda los datos en un CSV con formato: año,mes,dia,titulo,primera_lectura_ref,primera_lectura_texto,salmo_ref,salmo_texto,evangelio_ref,evangelio_texto
 """
 
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import csv
@@ -13,13 +12,15 @@ import os
 import time
 import json
 
+from cliente_http import sesion_compartida
+
 class EvangelioHistoricoScraper:
     def __init__(self):
         self.base_url = "https://www.vaticannews.va/es/evangelio-de-hoy.rss.xml"
         self.csv_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'evangelios.csv')
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        # Sesión compartida (ver cliente_http.py): conexiones keep-alive, timeouts comunes,
+        # caché HTTP, reintentos, limitador de ritmo por host y archivo de respuestas
+        self.session = sesion_compartida()
         
     def parse_rss_feed(self, xml_content):
         """Parsea el RSS de Vatican News y extrae los evangelios"""
@@ -281,7 +282,7 @@ def main():
     print("\n📥 Obteniendo evangelios del RSS de Vatican News...")
     evangelios_rss = []
     try:
-        response = requests.get(scraper.base_url, headers=scraper.headers, timeout=10)
+        response = scraper.session.get(scraper.base_url)
         response.raise_for_status()
         evangelios_rss = scraper.parse_rss_feed(response.text)
     except Exception as e:
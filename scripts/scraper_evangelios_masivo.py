@@ -5,7 +5,6 @@ Scraper masivo para descargar evangelios de múltiples fechas desde Vatican News
 Utiliza la misma fuente confiable (Vatican News) que ya funciona
 """
 
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import csv
@@ -13,14 +12,19 @@ import os
 import time
 import json
 
+from cliente_http import sesion_compartida
+from cache_http import cache_compartida
+from limitador import limitador_compartido
+from resiliencia import imprimir_resumen_resiliencia
+
 class VaticanNewsMassScraper:
     def __init__(self):
         self.rss_url = "https://www.vaticannews.va/es/evangelio-de-hoy.rss.xml"
         self.json_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'evangelio_hoy.json')
         self.csv_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'evangelios.csv')
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        # Sesión compartida (ver cliente_http.py): conexiones keep-alive, timeouts comunes,
+        # caché HTTP, reintentos, limitador de ritmo por host y archivo de respuestas
+        self.session = sesion_compartida()
     
     def parse_fecha_rss(self, fecha_str):
         """Parsea fecha del formato RSS: 'Tue, 12 Nov 2024 00:00:00 +0000'"""
@@ -36,7 +40,7 @@ class VaticanNewsMassScraper:
         """Obtiene todos los evangelios disponibles en el RSS"""
         try:
             print("📥 Descargando RSS de Vatican News...")
-            response = requests.get(self.rss_url, headers=self.headers, timeout=15)
+            response = self.session.get(self.rss_url)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'xml')
@@ -279,6 +283,9 @@ class VaticanNewsMassScraper:
         print(f"🆕 Nuevos: {nuevos}")
         print(f"🔄 Actualizados: {actualizados}")
         print(f"📖 Total en CSV: {len(evangelios_map)}")
+        cache_compartida().imprimir_resumen()
+        limitador_compartido().imprimir_resumen()
+        imprimir_resumen_resiliencia()
 
 def main():
     scraper = VaticanNewsMassScraper()
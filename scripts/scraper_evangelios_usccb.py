@@ -10,15 +10,19 @@ from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import csv
 import os
-import time
+
+from cliente_http import sesion_compartida
+from cache_http import cache_compartida
+from limitador import limitador_compartido
+from resiliencia import imprimir_resumen_resiliencia
 
 class USCCBEvangelioScraper:
     def __init__(self):
         # URL base de USCCB para lecturas en español
         self.base_url = "https://bible.usccb.org/es/bible/lecturas"
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        # Sesión compartida (ver cliente_http.py): conexiones keep-alive, timeouts comunes,
+        # caché HTTP, reintentos, limitador de ritmo por host y archivo de respuestas
+        self.session = sesion_compartida()
         self.csv_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'evangelios.csv')
     
     def obtener_evangelio_fecha(self, fecha):
@@ -30,7 +34,7 @@ class USCCBEvangelioScraper:
             
             print(f"📖 Obteniendo evangelio del {fecha.strftime('%d/%m/%Y')}...")
             
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = self.session.get(url)
             response.raise_for_status()
             
             soup = BeautifulSoup(response.content, 'html.parser')
@@ -171,14 +175,13 @@ class USCCBEvangelioScraper:
         print(f"\n✅ CSV actualizado: {self.csv_path}")
         print(f"📊 Total de evangelios: {len(evangelios_ordenados)}")
     
-    def descargar_rango_fechas(self, fecha_inicio, fecha_fin, delay=2):
+    def descargar_rango_fechas(self, fecha_inicio, fecha_fin):
         """Descarga evangelios para un rango de fechas"""
         print("=" * 70)
         print("📥 DESCARGANDO EVANGELIOS DESDE USCCB")
         print("=" * 70)
         print(f"Fecha inicio: {fecha_inicio.strftime('%d/%m/%Y')}")
         print(f"Fecha fin: {fecha_fin.strftime('%d/%m/%Y')}")
-        print(f"Delay entre requests: {delay} segundos")
         print()
         
         # Cargar evangelios existentes
@@ -212,9 +215,6 @@ class USCCBEvangelioScraper:
                     evangelios_map[key] = evangelio_data
                 else:
                     errores += 1
-                
-                # Delay para no sobrecargar el servidor
-                time.sleep(delay)
             else:
                 print(f"⏭️  Saltando {fecha_actual.strftime('%d/%m/%Y')} (ya existe con contenido)")
             
@@ -227,6 +227,9 @@ class USCCBEvangelioScraper:
         print(f"🆕 Nuevos: {nuevos}")
         print(f"🔄 Actualizados: {actualizados}")
         print(f"❌ Errores: {errores}")
+        cache_compartida().imprimir_resumen()
+        limitador_compartido().imprimir_resumen()
+        imprimir_resumen_resiliencia()
 
 def main():
     import sys
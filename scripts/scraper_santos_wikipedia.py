@@ -18,17 +18,60 @@ Autor: Sistema automatizado
 Fecha: Noviembre 2025
 """
 
-import requests
-from bs4 import BeautifulSoup
 import csv
+import json
 import os
 import re
-import time
-from datetime import datetime
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from almacen_imagenes import AlmacenImagenes
+from archivo_respuestas import fecha_replay, replay_activo
+from base_santos import BaseSantos, ruta_base_activa
+from cache_http import cache_compartida
+from cliente_http import crear_sesion
+from descargador_imagenes import ANCHO_IMAGEN, DescargadorImagenes, ManifiestoImagenes
+from limitador import LimitadorPeticiones, limitador_compartido
+from parseo_html import TABLAS_WIKI, documento
+from pipeline_santos import PipelineSantos
+from progreso_santos import DiarioProgreso
+from resiliencia import imprimir_resumen_resiliencia
+from santo import Santo, desde_filas, escribir_csv, leer_csv
+from santos_existentes import SantosExistentes
+from sumidero_csv import SumideroCSV, clave_santo
+from wikipedia_api import ClienteMediaWiki, titulo_desde_url, url_desde_titulo
+from santoral_html import FuenteArchivoHTML, parsear_articulo_html, parsear_santoral_html
+from santoral_wikitext import parsear_santoral_wikitext, titulo_pagina_dia
+from volcado_wikipedia import FuenteVolcadoWikipedia
+
+# Imágenes de infobox que no son retratos (iconos de sistema)
+IMAGENES_EXCLUIDAS = [
+    'Edit-clear.svg',  # Icono de edición
+    'Blue_pencil.svg',  # Lápiz azul de edición
+    'Nuvola_apps_kedit.svg',  # Otro icono de edición
+    'Question_book',  # Icono de pregunta
+    'Ambox',  # Iconos de aviso
+    'Red_question_mark',  # Marca de pregunta roja
+    'Emblem-question',  # Emblema de pregunta
+    'Gtk-dialog-question',  # Diálogo de pregunta
+    'Icon-round-Question_mark',  # Icono de interrogación
+    'Replacement_character.svg',  # Carácter de reemplazo
+    'No_image',  # Sin imagen
+    'Sin_foto.svg',  # Sin foto
+    'User-avatar',  # Avatar genérico
+    'Gnome-stock_person',  # Icono de persona
+]
+
+# Horas que la caché de etiquetas especiales se considera vigente
+TTL_ETIQUETAS_HORAS = 7 * 24
 
 class SantosWikipediaScraper:
-    def __init__(self, descargar_imagenes=False):
+    def __init__(self, descargar_imagenes=False, hilos=1, peticiones_por_segundo=None,
+                 enriquecimiento='html', motor_santoral='html', volcado=None, procesos_volcado=None,
+                 procesos_parseo=None, hilos_imagenes=8, conexiones_por_host=4, ancho_imagen=ANCHO_IMAGEN,
+                 base_sqlite=None):
         """
         Inicializa el scraper basado en Wikipedia
         
@@ -36,23 +79,117 @@ class SantosWikipediaScraper:
             descargar_imagenes (bool): Si True, descarga imágenes desde Wikipedia.
                                        Si False, salta la descarga de imágenes.
                                        Default: False
+            hilos (int): Cantidad de días que se procesan en paralelo (peticiones en vuelo).
+                         Default: 1 (modo secuencial)
+            peticiones_por_segundo (float): Ritmo inicial de peticiones por host para un
+                                            limitador propio. Default: None, el limitador
+                                            adaptativo compartido por todos los scrapers
+            enriquecimiento (str): 'html' descarga el artículo completo de cada santo;
+                                   'api' pide descripción e imagen de todos los santos
+                                   de un día en lotes de 50 a la API de MediaWiki.
+                                   Default: 'html'
+            motor_santoral (str): 'html' descarga y recorre la página renderizada de cada día;
+                                  'wikitext' baja el wikitext de hasta 50 días por petición
+                                  a la API y lee la sección del santoral directamente.
+                                  Default: 'html'
+            volcado (str): Ruta a un eswiki-*-pages-articles-multistream.xml.bz2 local.
+                           Si se indica, santoral, descripciones y URLs de imagen se leen
+                           del volcado (sin peticiones a Wikipedia) y se ignoran
+                           motor_santoral y enriquecimiento. Default: None
+            procesos_volcado (int): Procesos de descompresión del volcado.
+                                    Default: uno por CPU
+            procesos_parseo (int): Procesos que reparsean las páginas archivadas en modo
+                                   replay (con motor_santoral='html'). Default: uno por CPU
+            hilos_imagenes (int): Descargas de imágenes en paralelo. Default: 8
+            conexiones_por_host (int): Máximo de descargas simultáneas por host. Default: 4
+            ancho_imagen (int): Ancho en px de las miniaturas de Wikimedia que se guardan
+                                (ej: 300 o 600). Default: 300, el ancho de las tarjetas
+            base_sqlite (str): Ruta a una base SQLite (ej: data/santos.db) que se mantiene
+                               al día con santos.csv (ver base_santos.py). Default: la
+                               activada con activar_base(), o ninguna (solo el CSV)
         """
+        if enriquecimiento not in ('html', 'api'):
+            raise ValueError(f"Modo de enriquecimiento desconocido: {enriquecimiento}")
+        if motor_santoral not in ('html', 'wikitext'):
+            raise ValueError(f"Motor de santoral desconocido: {motor_santoral}")
+        if descargar_imagenes and replay_activo():
+            # El archivo de respuestas no guarda imágenes: sin red, todas fallarían
+            print("📼 Modo replay: no se descargan imágenes, cada santo conserva la que ya tenía")
+            descargar_imagenes = False
         self.descargar_imagenes = descargar_imagenes
+        self.hilos = max(1, int(hilos))
+        self.enriquecimiento = enriquecimiento
+        self.motor_santoral = motor_santoral
         # Rutas relativas al directorio raíz del proyecto
         self.directorio_base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.directorio_imagenes = os.path.join(self.directorio_base, "web", "images")
         self.archivo_csv = os.path.join(self.directorio_base, "data", "santos.csv")
         self.archivo_problemas = os.path.join(self.directorio_base, "data", "wikiproblematica.csv")
-        self.santos_existentes = {}
-        
-        # Headers para simular un navegador
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        # Session reutilizable para requests
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        self.archivo_revisiones = os.path.join(self.directorio_base, "data", "santos_revisiones.json")
+        self.archivo_etiquetas = os.path.join(self.directorio_base, "data", "etiquetas_cache.json")
+        self.archivo_hashes_imagenes = os.path.join(self.directorio_base, "data", "imagenes_hashes.json")
+        self.archivo_manifiesto_imagenes = os.path.join(self.directorio_base, "data", "imagenes_manifest.json")
+        self.santos_existentes = SantosExistentes()
+        
+        # Limitador de cortesía por host, que se adapta a lo que tolera cada servidor
+        # (las respuestas del archivo o de la caché no pasan por él)
+        if peticiones_por_segundo is None:
+            self.limitador = limitador_compartido()
+        else:
+            self.limitador = LimitadorPeticiones(peticiones_por_segundo)
+        
+        # Session reutilizable para requests (pool dimensionado para los hilos y las
+        # descargas de imágenes), con caché HTTP compartida: páginas sin cambios vuelven
+        # como 304. Los fallos transitorios se reintentan con backoff, un host caído corta
+        # el circuito y los 404 conocidos no se vuelven a pedir (ver cliente_http.py).
+        # Todo lo descargado queda en el archivo de respuestas (modo replay)
+        self.session = crear_sesion(hilos=max(self.hilos, hilos_imagenes), limitador=self.limitador)
+        
+        # Descargas de imágenes: pool propio, escritura atómica y reanudación.
+        # Una imagen idéntica a otra ya guardada reutiliza el archivo existente, y una
+        # URL ya descargada (según el manifiesto) no se vuelve a pedir
+        self.ancho_imagen = ancho_imagen
+        self.descargador = DescargadorImagenes(self.session, self.directorio_imagenes, hilos=hilos_imagenes,
+                                               conexiones_por_host=conexiones_por_host,
+                                               ancho=ancho_imagen,
+                                               almacen=AlmacenImagenes(self.directorio_imagenes,
+                                                                       self.archivo_hashes_imagenes),
+                                               manifiesto=ManifiestoImagenes(self.archivo_manifiesto_imagenes))
+        # Imágenes de santos eliminados: se borran al final si nadie las volvió a usar
+        self._imagenes_a_revisar = set()
+        # Imagen que tenía cada santo eliminado (clave -> archivo), para cuando no se descargan
+        self._imagenes_previas = {}
+        self._lock_problemas = threading.Lock()
+        
+        # Cliente de la API de MediaWiki e información ya obtenida en lote (url -> info)
+        self.api = ClienteMediaWiki(self._get)
+        self._info_precargada = {}
+        self._lock_info = threading.Lock()
+        
+        # Santoral ya obtenido desde wikitext: (mes, dia) -> (santos, problema)
+        self._santoral_precargado = {}
+        
+        # Volcado local de Wikipedia (reconstrucción sin conexión)
+        self.volcado = FuenteVolcadoWikipedia(volcado, procesos=procesos_volcado) if volcado else None
+        
+        # Procesos para reparsear el archivo de respuestas (modo replay)
+        self.procesos_parseo = procesos_parseo
+        
+        # Revisiones de Wikipedia: las guardadas en la última ejecución y las vistas en esta
+        self.revisiones = self._cargar_revisiones()
+        self._revisiones_actuales = {'dias': {}, 'articulos': {}}
+        self._dias_con_error = set()
+        
+        # Diario de progreso (data/santos_progreso.jsonl): cada día terminado queda en disco
+        # y una ejecución interrumpida se retoma desde el primer día sin terminar
+        self.progreso = DiarioProgreso()
+        self._filas_por_dia = {}
+        
+        # santos.csv se escribe día a día; las eliminaciones quedan en memoria y el
+        # archivo se compacta una sola vez al final (ver sumidero_csv.py)
+        self.sumidero = None
+        self._lock_escritura = threading.Lock()
+        self._interrumpido = False
         
         # Crear directorio de imágenes si no existe
         if not os.path.exists(self.directorio_imagenes):
@@ -61,28 +198,106 @@ class SantosWikipediaScraper:
         # Cargar santos existentes
         self._cargar_santos_existentes()
         
+        # Base SQLite opcional: recibe las mismas filas y eliminaciones que el CSV
+        base_sqlite = base_sqlite or ruta_base_activa()
+        self.base = BaseSantos(base_sqlite) if base_sqlite else None
+        self._sincronizar_base()
+        
         # Inicializar archivo de problemas si no existe
         self._inicializar_archivo_problemas()
         
-        # Cargar etiquetas especiales desde Wikipedia
-        self.santos_argentinos = {}
-        self.festividades_importantes = {}
-        self.santos_scouts = {}
-        self._cargar_etiquetas_especiales()
+        # Etiquetas especiales: se cargan al primer uso desde data/etiquetas_cache.json
+        self._etiquetas = None
+        self._lock_etiquetas = threading.Lock()
+        self._refresco_etiquetas = None
+    
+    @property
+    def santos_argentinos(self):
+        return self._obtener_etiquetas()['santos_argentinos']
+    
+    @property
+    def festividades_importantes(self):
+        return self._obtener_etiquetas()['festividades_importantes']
+    
+    @property
+    def santos_scouts(self):
+        return self._obtener_etiquetas()['santos_scouts']
+    
+    def _obtener_etiquetas(self):
+        """
+        Etiquetas especiales, cargadas una sola vez desde la caché local.
+        Sin caché se descargan en el momento; con caché vencida se usan igual
+        y se actualizan en segundo plano.
+        """
+        if self._etiquetas is not None:
+            return self._etiquetas
+        
+        with self._lock_etiquetas:
+            if self._etiquetas is None:
+                etiquetas, generado = self._leer_cache_etiquetas()
+                if etiquetas is None:
+                    etiquetas = self.actualizar_etiquetas()
+                elif time.time() - generado > TTL_ETIQUETAS_HORAS * 3600:
+                    print("🏷️  Caché de etiquetas vencida, actualizando en segundo plano...")
+                    self._refresco_etiquetas = threading.Thread(target=self.actualizar_etiquetas, daemon=True)
+                    self._refresco_etiquetas.start()
+                if self._etiquetas is None:
+                    self._etiquetas = etiquetas
+        return self._etiquetas
+    
+    def _leer_cache_etiquetas(self):
+        """Returns: (etiquetas, instante de generación) o (None, None) si no hay caché válida"""
+        if not os.path.exists(self.archivo_etiquetas):
+            return None, None
+        try:
+            with open(self.archivo_etiquetas, 'r', encoding='utf-8') as f:
+                datos = json.load(f)
+            etiquetas = {
+                'santos_argentinos': dict.fromkeys(datos['santos_argentinos'], True),
+                'festividades_importantes': datos['festividades_importantes'],
+                'santos_scouts': dict.fromkeys(datos['santos_scouts'], True),
+            }
+            return etiquetas, datos['generado']
+        except Exception as e:
+            print(f"⚠️ Error al leer la caché de etiquetas: {e}")
+            return None, None
+    
+    def actualizar_etiquetas(self):
+        """
+        Descarga las etiquetas especiales y, si todo salió bien, las guarda en la caché
+        
+        Returns:
+            dict: etiquetas recién cargadas
+        """
+        etiquetas, completas = self._cargar_etiquetas_especiales()
+        self._etiquetas = etiquetas
+        
+        if completas:
+            datos = {
+                'generado': time.time(),
+                'santos_argentinos': sorted(etiquetas['santos_argentinos']),
+                'festividades_importantes': etiquetas['festividades_importantes'],
+                'santos_scouts': sorted(etiquetas['santos_scouts']),
+            }
+            try:
+                temporal = self.archivo_etiquetas + '.tmp'
+                with open(temporal, 'w', encoding='utf-8') as f:
+                    json.dump(datos, f, ensure_ascii=False, indent=1)
+                os.replace(temporal, self.archivo_etiquetas)
+            except Exception as e:
+                print(f"  ⚠️ Error guardando la caché de etiquetas: {e}")
+        return etiquetas
     
     def _cargar_santos_existentes(self):
         """Carga los santos ya procesados desde el CSV existente"""
         if os.path.exists(self.archivo_csv):
             try:
-                with open(self.archivo_csv, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        clave = f"{row['mes']}-{row['dia']}-{row['nombre']}"
-                        self.santos_existentes[clave] = row
+                for santo in leer_csv(self.archivo_csv):
+                    self.santos_existentes[santo.clave] = santo
                 print(f"✅ Cargados {len(self.santos_existentes)} santos existentes del CSV")
             except Exception as e:
                 print(f"⚠️ Error al cargar santos existentes: {e}")
-                self.santos_existentes = {}
+                self.santos_existentes = SantosExistentes()
     
     def _inicializar_archivo_problemas(self):
         """Inicializa el archivo de días problemáticos si no existe"""
@@ -92,32 +307,42 @@ class SantosWikipediaScraper:
                 writer.writerow(['mes', 'dia', 'url', 'problema'])
     
     def _cargar_etiquetas_especiales(self):
-        """Carga etiquetas especiales desde páginas de Wikipedia"""
+        """
+        Carga etiquetas especiales desde páginas de Wikipedia
+        
+        Returns:
+            tuple: (etiquetas, completas) donde completas es False si alguna descarga falló
+        """
         print("🏷️  Cargando etiquetas especiales desde Wikipedia...")
+        santos_argentinos = {}
+        festividades_importantes = {}
+        santos_scouts = {}
+        completas = True
         
         # 1. Santos Argentinos
         try:
             url_arg = "https://es.wikipedia.org/wiki/Anexo:Santos_y_beatos_de_Argentina"
-            response = self.session.get(url_arg, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self._get(url_arg)
+            with documento(response.content, TABLAS_WIKI) as soup:
             
-            # Buscar tablas con santos argentinos
-            for table in soup.find_all('table', class_='wikitable'):
-                for row in table.find_all('tr')[1:]:  # Skip header
-                    cells = row.find_all(['td', 'th'])
-                    if len(cells) >= 2:
-                        # Extraer nombre (primera o segunda columna)
-                        nombre_cell = cells[0] if cells[0].get_text(strip=True) else cells[1]
-                        link = nombre_cell.find('a')
-                        if link:
-                            nombre = link.get_text(strip=True)
-                            # Normalizar nombre
-                            nombre_normalizado = self._normalizar_nombre_para_busqueda(nombre)
-                            self.santos_argentinos[nombre_normalizado] = True
+                # Buscar tablas con santos argentinos
+                for table in soup.find_all('table', class_='wikitable'):
+                    for row in table.find_all('tr')[1:]:  # Skip header
+                        cells = row.find_all(['td', 'th'])
+                        if len(cells) >= 2:
+                            # Extraer nombre (primera o segunda columna)
+                            nombre_cell = cells[0] if cells[0].get_text(strip=True) else cells[1]
+                            link = nombre_cell.find('a')
+                            if link:
+                                nombre = link.get_text(strip=True)
+                                # Normalizar nombre
+                                nombre_normalizado = self._normalizar_nombre_para_busqueda(nombre)
+                                santos_argentinos[nombre_normalizado] = True
             
-            print(f"  ✅ Cargados {len(self.santos_argentinos)} santos argentinos")
+                print(f"  ✅ Cargados {len(santos_argentinos)} santos argentinos")
         except Exception as e:
             print(f"  ⚠️ Error cargando santos argentinos: {e}")
+            completas = False
         
         # 2. Festividades Importantes
         try:
@@ -139,12 +364,12 @@ class SantosWikipediaScraper:
             for festividad, info in festividades_conocidas.items():
                 if 'mes' in info and 'dia' in info:
                     clave = f"{info['mes']}-{info['dia']}"
-                    self.festividades_importantes[clave] = {
+                    festividades_importantes[clave] = {
                         'nombre': festividad,
                         'prioridad': info['prioridad']
                     }
             
-            print(f"  ✅ Cargadas {len(self.festividades_importantes)} festividades importantes")
+            print(f"  ✅ Cargadas {len(festividades_importantes)} festividades importantes")
         except Exception as e:
             print(f"  ⚠️ Error cargando festividades: {e}")
         
@@ -159,9 +384,9 @@ class SantosWikipediaScraper:
             
             for santo in santos_scouts_conocidos:
                 nombre_normalizado = self._normalizar_nombre_para_busqueda(santo)
-                self.santos_scouts[nombre_normalizado] = True
+                santos_scouts[nombre_normalizado] = True
             
-            print(f"  ✅ Cargados {len(self.santos_scouts)} santos scouts")
+            print(f"  ✅ Cargados {len(santos_scouts)} santos scouts")
         except Exception as e:
             print(f"  ⚠️ Error cargando santos scouts: {e}")
         
@@ -179,11 +404,18 @@ class SantosWikipediaScraper:
             # Agregar patronos a la lista de santos argentinos
             for santo in patronos_argentinos:
                 nombre_normalizado = self._normalizar_nombre_para_busqueda(santo)
-                self.santos_argentinos[nombre_normalizado] = True
+                santos_argentinos[nombre_normalizado] = True
             
             print(f"  ✅ Agregados {len(patronos_argentinos)} patronos/santos con devoción argentina")
         except Exception as e:
             print(f"  ⚠️ Error cargando patronos argentinos: {e}")
+        
+        etiquetas = {
+            'santos_argentinos': santos_argentinos,
+            'festividades_importantes': festividades_importantes,
+            'santos_scouts': santos_scouts,
+        }
+        return etiquetas, completas
     
     def _normalizar_nombre_para_busqueda(self, nombre):
         """Normaliza un nombre para búsqueda en diccionarios"""
@@ -234,12 +466,20 @@ class SantosWikipediaScraper:
         
         return etiquetas_str, prioridad
     
+    def _get(self, url, **kwargs):
+        """GET por la sesión (limitador y timeout por defecto van montados en ella)"""
+        return self.session.get(url, **kwargs)
+    
     def _registrar_problema(self, mes, dia, problema):
         """Registra un día problemático en el CSV"""
         url = self._construir_url_dia(mes, dia)
-        with open(self.archivo_problemas, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([mes, dia, url, problema])
+        with self._lock_problemas:
+            if problema.startswith('Error'):
+                # Fallo transitorio: no se guarda su revisión para reintentarlo la próxima vez
+                self._dias_con_error.add((mes, dia))
+            with open(self.archivo_problemas, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow([mes, dia, url, problema])
         print(f"  ⚠️ Registrado en {self.archivo_problemas}: {problema}")
     
     def _construir_url_dia(self, mes, dia):
@@ -280,153 +520,264 @@ class SantosWikipediaScraper:
         Returns:
             list: Lista de diccionarios con 'nombre' y 'url_wikipedia' (puede ser None)
         """
+        if self.motor_santoral == 'wikitext' and (mes, dia) not in self._santoral_precargado:
+            self.precargar_santoral_wikitext([(mes, dia)])
+        if (mes, dia) in self._santoral_precargado:
+            return self._santoral_desde_precarga(mes, dia)
+        
         url = self._construir_url_dia(mes, dia)
         print(f"📅 Procesando {dia:02d}/{mes:02d}...")
         print(f"  🔗 URL: {url}")
         
         try:
-            response = self.session.get(url, timeout=10)
+            response = self._get(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Buscar la sección "Santoral católico"
-            santoral_encontrado = False
-            santoral_heading = None
-            
-            # Buscar en todos los encabezados h2 y h3
-            for heading in soup.find_all(['h2', 'h3']):
-                texto_heading = heading.get_text(strip=True)
-                if 'Santoral' in texto_heading and 'católico' in texto_heading:
-                    santoral_encontrado = True
-                    santoral_heading = heading
-                    break
-            
-            if not santoral_encontrado:
-                self._registrar_problema(mes, dia, "No se encontró sección 'Santoral católico'")
-                return []
-            
-            print(f"  ✅ Encontrada sección: {santoral_heading.get_text(strip=True)}")
-            
-            # Obtener el contenido después del encabezado hasta el siguiente encabezado
-            santos = []
-            
-            # Buscar el elemento padre del heading (puede ser un div o la estructura directa)
-            parent = santoral_heading.parent
-            
-            # Encontrar todas las listas después del heading
-            # Buscar en el nivel del heading o en sus hermanos
-            listas = []
-            current = santoral_heading.find_next_sibling()
-            
-            # Secciones a ignorar (no son santos)
-            secciones_ignorar = ['por países', 'por país', 'celebraciones', 'festividades', 'tradiciones']
-            
-            while current and current.name not in ['h2', 'h3']:
-                # Verificar si encontramos un subtítulo que debemos ignorar
-                if current.name in ['h3', 'h4', 'p', 'b', 'strong']:
-                    texto = current.get_text(strip=True).lower()
-                    if any(seccion in texto for seccion in secciones_ignorar):
-                        # Saltar hasta el siguiente encabezado principal
-                        break
-                
-                if current.name in ['ul', 'ol']:
-                    listas.append(current)
-                # También buscar listas dentro de divs
-                elif current.name in ['div', 'figure']:
-                    listas.extend(current.find_all(['ul', 'ol'], recursive=False))
-                
-                current = current.find_next_sibling()
-            
-            # Si no encontramos listas como hermanos, buscar en todo el contenido siguiente
-            if not listas:
-                # Buscar desde el heading hacia adelante en todo el HTML
-                next_heading = santoral_heading.find_next(['h2', 'h3'])
-                if next_heading:
-                    # Buscar todas las listas entre el heading actual y el siguiente
-                    for ul in santoral_heading.find_all_next(['ul', 'ol']):
-                        # Verificar que la lista esté antes del siguiente heading
-                        if next_heading and ul.sourceline and next_heading.sourceline:
-                            if ul.sourceline < next_heading.sourceline:
-                                listas.append(ul)
-                        else:
-                            listas.append(ul)
-                        
-                        # Limitar a las primeras 2 listas encontradas
-                        if len(listas) >= 2:
-                            break
-            
-            # Procesar las listas encontradas
-            for lista in listas:
-                items = lista.find_all('li', recursive=False)
-                for item in items:
-                    # Extraer el nombre del santo y su enlace si existe
-                    enlaces = item.find_all('a')
-                    
-                    # Filtrar enlaces válidos (que apunten a artículos, no a años)
-                    enlace_valido = None
-                    for enlace in enlaces:
-                        href = enlace.get('href', '')
-                        if href.startswith('/wiki/') and not re.match(r'/wiki/\d{3,4}$', href):
-                            enlace_valido = enlace
-                            break
-                    
-                    if enlace_valido:
-                        # Tiene enlace a Wikipedia
-                        nombre_santo = enlace_valido.get_text(strip=True)
-                        url_wikipedia = 'https://es.wikipedia.org' + enlace_valido['href']
-                        
-                        # Filtrar nombres que no son santos (países, lugares, etc.)
-                        nombres_invalidos = ['españa', 'polonia', 'rusia', 'francia', 'italia', 'alemania', 
-                                            'argentina', 'méxico', 'chile', 'perú', 'colombia', 'bandera']
-                        if any(invalido in nombre_santo.lower() for invalido in nombres_invalidos):
-                            continue
-                        
-                        # Filtrar URLs que no son de santos (archivos, banderas, etc.)
-                        if '/archivo:' in url_wikipedia.lower() or '/file:' in url_wikipedia.lower():
-                            continue
-                        
-                        # Limpiar el nombre (remover información entre paréntesis al final)
-                        nombre_santo = re.sub(r'\s*\([^)]*\)\s*$', '', nombre_santo)
-                        
-                        # Agregar espacio después de prefijos si está pegado
-                        nombre_santo = re.sub(r'^(San|Santa|Santo|Beato|Beata|Santos)([A-Z])', r'\1 \2', nombre_santo)
-                        
-                        santos.append({
-                            'nombre': nombre_santo,
-                            'url_wikipedia': url_wikipedia
-                        })
-                    else:
-                        # No tiene enlace, solo texto
-                        texto = item.get_text(strip=True)
-                        # Limpiar el texto (tomar solo el nombre antes de comas, paréntesis, etc.)
-                        # Remover fechas y referencias
-                        texto = re.sub(r'\(\d{3,4}[-–]\d{0,4}\)', '', texto)
-                        texto = re.sub(r'\[.*?\]', '', texto)
-                        nombre_santo = re.split(r'[,(]', texto)[0].strip()
-                        
-                        # Agregar espacio después de prefijos si está pegado
-                        nombre_santo = re.sub(r'^(San|Santa|Santo|Beato|Beata|Santos)([A-Z])', r'\1 \2', nombre_santo)
-                        
-                        # Remover prefijos "San", "Santa" duplicados
-                        nombre_santo = re.sub(r'^(San|Santa|Santo|Beato|Beata)\s+(San|Santa|Santo)', r'\1', nombre_santo, flags=re.IGNORECASE)
-                        
-                        if nombre_santo and len(nombre_santo) > 2:
-                            santos.append({
-                                'nombre': nombre_santo,
-                                'url_wikipedia': None
-                            })
-            
-            if not santos:
-                self._registrar_problema(mes, dia, "Sección encontrada pero sin santos listados")
-            else:
-                print(f"  ✅ Encontrados {len(santos)} santo(s)")
-            
-            return santos
-            
+            items, problema = parsear_santoral_html(response.content)
         except Exception as e:
             print(f"  ⚠️ Error obteniendo santos del {dia:02d}/{mes:02d}: {e}")
             self._registrar_problema(mes, dia, f"Error: {str(e)}")
             return []
+        
+        santos, problema = self._santos_desde_items_html(items, problema)
+        if problema:
+            self._registrar_problema(mes, dia, problema)
+        else:
+            print(f"  ✅ Encontrados {len(santos)} santo(s)")
+        return santos
+    
+    def _santos_desde_items_html(self, items, problema):
+        """
+        Convierte los ítems de parsear_santoral_html en santos
+        
+        Returns:
+            tuple: (santos, problema)
+        """
+        santos = []
+        for item in items:
+            if item['url']:
+                # Tiene enlace a Wikipedia
+                santo = self._santo_desde_enlace(item['texto_enlace'], item['url'])
+            else:
+                # No tiene enlace, solo texto
+                santo = self._santo_desde_texto(item['texto'])
+            if santo:
+                santos.append(santo)
+        
+        if not santos and not problema:
+            problema = "Sección encontrada pero sin santos listados"
+        return santos, problema
+    
+    def _es_icono_sistema(self, src):
+        """True si la imagen es un icono de Wikipedia y no un retrato del santo"""
+        return any(excl.lower() in src.lower() for excl in IMAGENES_EXCLUIDAS)
+    
+    def _elegir_descripcion(self, parrafos):
+        """Primer párrafo con contenido sustancial (limitado a 400 caracteres)"""
+        for texto in parrafos:
+            # Filtrar textos no deseados
+            if len(texto) < 50:  # Muy corto
+                continue
+            if 'creativecommons.org' in texto.lower():  # Licencias CC
+                continue
+            if 'PDMCreative Commons' in texto:  # Metadata de imágenes
+                continue
+            if texto.startswith('http://') or texto.startswith('https://'):  # URLs sueltas
+                continue
+            
+            return texto[:400]  # Limitar a 400 caracteres
+        return ""
+    
+    def _santo_desde_enlace(self, nombre_santo, url_wikipedia):
+        """
+        Arma el santo a partir del texto de su enlace a Wikipedia
+        
+        Returns:
+            dict con 'nombre' y 'url_wikipedia', o None si el enlace no es un santo
+        """
+        # Filtrar nombres que no son santos (países, lugares, etc.)
+        nombres_invalidos = ['españa', 'polonia', 'rusia', 'francia', 'italia', 'alemania', 
+                            'argentina', 'méxico', 'chile', 'perú', 'colombia', 'bandera']
+        if any(invalido in nombre_santo.lower() for invalido in nombres_invalidos):
+            return None
+        
+        # Filtrar URLs que no son de santos (archivos, banderas, etc.)
+        if '/archivo:' in url_wikipedia.lower() or '/file:' in url_wikipedia.lower():
+            return None
+        
+        # Limpiar el nombre (remover información entre paréntesis al final)
+        nombre_santo = re.sub(r'\s*\([^)]*\)\s*$', '', nombre_santo)
+        
+        # Agregar espacio después de prefijos si está pegado
+        nombre_santo = re.sub(r'^(San|Santa|Santo|Beato|Beata|Santos)([A-Z])', r'\1 \2', nombre_santo)
+        
+        return {
+            'nombre': nombre_santo,
+            'url_wikipedia': url_wikipedia
+        }
+    
+    def _santo_desde_texto(self, texto):
+        """
+        Arma el santo a partir del texto de un ítem sin enlace
+        
+        Returns:
+            dict con 'nombre' y 'url_wikipedia' = None, o None si no hay un nombre válido
+        """
+        # Limpiar el texto (tomar solo el nombre antes de comas, paréntesis, etc.)
+        # Remover fechas y referencias
+        texto = re.sub(r'\(\d{3,4}[-–]\d{0,4}\)', '', texto)
+        texto = re.sub(r'\[.*?\]', '', texto)
+        nombre_santo = re.split(r'[,(]', texto)[0].strip()
+        
+        # Agregar espacio después de prefijos si está pegado
+        nombre_santo = re.sub(r'^(San|Santa|Santo|Beato|Beata|Santos)([A-Z])', r'\1 \2', nombre_santo)
+        
+        # Remover prefijos "San", "Santa" duplicados
+        nombre_santo = re.sub(r'^(San|Santa|Santo|Beato|Beata)\s+(San|Santa|Santo)', r'\1', nombre_santo, flags=re.IGNORECASE)
+        
+        if nombre_santo and len(nombre_santo) > 2:
+            return {
+                'nombre': nombre_santo,
+                'url_wikipedia': None
+            }
+        return None
+    
+    def precargar_santoral_wikitext(self, dias):
+        """
+        Obtiene el santoral de muchos días pidiendo su wikitext a la API
+        (prop=revisions, 50 páginas por petición) y lo deja precargado para
+        extraer_santoral_del_dia. Los enlaces a artículos inexistentes (enlaces
+        rojos) se tratan como santos sin enlace, igual que en el HTML.
+        
+        Args:
+            dias: lista de tuplas (mes, dia)
+        """
+        titulos = {titulo_pagina_dia(mes, dia): (mes, dia) for mes, dia in dias}
+        print(f"📚 Descargando wikitext de {len(titulos)} día(s) desde la API...")
+        
+        params = {
+            'prop': 'revisions',
+            'rvprop': 'ids|content',
+            'rvslots': 'main',
+            'redirects': '1',
+        }
+        try:
+            paginas = self.api.consultar_titulos(list(titulos), params)
+        except Exception as e:
+            print(f"  ⚠️ Error descargando wikitext: {e}")
+            for fecha in titulos.values():
+                self._santoral_precargado[fecha] = ([], f"Error: {e}")
+            return
+        
+        items_por_dia = {}
+        for titulo, fecha in titulos.items():
+            pagina = paginas.get(titulo)
+            revisiones = pagina.get('revisions') if pagina else None
+            if not revisiones:
+                items_por_dia[fecha] = ([], "Error: página del día no encontrada")
+                continue
+            contenido = revisiones[0].get('slots', {}).get('main', {}).get('content', '')
+            items_por_dia[fecha] = parsear_santoral_wikitext(contenido)
+            self._revisiones_actuales['dias'][f"{fecha[0]}-{fecha[1]}"] = revisiones[0].get('revid')
+        
+        # Verificar en lote qué enlaces apuntan a artículos existentes
+        enlazados = [item['titulo'] for items, _ in items_por_dia.values() for item in items if item['titulo']]
+        existentes = set()
+        if enlazados:
+            try:
+                paginas_info = self.api.consultar_titulos(enlazados, {'prop': 'info', 'redirects': '1'})
+                existentes = {t for t, pagina in paginas_info.items() if not pagina.get('missing')}
+            except Exception as e:
+                print(f"  ⚠️ No se pudo verificar los enlaces, se asumen existentes: {e}")
+                existentes = set(enlazados)
+        
+        self._guardar_santoral_precargado(items_por_dia, existentes)
+        print(f"  ✅ Wikitext procesado con {self.api.peticiones} petición(es) a la API en total")
+    
+    def _guardar_santoral_precargado(self, items_por_dia, existentes):
+        """
+        Convierte los ítems de wikitext de cada día en santos y los deja precargados
+        
+        Args:
+            items_por_dia: {(mes, dia): (items, problema)} de parsear_santoral_wikitext
+            existentes: títulos enlazados que son artículos existentes (el resto son enlaces rojos)
+        """
+        for fecha, (items, problema) in items_por_dia.items():
+            santos = []
+            for item in items:
+                if item['titulo'] in existentes:
+                    santo = self._santo_desde_enlace(item['texto_enlace'], url_desde_titulo(item['titulo']))
+                else:
+                    santo = self._santo_desde_texto(item['texto'])
+                if santo:
+                    santos.append(santo)
+            
+            if not santos and not problema:
+                problema = "Sección encontrada pero sin santos listados"
+            self._santoral_precargado[fecha] = (santos, problema)
+    
+    def precargar_desde_volcado(self, dias):
+        """
+        Precarga santoral e información de los santos leyendo el volcado local,
+        con los mismos filtros que el HTML y la API
+        
+        Args:
+            dias: lista de tuplas (mes, dia)
+        """
+        items_por_dia = self.volcado.santorales(dias)
+        enlazados = [item['titulo'] for items, _ in items_por_dia.values() for item in items if item['titulo']]
+        articulos = self.volcado.articulos(enlazados)
+        
+        self._guardar_santoral_precargado(items_por_dia, set(articulos))
+        
+        resultados = {}
+        for titulo, articulo in articulos.items():
+            url_imagen = articulo['url_imagen']
+            if url_imagen and self._es_icono_sistema(url_imagen):
+                url_imagen = ""
+            resultados[url_desde_titulo(titulo)] = {
+                'descripcion': self._elegir_descripcion(articulo['parrafos']),
+                'url_imagen': url_imagen
+            }
+        with self._lock_info:
+            self._info_precargada.update(resultados)
+        
+        print(f"  ✅ Volcado procesado: {len(items_por_dia)} día(s), {len(articulos)} artículo(s)")
+    
+    def precargar_desde_archivo(self, dias):
+        """
+        Precarga santoral e información de los santos reparseando en varios procesos
+        las páginas guardadas en el archivo de respuestas (modo replay). Los días o
+        artículos que no estén archivados siguen el camino normal.
+        
+        Args:
+            dias: lista de tuplas (mes, dia)
+        """
+        fuente = FuenteArchivoHTML(fecha=fecha_replay(), procesos=self.procesos_parseo)
+        items_por_dia = fuente.santorales({(mes, dia): self._construir_url_dia(mes, dia) for mes, dia in dias})
+        for fecha, (items, problema) in items_por_dia.items():
+            self._santoral_precargado[fecha] = self._santos_desde_items_html(items, problema)
+        
+        articulos = {}
+        if self.enriquecimiento == 'html':
+            urls = [santo['url_wikipedia'] for santos, _ in self._santoral_precargado.values()
+                    for santo in santos if santo['url_wikipedia']]
+            articulos = fuente.articulos(urls)
+            resultados = {url: self._info_desde_articulo(articulo) for url, articulo in articulos.items()}
+            with self._lock_info:
+                self._info_precargada.update(resultados)
+        
+        print(f"  ✅ Archivo reparseado: {len(items_por_dia)} día(s), {len(articulos)} artículo(s)")
+    
+    def _santoral_desde_precarga(self, mes, dia):
+        """Devuelve el santoral precargado de un día (y registra el problema si lo hubo)"""
+        santos, problema = self._santoral_precargado[(mes, dia)]
+        print(f"📅 Procesando {dia:02d}/{mes:02d} (precargado)...")
+        
+        if problema:
+            self._registrar_problema(mes, dia, problema)
+        else:
+            print(f"  ✅ Encontrados {len(santos)} santo(s)")
+        return list(santos)
     
     def obtener_info_wikipedia(self, url_wikipedia):
         """
@@ -435,106 +786,113 @@ class SantosWikipediaScraper:
         Returns:
             dict: {'descripcion': str, 'url_imagen': str} o None si hay error
         """
+        with self._lock_info:
+            if url_wikipedia in self._info_precargada:
+                return self._info_precargada[url_wikipedia]
+        
+        if self.enriquecimiento == 'api':
+            return self.obtener_info_wikipedia_lote([url_wikipedia]).get(url_wikipedia)
+        
         try:
-            response = self.session.get(url_wikipedia, timeout=10)
+            response = self._get(url_wikipedia)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extraer descripción (primer párrafo del contenido)
-            descripcion = ""
-            content_div = soup.find('div', class_='mw-parser-output')
-            if content_div:
-                # Buscar el primer párrafo con contenido sustancial
-                for p in content_div.find_all('p', recursive=False):
-                    texto = p.get_text(separator=' ', strip=True)
-                    
-                    # Filtrar textos no deseados
-                    if len(texto) < 50:  # Muy corto
-                        continue
-                    if 'creativecommons.org' in texto.lower():  # Licencias CC
-                        continue
-                    if 'PDMCreative Commons' in texto:  # Metadata de imágenes
-                        continue
-                    if texto.startswith('http://') or texto.startswith('https://'):  # URLs sueltas
-                        continue
-                    
-                    descripcion = texto[:400]  # Limitar a 400 caracteres
-                    break
-            
-            # Extraer URL de imagen (buscar en infobox)
-            url_imagen = ""
-            infobox = soup.find('table', class_='infobox')
-            if infobox:
-                img = infobox.find('img')
-                if img and img.get('src'):
-                    src = img['src']
-                    
-                    # Filtrar imágenes no deseadas
-                    imagenes_excluidas = [
-                        'Edit-clear.svg',  # Icono de edición
-                        'Blue_pencil.svg',  # Lápiz azul de edición
-                        'Nuvola_apps_kedit.svg',  # Otro icono de edición
-                        'Question_book',  # Icono de pregunta
-                        'Ambox',  # Iconos de aviso
-                        'Red_question_mark',  # Marca de pregunta roja
-                        'Emblem-question',  # Emblema de pregunta
-                        'Gtk-dialog-question',  # Diálogo de pregunta
-                        'Icon-round-Question_mark',  # Icono de interrogación
-                        'Replacement_character.svg',  # Carácter de reemplazo
-                        'No_image',  # Sin imagen
-                        'Sin_foto.svg',  # Sin foto
-                        'User-avatar',  # Avatar genérico
-                        'Gnome-stock_person',  # Icono de persona
-                    ]
-                    
-                    # Verificar si la imagen es un icono de sistema
-                    es_icono_sistema = any(excl.lower() in src.lower() for excl in imagenes_excluidas)
-                    
-                    if not es_icono_sistema:
-                        url_imagen = 'https:' + src if src.startswith('//') else src
-                    else:
-                        print(f"  ⚠️ Imagen filtrada (icono de sistema): {src.split('/')[-1]}")
-            
-            return {
-                'descripcion': descripcion,
-                'url_imagen': url_imagen
-            }
-            
+            articulo = parsear_articulo_html(response.content)
         except Exception as e:
             print(f"  ⚠️ Error obteniendo info de Wikipedia: {e}")
             return None
+        return self._info_desde_articulo(articulo)
     
-    def descargar_imagen(self, url_imagen, nombre_archivo):
-        """Descarga una imagen desde una URL"""
-        if not url_imagen:
-            return ""
+    def _info_desde_articulo(self, articulo):
+        """
+        Descripción e imagen a partir de parsear_articulo_html
+        
+        Returns:
+            dict: {'descripcion': str, 'url_imagen': str}
+        """
+        url_imagen = articulo['url_imagen']
+        if url_imagen and self._es_icono_sistema(url_imagen):
+            print(f"  ⚠️ Imagen filtrada (icono de sistema): {url_imagen.split('/')[-1]}")
+            url_imagen = ""
+        return {
+            'descripcion': self._elegir_descripcion(articulo['parrafos']),
+            'url_imagen': url_imagen
+        }
+    
+    def obtener_info_wikipedia_lote(self, urls_wikipedia):
+        """
+        Obtiene descripción e imagen de muchos santos con la API de MediaWiki
+        (prop=extracts|pageimages, 50 títulos por petición) en lugar de descargar
+        cada artículo completo. Los resultados quedan precargados para
+        obtener_info_wikipedia.
+        
+        Args:
+            urls_wikipedia: URLs de artículos (pueden ser de varios días)
+        
+        Returns:
+            dict: {url: {'descripcion': str, 'url_imagen': str}} solo para las URLs resueltas
+        """
+        urls = [url for url in dict.fromkeys(urls_wikipedia) if url]
+        if not urls:
+            return {}
+        
+        titulos = {url: titulo_desde_url(url) for url in urls}
+        params = {
+            'prop': 'extracts|pageimages|info',
+            'redirects': '1',
+            'exintro': '1',
+            'explaintext': '1',
+            'exlimit': 'max',
+            'piprop': 'thumbnail',
+            'pithumbsize': str(self.ancho_imagen or ANCHO_IMAGEN),
+            'pilicense': 'any',
+            'pilimit': 'max',
+        }
         
         try:
-            response = self.session.get(url_imagen, timeout=10, stream=True)
-            response.raise_for_status()
-            
-            # Determinar extensión
-            content_type = response.headers.get('content-type', '')
-            if 'jpeg' in content_type or 'jpg' in content_type:
-                extension = '.jpg'
-            elif 'png' in content_type:
-                extension = '.png'
-            else:
-                extension = '.jpg'
-            
-            nombre_completo = nombre_archivo + extension
-            ruta_completa = os.path.join(self.directorio_imagenes, nombre_completo)
+            paginas = self.api.consultar_titulos(list(titulos.values()), params)
+        except Exception as e:
+            print(f"  ⚠️ Error consultando la API de Wikipedia: {e}")
+            return {}
+        
+        resultados = {}
+        for url, titulo in titulos.items():
+            pagina = paginas.get(titulo)
+            if not pagina or pagina.get('missing') or pagina.get('invalid'):
+                continue
             
-            with open(ruta_completa, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            parrafos = (p.strip() for p in pagina.get('extract', '').split('\n'))
+            descripcion = self._elegir_descripcion(parrafos)
             
-            print(f"  📥 Imagen descargada: {nombre_completo}")
-            return nombre_completo
+            url_imagen = pagina.get('thumbnail', {}).get('source', '')
+            if url_imagen and self._es_icono_sistema(url_imagen):
+                print(f"  ⚠️ Imagen filtrada (icono de sistema): {url_imagen.split('/')[-1]}")
+                url_imagen = ""
             
-        except Exception as e:
-            print(f"  ⚠️ Error descargando imagen: {e}")
-            return ""
+            resultados[url] = {
+                'descripcion': descripcion,
+                'url_imagen': url_imagen
+            }
+            if pagina.get('lastrevid'):
+                with self._lock_info:
+                    self._revisiones_actuales['articulos'][url] = pagina['lastrevid']
+        
+        with self._lock_info:
+            self._info_precargada.update(resultados)
+        return resultados
+    
+    def _precargar_info_santos(self, santos_info):
+        """En modo 'api', resuelve en lote la información de todos los santos con enlace"""
+        if self.enriquecimiento != 'api':
+            return
+        with self._lock_info:
+            pendientes = [s['url_wikipedia'] for s in santos_info
+                          if s['url_wikipedia'] and s['url_wikipedia'] not in self._info_precargada]
+        if pendientes:
+            self.obtener_info_wikipedia_lote(pendientes)
+    
+    def descargar_imagen(self, url_imagen, nombre_archivo):
+        """Descarga una imagen desde una URL (retorna el nombre del archivo o "")"""
+        return self.descargador.descargar(url_imagen, nombre_archivo)
     
     def _normalizar_nombre_santo(self, nombre):
         """
@@ -625,8 +983,22 @@ class SantosWikipediaScraper:
         Returns:
             dict: Datos del santo para el CSV o None si ya fue procesado
         """
+        trabajo = self._preparar_santo(mes, dia, santo_info)
+        if trabajo is None:
+            return None
+        
+        self._enriquecer_santo(trabajo)
+        self._descargar_imagen_santo(trabajo)
+        return self._completar_santo(trabajo)
+    
+    def _preparar_santo(self, mes, dia, santo_info):
+        """
+        Primer paso de procesar_santo: normaliza el nombre y descarta los ya procesados
+        
+        Returns:
+            dict: trabajo en curso para los pasos siguientes o None si ya fue procesado
+        """
         nombre = santo_info['nombre']
-        url_wikipedia = santo_info['url_wikipedia']
         
         # Normalizar el nombre (agregar San/Santa/Beato si no lo tiene)
         nombre_normalizado = self._normalizar_nombre_santo(nombre)
@@ -638,8 +1010,20 @@ class SantosWikipediaScraper:
         
         print(f"  🔍 Procesando: {nombre_normalizado}")
         
-        descripcion = ""
-        imagen = ""
+        return {
+            'mes': mes,
+            'dia': dia,
+            'nombre': nombre,
+            'nombre_normalizado': nombre_normalizado,
+            'url_wikipedia': santo_info['url_wikipedia'] or "",
+            'descripcion': "",
+            'url_imagen': "",
+            'imagen': ""
+        }
+    
+    def _enriquecer_santo(self, trabajo):
+        """Segundo paso: obtiene descripción y URL de imagen desde el artículo de Wikipedia"""
+        url_wikipedia = trabajo['url_wikipedia']
         
         # Si tiene URL de Wikipedia, obtener info adicional
         if url_wikipedia:
@@ -647,15 +1031,32 @@ class SantosWikipediaScraper:
             info_wiki = self.obtener_info_wikipedia(url_wikipedia)
             
             if info_wiki:
-                descripcion = info_wiki['descripcion']
-                
-                # Descargar imagen si está activado
-                if self.descargar_imagenes and info_wiki['url_imagen']:
-                    nombre_archivo = self.limpiar_nombre_archivo(nombre)
-                    imagen = self.descargar_imagen(info_wiki['url_imagen'], nombre_archivo)
+                trabajo['descripcion'] = info_wiki['descripcion']
+                trabajo['url_imagen'] = info_wiki['url_imagen']
         else:
             print(f"    ⚠️ Sin Wikipedia (no habrá imagen ni botón)")
-            url_wikipedia = ""  # Asegurar que sea string vacío
+    
+    def _descargar_imagen_santo(self, trabajo):
+        """Tercer paso: descarga la imagen del santo si está activado"""
+        if self.descargar_imagenes and trabajo['url_imagen']:
+            nombre_archivo = self.limpiar_nombre_archivo(trabajo['nombre'])
+            trabajo['imagen'] = self.descargar_imagen(trabajo['url_imagen'], nombre_archivo)
+    
+    def _imagen_previa(self, mes, dia, nombre):
+        """
+        Sin descargas (replay, volcado o descargar_imagenes=False), la imagen que el santo ya
+        tenía antes de recalcular su día: si no, quedaría sin imagen y su archivo se borraría
+        como huérfano al final de la ejecución
+        """
+        if self.descargar_imagenes:
+            return ""
+        return self._imagenes_previas.get(f"{mes}-{dia}-{nombre}", "")
+    
+    def _completar_santo(self, trabajo):
+        """Último paso: calcula etiquetas y prioridad y arma la fila del CSV"""
+        mes = trabajo['mes']
+        dia = trabajo['dia']
+        nombre_normalizado = trabajo['nombre_normalizado']
         
         # Determinar etiquetas y prioridad
         etiquetas, prioridad = self._determinar_etiquetas_y_prioridad(nombre_normalizado, mes, dia)
@@ -670,73 +1071,150 @@ class SantosWikipediaScraper:
             'dia': dia,
             'nombre': nombre_normalizado,  # Usar nombre normalizado
             'prioridad': prioridad,  # Prioridad calculada según etiquetas
-            'descripcion': descripcion,
-            'imagen': imagen,
-            'url_wikipedia': url_wikipedia if url_wikipedia else "",
+            'descripcion': trabajo['descripcion'],
+            'imagen': trabajo['imagen'] or self._imagen_previa(mes, dia, nombre_normalizado),
+            'url_wikipedia': trabajo['url_wikipedia'],
             'etiquetas': etiquetas,  # Nueva columna
             'oracion': ""  # Vacío por ahora
         }
         
         print(f"    ✅ Completado")
-        time.sleep(0.5)  # Pausa para no saturar Wikipedia
         
         return resultado
     
     def _limpiar_santos_del_dia(self, mes, dia):
         """
-        Elimina todos los santos de un día específico del CSV y sus imágenes
+        Elimina todos los santos de un día específico del CSV (el archivo se compacta
+        y sus imágenes se borran al final de la ejecución si el día recalculado ya no las usa)
         
         Args:
             mes: número del mes
             dia: número del día
         """
         print(f"  🗑️  Eliminando santos existentes del {dia:02d}/{mes:02d}...")
+        # El índice por día da las claves sin recorrer todo el CSV
+        self._eliminar_filas(list(self.santos_existentes.del_dia(mes, dia)))
+    
+    def _eliminar_santos(self, claves):
+        """
+        Elimina del CSV los santos con las claves "mes-dia-nombre" indicadas
+        """
+        claves = set(claves)
+        if not claves:
+            return
+        print(f"  🗑️  Eliminando {len(claves)} santo(s) a refrescar...")
+        self._eliminar_filas([clave for clave in claves if clave in self.santos_existentes])
+    
+    def _eliminar_filas(self, santos_eliminados):
+        """
+        Elimina del CSV los santos con las claves "mes-dia-nombre" indicadas (de santos_existentes).
+        El archivo no se reescribe acá: quedan como tumbas en el sumidero hasta la
+        compactación del final de la ejecución. Sus imágenes tampoco se borran todavía:
+        al recalcular, la misma URL de origen devuelve el mismo archivo sin descargarlo
+        (ver _borrar_imagenes_huerfanas)
+        """
+        if santos_eliminados:
+            with self._lock_escritura:
+                filas = self._csv().eliminar(santos_eliminados)
+                self.progreso.registrar_eliminacion(santos_eliminados, filas)
+                if self.base is not None:
+                    self.base.eliminar(santos_eliminados)
+        
+        # Las imágenes quedan pendientes de revisión hasta el final de la ejecución
+        for clave in santos_eliminados:
+            row = self.santos_existentes.pop(clave)
+            if row.get('imagen'):
+                self._imagenes_a_revisar.add(row['imagen'])
+                self._imagenes_previas[clave] = row['imagen']
+        
+        print(f"    ✅ Eliminados {len(santos_eliminados)} santos")
+    
+    def _borrar_imagenes_huerfanas(self):
+        """Borra las imágenes de santos eliminados que ninguna fila del CSV usa ya"""
+        if not self._imagenes_a_revisar:
+            return
         
-        # Leer el CSV actual
-        santos_filtrados = []
-        santos_eliminados = []
-        imagenes_a_eliminar = []
+        # santos_existentes refleja el CSV (filas agregadas y eliminadas): no hace falta releerlo
+        en_uso = {row.get('imagen') for row in self.santos_existentes.values() if row.get('imagen')}
         
-        if os.path.exists(self.archivo_csv):
-            with open(self.archivo_csv, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if int(row['mes']) == mes and int(row['dia']) == dia:
-                        santos_eliminados.append(row['nombre'])
-                        if row.get('imagen'):
-                            imagenes_a_eliminar.append(row['imagen'])
-                    else:
-                        santos_filtrados.append(row)
-        
-        # Reescribir el CSV sin los santos del día
-        if santos_filtrados:
-            with open(self.archivo_csv, 'w', newline='', encoding='utf-8') as f:
-                campos = ['mes', 'dia', 'nombre', 'prioridad', 'descripcion', 'imagen', 'url_wikipedia', 'etiquetas', 'oracion']
-                writer = csv.DictWriter(f, fieldnames=campos)
-                writer.writeheader()
-                # Asegurar que todos los registros tengan el campo etiquetas
-                for santo in santos_filtrados:
-                    if 'etiquetas' not in santo:
-                        santo['etiquetas'] = ''
-                writer.writerows(santos_filtrados)
-        
-        # Eliminar imágenes asociadas
-        for imagen in imagenes_a_eliminar:
+        borradas = 0
+        for imagen in sorted(self._imagenes_a_revisar - en_uso):
             ruta_imagen = os.path.join(self.directorio_imagenes, imagen)
             if os.path.exists(ruta_imagen):
                 try:
                     os.remove(ruta_imagen)
+                    borradas += 1
                     print(f"    🗑️  Imagen eliminada: {imagen}")
                 except Exception as e:
                     print(f"    ⚠️  Error eliminando imagen {imagen}: {e}")
+                    continue
+            if self.descargador.manifiesto is not None:
+                self.descargador.manifiesto.olvidar_archivo(imagen)
         
-        # Actualizar el diccionario de santos existentes
-        claves_a_eliminar = [f"{mes}-{dia}-{nombre}" for nombre in santos_eliminados]
-        for clave in claves_a_eliminar:
-            if clave in self.santos_existentes:
-                del self.santos_existentes[clave]
+        reutilizadas = len(self._imagenes_a_revisar & en_uso)
+        print(f"🖼️  Imágenes de santos recalculados: {reutilizadas} reutilizadas, {borradas} eliminadas")
+        self._imagenes_a_revisar.clear()
+    
+    def _reescribir_csv(self, filas):
+        """Reescribe el CSV completo con las filas indicadas"""
+        # Reemplaza todo el archivo: el sumidero abierto (y sus eliminaciones pendientes) queda sin efecto
+        if self.sumidero is not None:
+            self.sumidero.cerrar()
+            self.sumidero = None
+        # Asegurar que todos los registros tengan el campo etiquetas
+        for santo in filas:
+            if 'etiquetas' not in santo:
+                santo['etiquetas'] = ''
+        # Conserva las columnas extra que traigan las filas
+        escribir_csv(self.archivo_csv, filas)
+        if self.base is not None:
+            self.base.reemplazar(filas)
+            self.base.marcar_sincronizada(self.archivo_csv)
+    
+    def completar_imagenes_faltantes(self, reemplazar_mayores_kb=None):
+        """
+        Descarga en paralelo las imágenes de los santos con artículo que no tienen
+        imagen en web/images (o cuyo archivo falta) y actualiza el CSV
         
-        print(f"    ✅ Eliminados {len(santos_eliminados)} santos y {len(imagenes_a_eliminar)} imágenes")
+        Args:
+            reemplazar_mayores_kb (int): Si se indica, también vuelve a descargar como
+                                         miniatura las imágenes que pesan más que esto
+        """
+        print("🖼️  Buscando santos sin imagen...")
+        filas = list(self.santos_existentes.values())
+        
+        def necesita_imagen(row):
+            if not row.get('imagen'):
+                return True
+            ruta = os.path.join(self.directorio_imagenes, row['imagen'])
+            if not os.path.exists(ruta):
+                return True
+            return bool(reemplazar_mayores_kb) and os.path.getsize(ruta) > reemplazar_mayores_kb * 1024
+        
+        sin_imagen = [row for row in filas if row.get('url_wikipedia') and necesita_imagen(row)]
+        print(f"  ✅ {len(sin_imagen)} santo(s) sin imagen (o con imagen a reducir) de {len(filas)}")
+        if not sin_imagen:
+            return 0
+        
+        info = self.obtener_info_wikipedia_lote([row['url_wikipedia'] for row in sin_imagen])
+        trabajos = []
+        for indice, row in enumerate(sin_imagen):
+            url_imagen = (info.get(row['url_wikipedia']) or {}).get('url_imagen')
+            if url_imagen:
+                trabajos.append((indice, url_imagen, self.limpiar_nombre_archivo(row['nombre'])))
+        
+        print(f"📥 Descargando {len(trabajos)} imagen(es) con {self.descargador.hilos} hilo(s)...")
+        completadas = 0
+        for indice, imagen in self.descargador.descargar_lote(trabajos).items():
+            if imagen:
+                sin_imagen[indice]['imagen'] = imagen
+                completadas += 1
+        
+        if completadas:
+            self._reescribir_csv(filas)
+        self.descargador.imprimir_resumen()
+        print(f"✅ {completadas} imagen(es) agregadas al CSV")
+        return completadas
     
     def procesar_dia(self, mes, dia, eliminar_existentes=None):
         """
@@ -747,9 +1225,16 @@ class SantosWikipediaScraper:
             dia: número del día
             eliminar_existentes: None (preguntar), True (eliminar), False (mantener)
         """
-        # Verificar si ya hay santos para este día
-        santos_existentes_dia = [s for s in self.santos_existentes.values() 
-                                 if int(s['mes']) == mes and int(s['dia']) == dia]
+        self._preparar_dia(mes, dia, eliminar_existentes)
+        return self._scrapear_dia(mes, dia)
+    
+    def _preparar_dia(self, mes, dia, eliminar_existentes=None):
+        """
+        Resuelve qué hacer con los santos ya guardados de un día (preguntar, eliminar o mantener).
+        Se ejecuta siempre en el hilo principal porque puede pedir confirmación al usuario.
+        """
+        # Verificar si ya hay santos para este día (búsqueda directa en el índice por día)
+        santos_existentes_dia = self.santos_existentes.del_dia(mes, dia)
         
         if santos_existentes_dia:
             if eliminar_existentes is None:
@@ -762,45 +1247,311 @@ class SantosWikipediaScraper:
                 self._limpiar_santos_del_dia(mes, dia)
             else:
                 print(f"  ℹ️  Manteniendo datos existentes, solo se agregarán santos nuevos")
-        
+    
+    def _scrapear_dia(self, mes, dia):
+        """Descarga el santoral de un día y procesa cada santo (seguro para usar desde varios hilos)"""
         santos_info = self.extraer_santoral_del_dia(mes, dia)
         
         if not santos_info:
             return []
         
-        resultados = []
+        self._precargar_info_santos(santos_info)
+        
+        # Las imágenes del día se descargan en paralelo mientras se enriquece el resto
+        pendientes = []
         for santo_info in santos_info:
-            resultado = self.procesar_santo(mes, dia, santo_info)
-            if resultado:
-                resultados.append(resultado)
+            trabajo = self._preparar_santo(mes, dia, santo_info)
+            if trabajo is None:
+                continue
+            self._enriquecer_santo(trabajo)
+            futuro = None
+            if self.descargar_imagenes and trabajo['url_imagen']:
+                futuro = self.descargador.enviar(trabajo['url_imagen'], self.limpiar_nombre_archivo(trabajo['nombre']))
+            pendientes.append((trabajo, futuro))
+        
+        resultados = []
+        for trabajo, futuro in pendientes:
+            if futuro is not None:
+                trabajo['imagen'] = futuro.result()
+            resultados.append(self._completar_santo(trabajo))
         
         print()
         return resultados
     
+    def _dia_terminado(self, mes, dia, filas):
+        """
+        Escribe en el CSV las filas de un día terminado y lo asienta en el diario de
+        progreso (los días con errores no se asientan: se vuelven a intentar al retomar)
+        """
+        with self._lock_escritura:
+            if self._interrumpido:
+                # Tras Ctrl-C el CSV y el diario ya se cerraron: el día se rehace al retomar
+                return
+            self._filas_por_dia[(mes, dia)] = filas
+            posicion = self._agregar_filas(filas)
+            if (mes, dia) not in self._dias_con_error:
+                try:
+                    self.progreso.registrar_dia(mes, dia, filas, posicion)
+                except Exception as e:
+                    print(f"  ⚠️ No se pudo registrar el {dia:02d}/{mes:02d} en el diario de progreso: {e}")
+    
+    def _procesar_y_registrar_dia(self, mes, dia):
+        """_scrapear_dia + _dia_terminado (para los hilos de ejecutar)"""
+        filas = self._scrapear_dia(mes, dia)
+        self._dia_terminado(mes, dia, filas)
+        return filas
+    
+    def _retomar_progreso(self, rango, incremental):
+        """
+        Busca en el diario una ejecución interrumpida con el mismo rango y modo
+        
+        Returns:
+            dict: lo leído por DiarioProgreso.leer(), o None para empezar de cero
+        """
+        pendiente = self.progreso.leer()
+        if pendiente is None:
+            return None
+        inicio = pendiente['inicio']
+        if inicio['rango'] != list(rango) or inicio['incremental'] != incremental:
+            print(f"⚠️ Se descarta el progreso de una ejecución interrumpida con otro rango "
+                  f"({inicio['fecha']})")
+            return None
+        
+        # El diario solo vale para el mismo santos.csv: con las filas asentadas todavía en
+        # su lugar, o tal cual lo dejó la compactación final de la ejecución anterior
+        if self.sumidero is not None:
+            self.sumidero.cerrar()
+            self.sumidero = None
+        sumidero = SumideroCSV(self.archivo_csv)
+        mismo_archivo = (sumidero.identidad() == inicio['csv']['inodo']
+                         and sumidero.contiene(pendiente['csv']))
+        compactado = (not mismo_archivo and pendiente['compactado'] is not None
+                      and sumidero.huella() == pendiente['compactado'])
+        if not mismo_archivo and not compactado:
+            print(f"⚠️ Se descarta el progreso de la ejecución interrumpida del {inicio['fecha']}: "
+                  f"{self.archivo_csv} cambió desde entonces")
+            return None
+        
+        dias = [tuple(fecha) for fecha in inicio['dias']]
+        faltantes = [fecha for fecha in dias if fecha not in pendiente['dias']]
+        print(f"♻️  Retomando la ejecución interrumpida del {inicio['fecha']}: "
+              f"{len(dias) - len(faltantes)} de {len(dias)} días ya completos")
+        if faltantes:
+            mes, dia = faltantes[0]
+            print(f"   ↪️  Sigue desde el {dia:02d}/{mes:02d} ({len(faltantes)} día(s) pendientes)")
+        self.progreso.reanudar()
+        
+        # El CSV vuelve a como estaba al asentar el último día, con sus eliminaciones pendientes
+        self.sumidero = sumidero
+        if mismo_archivo:
+            self.sumidero.abrir(pendiente['csv'])
+            for claves, filas in pendiente['eliminaciones']:
+                self.sumidero.eliminar(claves, filas)
+        else:
+            # La ejecución anterior llegó a compactar el CSV: ya tiene todos sus días
+            self.sumidero.abrir()
+        santos = desde_filas(self.sumidero.leer(), os.path.basename(self.archivo_csv))
+        self.santos_existentes = SantosExistentes((santo.clave, santo) for santo in santos)
+        if self.base is not None:
+            # Las filas vivas del CSV recortado (el archivo todavía tiene las tapadas)
+            self.base.reemplazar(santos)
+        return pendiente
+    
+    def _csv(self):
+        """Sumidero de santos.csv, abierto al primer uso"""
+        if self.sumidero is None:
+            self.sumidero = SumideroCSV(self.archivo_csv)
+            self.sumidero.abrir()
+        return self.sumidero
+    
+    def _agregar_filas(self, datos):
+        """
+        Agrega filas al final del CSV (quedan en disco al volver) y a santos_existentes
+        
+        Returns:
+            dict: posición del CSV después de escribirlas
+        """
+        posicion = self._csv().agregar(datos)
+        santos = [Santo.desde_fila(dato) for dato in datos]
+        for santo in santos:
+            self.santos_existentes[santo.clave] = santo
+        if self.base is not None:
+            self.base.agregar(santos)
+        return posicion
+    
+    def _compactar_csv(self):
+        """Aplica las eliminaciones pendientes reescribiendo el CSV una sola vez"""
+        if self.sumidero is None:
+            return
+        descartadas = self.sumidero.compactar()
+        if descartadas:
+            print(f"🗜️  CSV compactado: {descartadas} fila(s) reemplazadas o eliminadas")
+        self.sumidero.cerrar()
+        try:
+            # Si se corta antes de borrar el diario, al retomar se reconoce este CSV
+            self.progreso.registrar_compactado(self.sumidero.huella())
+        except Exception as e:
+            print(f"  ⚠️ No se pudo registrar la compactación en el diario de progreso: {e}")
+        self.sumidero = None
+        if self.base is not None:
+            self.base.marcar_sincronizada(self.archivo_csv)
+    
+    def _sincronizar_base(self):
+        """Vuelve a importar santos.csv en la base SQLite si cambió por fuera del scraper"""
+        if self.base is None:
+            return
+        try:
+            self.base.sincronizar_csv(self.archivo_csv)
+        except Exception as e:
+            print(f"  ⚠️ Error sincronizando la base {self.base.ruta}: {e}")
+    
     def generar_csv(self, datos):
-        """Genera el archivo CSV con todos los datos"""
+        """Agrega al archivo CSV los santos indicados"""
         print("📝 Actualizando archivo CSV...")
+        self._agregar_filas(datos)
+        print(f"✅ Archivo {self.archivo_csv} actualizado con {len(datos)} santos nuevos\n")
+    
+    def _cargar_revisiones(self):
+        """Carga las revisiones de Wikipedia guardadas junto a santos.csv"""
+        if os.path.exists(self.archivo_revisiones):
+            try:
+                with open(self.archivo_revisiones, 'r', encoding='utf-8') as f:
+                    revisiones = json.load(f)
+                revisiones.setdefault('dias', {})
+                revisiones.setdefault('articulos', {})
+                return revisiones
+            except Exception as e:
+                print(f"⚠️ Error al cargar revisiones guardadas: {e}")
+        return {'dias': {}, 'articulos': {}}
+    
+    def _guardar_revisiones(self):
+        """Guarda las revisiones (escritura atómica)"""
+        temporal = self.archivo_revisiones + '.tmp'
+        with open(temporal, 'w', encoding='utf-8') as f:
+            json.dump(self.revisiones, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(temporal, self.archivo_revisiones)
+    
+    def _consultar_revisiones(self, titulos):
+        """Revisión actual (lastrevid) de cada título, en lotes de 50 con prop=info"""
+        if not titulos:
+            return {}
+        paginas = self.api.consultar_titulos(titulos, {'prop': 'info', 'redirects': '1'})
+        return {titulo: pagina['lastrevid'] for titulo, pagina in paginas.items()
+                if not pagina.get('missing') and pagina.get('lastrevid')}
+    
+    def _consultar_revisiones_articulos(self, urls):
+        """Como _consultar_revisiones pero indexado por URL del artículo"""
+        titulos = {url: titulo_desde_url(url) for url in dict.fromkeys(urls)}
+        por_titulo = self._consultar_revisiones(list(set(titulos.values())))
+        return {url: por_titulo[titulo] for url, titulo in titulos.items() if titulo in por_titulo}
+    
+    def _planificar_incremental(self, dias):
+        """
+        Compara las revisiones guardadas con las actuales de Wikipedia
         
-        archivo_existe = os.path.exists(self.archivo_csv)
+        Returns:
+            tuple: (días cuya página cambió, filas existentes cuyo artículo cambió)
+        """
+        print("🔎 Consultando revisiones actuales en Wikipedia...")
+        titulos = {titulo_pagina_dia(mes, dia): (mes, dia) for mes, dia in dias}
+        actuales = self._consultar_revisiones(list(titulos))
+        
+        dias_cambiados = []
+        for titulo, (mes, dia) in titulos.items():
+            clave = f"{mes}-{dia}"
+            revid = actuales.get(titulo)
+            if revid:
+                self._revisiones_actuales['dias'][clave] = revid
+            if revid is None or self.revisiones['dias'].get(clave) != revid:
+                dias_cambiados.append((mes, dia))
+        
+        # En los días sin cambios, buscar santos cuyo artículo se editó
+        sin_cambios = set(dias) - set(dias_cambiados)
+        filas = [row for fecha in dias if fecha in sin_cambios
+                 for row in self.santos_existentes.del_dia(*fecha).values() if row.get('url_wikipedia')]
+        revisiones_articulos = self._consultar_revisiones_articulos([row['url_wikipedia'] for row in filas])
+        
+        santos_cambiados = []
+        for row in filas:
+            url = row['url_wikipedia']
+            revid = revisiones_articulos.get(url)
+            if revid is None:
+                continue
+            guardada = self.revisiones['articulos'].get(url)
+            if guardada is None:
+                # Sin revisión previa: se toma la actual como referencia
+                self._revisiones_actuales['articulos'][url] = revid
+            elif guardada != revid:
+                santos_cambiados.append(row)
+        
+        print(f"  ✅ Días con cambios: {len(dias_cambiados)} de {len(dias)} | "
+              f"Santos con artículo modificado: {len(santos_cambiados)}")
+        return dias_cambiados, santos_cambiados
+    
+    def _refrescar_santos(self, filas):
+        """Vuelve a procesar santos ya eliminados del CSV (artículos modificados)"""
+        print(f"🔄 Actualizando {len(filas)} santo(s) con artículo modificado...")
+        santos_info = [{'nombre': row['nombre'], 'url_wikipedia': row['url_wikipedia']} for row in filas]
+        self._precargar_info_santos(santos_info)
         
-        with open(self.archivo_csv, 'a' if archivo_existe else 'w', newline='', encoding='utf-8') as f:
-            campos = ['mes', 'dia', 'nombre', 'prioridad', 'descripcion', 'imagen', 'url_wikipedia', 'etiquetas', 'oracion']
-            writer = csv.DictWriter(f, fieldnames=campos)
-            
-            if not archivo_existe:
-                writer.writeheader()
+        resultados = []
+        for row, santo_info in zip(filas, santos_info):
+            resultado = self.procesar_santo(int(row['mes']), int(row['dia']), santo_info)
+            if resultado:
+                resultados.append(resultado)
+        return resultados
+    
+    def _registrar_revisiones(self, dias, datos):
+        """Guarda las revisiones de los días procesados y de los artículos usados"""
+        dias_ok = [(mes, dia) for mes, dia in dias if (mes, dia) not in self._dias_con_error]
+        try:
+            faltantes = {titulo_pagina_dia(mes, dia): f"{mes}-{dia}" for mes, dia in dias_ok
+                         if f"{mes}-{dia}" not in self._revisiones_actuales['dias']}
+            for titulo, revid in self._consultar_revisiones(list(faltantes)).items():
+                self._revisiones_actuales['dias'][faltantes[titulo]] = revid
             
-            for dato in datos:
-                # Asegurar que etiquetas existe
-                if 'etiquetas' not in dato:
-                    dato['etiquetas'] = ''
-                writer.writerow(dato)
-                clave = f"{dato['mes']}-{dato['dia']}-{dato['nombre']}"
-                self.santos_existentes[clave] = dato
+            urls = [dato['url_wikipedia'] for dato in datos
+                    if dato.get('url_wikipedia') and dato['url_wikipedia'] not in self._revisiones_actuales['articulos']]
+            self._revisiones_actuales['articulos'].update(self._consultar_revisiones_articulos(urls))
+        except Exception as e:
+            print(f"⚠️ No se pudieron consultar todas las revisiones: {e}")
         
-        print(f"✅ Archivo {self.archivo_csv} actualizado con {len(datos)} santos nuevos\n")
+        for mes, dia in dias_ok:
+            clave = f"{mes}-{dia}"
+            if self._revisiones_actuales['dias'].get(clave):
+                self.revisiones['dias'][clave] = self._revisiones_actuales['dias'][clave]
+        self.revisiones['articulos'].update(self._revisiones_actuales['articulos'])
+        
+        try:
+            self._guardar_revisiones()
+        except Exception as e:
+            print(f"⚠️ Error guardando revisiones: {e}")
+    
+    def _describir_ritmo(self):
+        """Describe el ritmo del limitador para mostrarlo por pantalla"""
+        if replay_activo():
+            return "sin red (replay)"
+        return self.limitador.describir()
+    
+    def _dias_en_rango(self, mes_inicio, dia_inicio, mes_fin, dia_fin):
+        """Lista de tuplas (mes, dia) a procesar, en orden"""
+        # Días por mes
+        dias_por_mes = {
+            1: 31, 2: 29, 3: 31, 4: 30, 5: 31, 6: 30,
+            7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31
+        }
+        
+        dias = []
+        for mes in range(mes_inicio, mes_fin + 1):
+            inicio = dia_inicio if mes == mes_inicio else 1
+            fin = dia_fin if mes == mes_fin else dias_por_mes[mes]
+            
+            for dia in range(inicio, fin + 1):
+                dias.append((mes, dia))
+        return dias
     
-    def ejecutar(self, mes_inicio=1, dia_inicio=1, mes_fin=12, dia_fin=31, eliminar_existentes=None):
+    def ejecutar(self, mes_inicio=1, dia_inicio=1, mes_fin=12, dia_fin=31, eliminar_existentes=None,
+                 pipeline=None, incremental=False):
         """
         Ejecuta el scraping para el rango de fechas especificado
         
@@ -810,34 +1561,138 @@ class SantosWikipediaScraper:
             mes_fin: mes final
             dia_fin: día final
             eliminar_existentes: None (preguntar), True (eliminar siempre), False (nunca eliminar)
+            pipeline: None (sin pipeline), True (pipeline con trabajadores por defecto) o
+                      dict con hilos por etapa, ej: {'santoral': 2, 'articulos': 4, 'imagenes': 8}
+            incremental: Si True, solo reprocesa los días cuya página de Wikipedia cambió desde
+                         la última ejecución (reemplazando sus santos) y los santos cuyo artículo
+                         cambió. Las revisiones se guardan en data/santos_revisiones.json
+        
+        Cada día terminado se asienta en data/santos_progreso.jsonl: si una ejecución con el
+        mismo rango quedó cortada, se retoma desde el primer día sin terminar (ver progreso_santos.py)
         """
         print("=" * 60)
         print("🔥 SCRAPER DE CALENDARIO DE SANTOS (Wikipedia)")
         print("=" * 60)
         print(f"📅 Procesando desde {dia_inicio:02d}/{mes_inicio:02d} hasta {dia_fin:02d}/{mes_fin:02d}")
         print(f"📥 Descarga de imágenes: {'✅ ACTIVADA' if self.descargar_imagenes else '❌ DESACTIVADA'}")
+        if pipeline:
+            print(f"🏭 Modo pipeline | Ritmo máximo: {self._describir_ritmo()}")
+        else:
+            print(f"🧵 Hilos: {self.hilos} | Ritmo máximo: {self._describir_ritmo()}")
         print("=" * 60)
         print()
         
-        todos_los_datos = []
-        
-        # Días por mes
-        dias_por_mes = {
-            1: 31, 2: 29, 3: 31, 4: 30, 5: 31, 6: 30,
-            7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31
-        }
+        self._interrumpido = False
+        rango = (mes_inicio, dia_inicio, mes_fin, dia_fin)
+        dias = self._dias_en_rango(*rango)
+        santos_a_refrescar = []
+        refrescados = None
+        
+        # Con una ejecución interrumpida del mismo rango se retoma su plan y sus días terminados
+        pendiente = self._retomar_progreso(rango, incremental)
+        if pendiente is not None:
+            dias = [tuple(fecha) for fecha in pendiente['inicio']['dias']]
+            santos_a_refrescar = pendiente['inicio']['refrescar']
+            refrescados = pendiente['refresco']
+            self._filas_por_dia = dict(pendiente['dias'])
+        else:
+            self._filas_por_dia = {}
+            if incremental:
+                dias, santos_a_refrescar = self._planificar_incremental(dias)
+                santos_a_refrescar = [santo.a_dict() for santo in santos_a_refrescar]
+            sumidero = self._csv()
+            self.progreso.iniciar(rango, incremental, dias, santos_a_refrescar,
+                                  dict(sumidero.posicion(), inodo=sumidero.identidad()))
+        
+        if incremental:
+            # Los días cuya página cambió se recalculan completos
+            eliminar_existentes = True
+            if refrescados is None:
+                self._eliminar_santos(clave_santo(row) for row in santos_a_refrescar)
+        
+        # Días ya asentados en el diario: no se vuelven a pedir ni a preparar
+        pendientes = [fecha for fecha in dias if fecha not in self._filas_por_dia]
         
-        for mes in range(mes_inicio, mes_fin + 1):
-            inicio = dia_inicio if mes == mes_inicio else 1
-            fin = dia_fin if mes == mes_fin else dias_por_mes[mes]
+        try:
+            if self.volcado is not None and pendientes:
+                self.precargar_desde_volcado(pendientes)
+            elif replay_activo() and self.motor_santoral == 'html' and pendientes:
+                # Sin red de por medio, el parseo se reparte entre todos los núcleos
+                self.precargar_desde_archivo(pendientes)
+            elif self.motor_santoral == 'wikitext' and pendientes:
+                self.precargar_santoral_wikitext(pendientes)
+                if self.enriquecimiento == 'api':
+                    # Con todo el santoral conocido, la información se pide en lotes de varios días
+                    urls = [santo['url_wikipedia'] for santos, _ in self._santoral_precargado.values()
+                            for santo in santos if santo['url_wikipedia']]
+                    self.obtener_info_wikipedia_lote(urls)
             
-            for dia in range(inicio, fin + 1):
-                datos = self.procesar_dia(mes, dia, eliminar_existentes=eliminar_existentes)
-                todos_los_datos.extend(datos)
-        
-        # Generar CSV
-        if todos_los_datos:
-            self.generar_csv(todos_los_datos)
+            if pipeline:
+                for mes, dia in pendientes:
+                    self._preparar_dia(mes, dia, eliminar_existentes)
+                
+                # El pipeline avisa cada día completo con _dia_terminado
+                trabajadores = pipeline if isinstance(pipeline, dict) else None
+                PipelineSantos(self, trabajadores=trabajadores).ejecutar(pendientes)
+            elif self.hilos == 1:
+                for mes, dia in pendientes:
+                    self._dia_terminado(mes, dia, self.procesar_dia(mes, dia, eliminar_existentes=eliminar_existentes))
+            else:
+                # Las decisiones sobre datos existentes (que pueden preguntar) se toman antes,
+                # en el hilo principal; luego los días se descargan en paralelo
+                for mes, dia in pendientes:
+                    self._preparar_dia(mes, dia, eliminar_existentes)
+                
+                executor = ThreadPoolExecutor(max_workers=self.hilos)
+                try:
+                    # Cada hilo asienta su día en el diario apenas lo termina
+                    list(executor.map(lambda fecha: self._procesar_y_registrar_dia(*fecha), pendientes))
+                except KeyboardInterrupt:
+                    # Los días sin empezar se cancelan; los que están en curso ya no escriben
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+                executor.shutdown()
+            
+            if santos_a_refrescar and refrescados is None:
+                refrescados = self._refrescar_santos(santos_a_refrescar)
+                with self._lock_escritura:
+                    self.progreso.registrar_refresco(refrescados, self._agregar_filas(refrescados))
+        except KeyboardInterrupt:
+            with self._lock_escritura:
+                # Espera a que termine una escritura en curso y corta las siguientes
+                self._interrumpido = True
+            hechos = sum(1 for fecha in dias if fecha in self._filas_por_dia and fecha not in self._dias_con_error)
+            print(f"\n⏸️  Interrumpido: {hechos} de {len(dias)} días quedaron guardados en {self.progreso.ruta}")
+            print("   Vuelve a ejecutar el mismo comando para continuar desde el primer día sin terminar")
+            self.progreso.cerrar(borrar=False)
+            if self.sumidero is not None:
+                self.sumidero.cerrar()
+            raise
+        
+        # Las filas ya están en el CSV; falta descartar las reemplazadas, en una sola pasada
+        todos_los_datos = [fila for fecha in dias for fila in self._filas_por_dia.get(fecha, [])]
+        todos_los_datos.extend(refrescados or [])
+        self._compactar_csv()
+        print(f"✅ Archivo {self.archivo_csv} actualizado con {len(todos_los_datos)} santos nuevos\n")
+        
+        self._borrar_imagenes_huerfanas()
+        
+        if self.volcado is None:
+            self._registrar_revisiones(dias, todos_los_datos)
+        
+        # Todo quedó en el CSV: el diario ya no hace falta
+        self.progreso.cerrar()
+        
+        self.descargador.cerrar()
+        self.descargador.imprimir_resumen()
+        cache_compartida().imprimir_resumen()
+        self.limitador.imprimir_resumen()
+        imprimir_resumen_resiliencia()
+        
+        if self._dias_con_error:
+            fechas = ', '.join(f"{dia:02d}/{mes:02d}" for mes, dia in sorted(self._dias_con_error))
+            print(f"❌ {len(self._dias_con_error)} día(s) quedaron sin datos por errores "
+                  f"(se reintentarán en la próxima ejecución): {fechas}")
         
         print("=" * 60)
         print("🎉 PROCESO COMPLETADO")
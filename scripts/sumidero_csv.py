@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Escritura incremental de santos.csv
+===================================
+SumideroCSV escribe el CSV como un flujo durante la ejecución del scraper:
+
+- agregar() suma al final las filas de cada día apenas termina (flush + fsync).
+- eliminar() no toca el archivo: deja una "tumba" en memoria por clave
+  "mes-dia-nombre", que tapa las filas con esa clave escritas hasta ese momento
+  (las que se agreguen después con la misma clave siguen vivas).
+- compactar() reescribe el archivo una sola vez, al final, sin las filas tapadas
+  (escritura atómica con os.replace).
+- Las columnas del archivo existente que no están en CAMPOS se conservan: se
+  escribe con el encabezado real del archivo (completado con las de CAMPOS
+  que le falten), no solo con CAMPOS.
+
+Así un año completo con reemplazo de datos lee y escribe el CSV una vez, en
+lugar de reescribirlo entero por cada día recalculado.
+
+Uso:
+    sumidero = SumideroCSV('data/santos.csv')
+    sumidero.abrir()
+    sumidero.eliminar(claves_del_dia)
+    sumidero.agregar(filas_del_dia)
+    sumidero.compactar()
+    sumidero.cerrar()
+"""
+
+import csv
+import hashlib
+import io
+import os
+import threading
+
+CAMPOS = ['mes', 'dia', 'nombre', 'prioridad', 'descripcion', 'imagen', 'url_wikipedia', 'etiquetas', 'oracion']
+
+
+def clave_santo(fila):
+    """Clave "mes-dia-nombre" de una fila (la misma que usa santos_existentes)"""
+    return f"{fila['mes']}-{fila['dia']}-{fila['nombre']}"
+
+
+class SumideroCSV:
+    def __init__(self, ruta, campos=CAMPOS):
+        """
+        Args:
+            ruta (str): Archivo CSV
+            campos (list): Columnas del CSV (si el archivo ya existe, abrir() usa su
+                           encabezado, con las columnas extra que tenga)
+        """
+        self.ruta = ruta
+        self.campos = campos
+        self.filas = 0  # Filas de datos en el archivo (vivas y tapadas)
+        self.tumbas = {}  # clave -> cantidad de filas del archivo que tapa (las primeras)
+        self._archivo = None
+        self._writer = None
+        self._lock = threading.Lock()
+
+    def abrir(self, posicion=None):
+        """
+        Abre el CSV para agregar filas (lo crea con encabezado si no existe)
+
+        Args:
+            posicion (dict): {'bytes': n, 'filas': n} de posicion(), para retomar: el archivo
+                             se trunca ahí (descarta lo escrito después, ej. una línea cortada).
+                             Default: None, se cuentan las filas actuales
+        """
+        with self._lock:
+            self._cerrar_archivo()
+            self.tumbas = {}
+            if not os.path.exists(self.ruta) or os.path.getsize(self.ruta) == 0:
+                with open(self.ruta, 'w', newline='', encoding='utf-8') as f:
+                    csv.DictWriter(f, fieldnames=self.campos).writeheader()
+                self.filas = 0
+            else:
+                if posicion is None:
+                    self.filas = sum(1 for _ in self._leer_archivo())
+                else:
+                    if os.path.getsize(self.ruta) > posicion['bytes']:
+                        os.truncate(self.ruta, posicion['bytes'])
+                    self.filas = posicion['filas']
+                encabezado = self._encabezado()
+                faltantes = [campo for campo in self.campos if campo not in encabezado]
+                # Se conservan las columnas extra del archivo, en su orden
+                self.campos = encabezado + faltantes
+                if faltantes:
+                    # Las filas nuevas tendrían más valores que el encabezado: se completa una vez
+                    self._reescribir(self._leer_archivo())
+            self._archivo = open(self.ruta, 'a', newline='', encoding='utf-8')
+            self._writer = csv.DictWriter(self._archivo, fieldnames=self.campos)
+
+    def agregar(self, filas):
+        """
+        Agrega filas al final y las lleva a disco
+
+        Returns:
+            dict: posicion() después de escribirlas
+        """
+        with self._lock:
+            for fila in filas:
+                # Asegurar que etiquetas existe
+                fila.setdefault('etiquetas', '')
+            self._writer.writerows(filas)
+            self._archivo.flush()
+            os.fsync(self._archivo.fileno())
+            self.filas += len(filas)
+            return self._posicion()
+
+    def eliminar(self, claves, filas=None):
+        """
+        Tapa las filas ya escritas con esas claves (se descartan al compactar)
+
+        Args:
+            claves: Claves "mes-dia-nombre"
+            filas (int): Filas del archivo a las que aplica (para retomar). Default: todas las actuales
+
+        Returns:
+            int: filas a las que aplica
+        """
+        with self._lock:
+            hasta = self.filas if filas is None else filas
+            for clave in claves:
+                self.tumbas[clave] = max(hasta, self.tumbas.get(clave, 0))
+            return hasta
+
+    def posicion(self):
+        """{'bytes': tamaño del archivo, 'filas': filas de datos} hasta lo último escrito"""
+        with self._lock:
+            return self._posicion()
+
+    def _posicion(self):
+        return {'bytes': os.fstat(self._archivo.fileno()).st_size, 'filas': self.filas}
+
+    def identidad(self):
+        """Identifica al archivo físico: cambia cuando compactar() lo reemplaza"""
+        return os.stat(self.ruta).st_ino if os.path.exists(self.ruta) else None
+
+    def huella(self):
+        """
+        Identifica al archivo y su contenido: inodo, tamaño y sha256
+
+        Returns:
+            dict: {'inodo': n, 'bytes': n, 'sha256': '...'} o None si el archivo no existe
+        """
+        if not os.path.exists(self.ruta):
+            return None
+        h = hashlib.sha256()
+        with open(self.ruta, 'rb') as f:
+            for bloque in iter(lambda: f.read(1 << 20), b''):
+                h.update(bloque)
+        estado = os.stat(self.ruta)
+        return {'inodo': estado.st_ino, 'bytes': estado.st_size, 'sha256': h.hexdigest()}
+
+    def contiene(self, posicion):
+        """
+        Si el archivo todavía tiene, hasta posicion['bytes'], exactamente posicion['filas']
+        filas de datos (falla si otro programa lo reescribió en el lugar, ej. más corto)
+
+        Args:
+            posicion (dict): {'bytes': n, 'filas': n} de posicion()
+        """
+        if not os.path.exists(self.ruta) or os.path.getsize(self.ruta) < posicion['bytes']:
+            return False
+        with open(self.ruta, 'rb') as f:
+            inicio = f.read(posicion['bytes'])
+        try:
+            texto = inicio.decode('utf-8')
+        except UnicodeDecodeError:
+            return False
+        return sum(1 for _ in csv.DictReader(io.StringIO(texto, newline=''))) == posicion['filas']
+
+    def leer(self):
+        """Filas vivas del archivo (sin las tapadas), en orden"""
+        for indice, fila in enumerate(self._leer_archivo()):
+            hasta = self.tumbas.get(clave_santo(fila))
+            if hasta is None or indice >= hasta:
+                yield fila
+
+    def _encabezado(self):
+        with open(self.ruta, 'r', newline='', encoding='utf-8') as f:
+            return next(csv.reader(f), [])
+
+    def _leer_archivo(self):
+        with open(self.ruta, 'r', newline='', encoding='utf-8') as f:
+            yield from csv.DictReader(f)
+
+    def compactar(self):
+        """
+        Reescribe el archivo una vez sin las filas tapadas
+
+        Returns:
+            int: filas descartadas
+        """
+        with self._lock:
+            if not self.tumbas:
+                return 0
+            self._cerrar_archivo()
+            vivas = self._reescribir(self.leer())
+
+            descartadas = self.filas - vivas
+            self.filas = vivas
+            self.tumbas = {}
+            self._archivo = open(self.ruta, 'a', newline='', encoding='utf-8')
+            self._writer = csv.DictWriter(self._archivo, fieldnames=self.campos)
+            return descartadas
+
+    def _reescribir(self, filas):
+        """Reemplaza el archivo (escritura atómica) por el encabezado de campos y esas filas"""
+        temporal = self.ruta + '.tmp'
+        escritas = 0
+        with open(temporal, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=self.campos)
+            writer.writeheader()
+            for fila in filas:
+                writer.writerow(fila)
+                escritas += 1
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, self.ruta)
+        return escritas
+
+    def cerrar(self):
+        with self._lock:
+            self._cerrar_archivo()
+
+    def _cerrar_archivo(self):
+        if self._archivo is not None:
+            self._archivo.close()
+            self._archivo = None
+            self._writer = None
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Verificador de imágenes de santos
+=================================
+Revisa en paralelo todos los archivos de web/images y los cruza con la
+columna 'imagen' de data/santos.csv:
+
+- Cabecera: formato real (JPEG, PNG, GIF, WebP) y dimensiones, leyendo solo
+  los primeros bytes (sin decodificar la imagen, así escala a decenas de
+  miles de archivos).
+- Integridad: archivos vacíos, cabeceras inválidas y archivos truncados (sin
+  el marcador de fin de JPEG/PNG/GIF o más cortos que lo que declara WebP).
+- Huérfanas: archivos que ninguna fila del CSV usa.
+- Referencias rotas: filas que apuntan a un archivo inexistente o corrupto.
+
+Uso:
+    python3 scripts/verificar_imagenes.py                         # solo informe
+    python3 scripts/verificar_imagenes.py --borrar-huerfanas      # borra las no referenciadas
+    python3 scripts/verificar_imagenes.py --limpiar-referencias   # vacía 'imagen' en filas rotas
+    python3 scripts/verificar_imagenes.py --borrar-corruptas      # borra las corruptas
+    python3 scripts/verificar_imagenes.py --json=informe.json     # detalle por archivo
+"""
+
+import csv
+import json
+import os
+import struct
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from descargador_imagenes import ManifiestoImagenes
+
+# Rutas relativas al directorio raíz del proyecto
+DIRECTORIO_BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIRECTORIO_IMAGENES = os.path.join(DIRECTORIO_BASE, "web", "images")
+ARCHIVO_CSV = os.path.join(DIRECTORIO_BASE, "data", "santos.csv")
+ARCHIVO_MANIFIESTO = os.path.join(DIRECTORIO_BASE, "data", "imagenes_manifest.json")
+
+EXTENSIONES_IMAGEN = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+
+# Extensión esperada para cada formato detectado
+EXTENSIONES_POR_FORMATO = {
+    'jpeg': ('.jpg', '.jpeg'),
+    'png': ('.png',),
+    'gif': ('.gif',),
+    'webp': ('.webp',),
+}
+
+# Bytes finales donde se busca el fin de imagen de un JPEG (admite relleno tras el marcador)
+COLA_JPEG = 1024
+
+# Cuántos nombres se listan por categoría en el informe
+MAX_LISTADO = 20
+
+_FIN_PNG = b'\x00\x00\x00\x00IEND\xaeB`\x82'
+
+
+class ImagenInvalida(Exception):
+    pass
+
+
+def _dimensiones_jpeg(f):
+    """Recorre los segmentos hasta el SOF (start of frame), que trae alto y ancho"""
+    f.seek(2)
+    while True:
+        marca = f.read(1)
+        while marca == b'\xff':
+            marca = f.read(1)
+        if not marca:
+            raise ImagenInvalida("JPEG sin marcador SOF")
+        codigo = marca[0]
+        if codigo == 0xD9 or codigo == 0xDA:
+            # Fin de imagen o inicio de los datos sin haber visto el SOF
+            raise ImagenInvalida("JPEG sin marcador SOF")
+        if 0xD0 <= codigo <= 0xD7 or codigo == 0x01:
+            continue
+        longitud = f.read(2)
+        if len(longitud) < 2:
+            raise ImagenInvalida("JPEG truncado en la cabecera")
+        longitud = struct.unpack('>H', longitud)[0]
+        if 0xC0 <= codigo <= 0xCF and codigo not in (0xC4, 0xC8, 0xCC):
+            datos = f.read(5)
+            if len(datos) < 5:
+                raise ImagenInvalida("JPEG truncado en la cabecera")
+            alto, ancho = struct.unpack('>HH', datos[1:5])
+            return ancho, alto
+        f.seek(longitud - 2, os.SEEK_CUR)
+        marca = f.read(1)
+        if marca != b'\xff':
+            raise ImagenInvalida("JPEG con segmentos corruptos")
+
+
+def _dimensiones_webp(cabecera):
+    fragmento = cabecera[12:16]
+    if fragmento == b'VP8 ' and len(cabecera) >= 30:
+        ancho, alto = struct.unpack('<HH', cabecera[26:30])
+        return ancho & 0x3FFF, alto & 0x3FFF
+    if fragmento == b'VP8L' and len(cabecera) >= 25:
+        bits = struct.unpack('<I', cabecera[21:25])[0]
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if fragmento == b'VP8X' and len(cabecera) >= 30:
+        ancho = int.from_bytes(cabecera[24:27], 'little') + 1
+        alto = int.from_bytes(cabecera[27:30], 'little') + 1
+        return ancho, alto
+    raise ImagenInvalida("WebP con cabecera desconocida")
+
+
+def inspeccionar_imagen(ruta):
+    """
+    Lee la cabecera y el final de una imagen
+
+    Returns:
+        dict: {'formato', 'ancho', 'alto', 'tamano', 'error'} ('error' es None si la imagen está bien)
+    """
+    resultado = {'formato': None, 'ancho': None, 'alto': None, 'tamano': 0, 'error': None}
+    try:
+        tamano = os.path.getsize(ruta)
+        resultado['tamano'] = tamano
+        if tamano == 0:
+            raise ImagenInvalida("archivo vacío")
+
+        with open(ruta, 'rb') as f:
+            cabecera = f.read(32)
+            if cabecera[:3] == b'\xff\xd8\xff':
+                resultado['formato'] = 'jpeg'
+                resultado['ancho'], resultado['alto'] = _dimensiones_jpeg(f)
+                f.seek(max(0, tamano - COLA_JPEG))
+                if b'\xff\xd9' not in f.read():
+                    raise ImagenInvalida("JPEG truncado (sin marcador de fin)")
+            elif cabecera[:8] == b'\x89PNG\r\n\x1a\n':
+                resultado['formato'] = 'png'
+                if cabecera[12:16] != b'IHDR' or len(cabecera) < 24:
+                    raise ImagenInvalida("PNG sin IHDR")
+                resultado['ancho'], resultado['alto'] = struct.unpack('>II', cabecera[16:24])
+                f.seek(max(0, tamano - len(_FIN_PNG)))
+                if f.read() != _FIN_PNG:
+                    raise ImagenInvalida("PNG truncado (sin IEND)")
+            elif cabecera[:6] in (b'GIF87a', b'GIF89a'):
+                resultado['formato'] = 'gif'
+                resultado['ancho'], resultado['alto'] = struct.unpack('<HH', cabecera[6:10])
+                f.seek(tamano - 1)
+                if f.read(1) != b';':
+                    raise ImagenInvalida("GIF truncado (sin terminador)")
+            elif cabecera[:4] == b'RIFF' and cabecera[8:12] == b'WEBP':
+                resultado['formato'] = 'webp'
+                resultado['ancho'], resultado['alto'] = _dimensiones_webp(cabecera)
+                if struct.unpack('<I', cabecera[4:8])[0] + 8 > tamano:
+                    raise ImagenInvalida("WebP truncado")
+            else:
+                raise ImagenInvalida("no es una imagen reconocible (¿HTML de error?)")
+
+        if not resultado['ancho'] or not resultado['alto']:
+            raise ImagenInvalida("dimensiones nulas")
+    except ImagenInvalida as e:
+        resultado['error'] = str(e)
+    except OSError as e:
+        resultado['error'] = f"no se pudo leer: {e}"
+    return resultado
+
+
+class VerificadorImagenes:
+    def __init__(self, directorio=DIRECTORIO_IMAGENES, archivo_csv=ARCHIVO_CSV, hilos=None):
+        """
+        Args:
+            directorio (str): Carpeta de las imágenes (web/images)
+            archivo_csv (str): CSV de santos a cruzar
+            hilos (int): Archivos revisados en paralelo. Default: 4 por núcleo
+        """
+        self.directorio = directorio
+        self.archivo_csv = archivo_csv
+        self.hilos = hilos or min(32, (os.cpu_count() or 1) * 4)
+
+    def _leer_csv(self):
+        if not os.path.exists(self.archivo_csv):
+            return [], None
+        with open(self.archivo_csv, 'r', encoding='utf-8') as f:
+            lector = csv.DictReader(f)
+            return list(lector), lector.fieldnames
+
+    def _escribir_csv(self, filas, campos):
+        temporal = self.archivo_csv + '.tmp'
+        with open(temporal, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=campos)
+            writer.writeheader()
+            writer.writerows(filas)
+        os.replace(temporal, self.archivo_csv)
+
+    def revisar(self):
+        """
+        Inspecciona todas las imágenes y las cruza con el CSV
+
+        Returns:
+            dict: {'archivos': {nombre: inspección + 'referencias'}, 'corruptas': [...], 'huerfanas': [...],
+                   'faltantes': {nombre: filas}, 'parciales': [...], 'extension_incorrecta': [...]}
+        """
+        nombres = []
+        parciales = []
+        with os.scandir(self.directorio) as entradas:
+            for entrada in entradas:
+                if not entrada.is_file():
+                    continue  # ej: variantes/
+                if entrada.name.endswith('.part'):
+                    parciales.append(entrada.name)
+                elif entrada.name.lower().endswith(EXTENSIONES_IMAGEN):
+                    nombres.append(entrada.name)
+        nombres.sort()
+
+        with ThreadPoolExecutor(max_workers=self.hilos) as executor:
+            inspecciones = executor.map(lambda n: inspeccionar_imagen(os.path.join(self.directorio, n)), nombres)
+            archivos = dict(zip(nombres, inspecciones))
+
+        filas, _ = self._leer_csv()
+        for info in archivos.values():
+            info['referencias'] = 0
+        faltantes = {}
+        for fila in filas:
+            imagen = fila.get('imagen')
+            if not imagen:
+                continue
+            if imagen in archivos:
+                archivos[imagen]['referencias'] += 1
+            else:
+                faltantes[imagen] = faltantes.get(imagen, 0) + 1
+
+        return {
+            'archivos': archivos,
+            'corruptas': sorted(n for n, i in archivos.items() if i['error']),
+            'huerfanas': sorted(n for n, i in archivos.items() if not i['referencias']),
+            'faltantes': faltantes,
+            'parciales': sorted(parciales),
+            'extension_incorrecta': sorted(
+                n for n, i in archivos.items()
+                if i['formato'] and not n.lower().endswith(EXTENSIONES_POR_FORMATO[i['formato']])),
+        }
+
+    def ejecutar(self, borrar_huerfanas=False, limpiar_referencias=False, borrar_corruptas=False, ruta_json=None):
+        """
+        Revisa las imágenes, imprime el informe y aplica las correcciones pedidas
+
+        Args:
+            borrar_huerfanas (bool): Borra los archivos que ninguna fila usa
+            limpiar_referencias (bool): Vacía la columna 'imagen' de las filas que apuntan
+                                        a archivos inexistentes o corruptos
+            borrar_corruptas (bool): Borra los archivos corruptos
+            ruta_json (str): Si se indica, guarda ahí el detalle por archivo
+
+        Returns:
+            dict: resultado de revisar()
+        """
+        print("=" * 60)
+        print("🔍 VERIFICACIÓN DE IMÁGENES")
+        print("=" * 60)
+        informe = self.revisar()
+        archivos = informe['archivos']
+        corruptas = set(informe['corruptas'])
+
+        print(f"📋 {len(archivos)} archivo(s) revisados con {self.hilos} hilo(s)")
+        self._listar("❌ Corruptas", [f"{n}: {archivos[n]['error']}" for n in informe['corruptas']])
+        self._listar("🔗 Referencias rotas (archivo inexistente)",
+                     [f"{n} ({c} fila(s))" for n, c in sorted(informe['faltantes'].items())])
+        bytes_huerfanas = sum(archivos[n]['tamano'] for n in informe['huerfanas'])
+        self._listar(f"👻 Huérfanas ({bytes_huerfanas / (1024 * 1024):.1f} MB)", informe['huerfanas'])
+        self._listar("🏷️  Extensión distinta del formato real",
+                     [f"{n} ({archivos[n]['formato']})" for n in informe['extension_incorrecta']])
+        self._listar("⏸️  Descargas parciales (.part)", informe['parciales'])
+
+        rotas = set(informe['faltantes']) | {n for n in corruptas if archivos[n]['referencias']}
+        if limpiar_referencias and rotas:
+            filas, campos = self._leer_csv()
+            limpiadas = 0
+            for fila in filas:
+                if fila.get('imagen') in rotas:
+                    fila['imagen'] = ''
+                    limpiadas += 1
+            self._escribir_csv(filas, campos)
+            print(f"🧹 {limpiadas} fila(s) sin imagen en {self.archivo_csv}")
+
+        a_borrar = set()
+        if borrar_huerfanas:
+            a_borrar.update(informe['huerfanas'])
+        if borrar_corruptas:
+            # Una corrupta referenciada solo se borra si también se limpian sus filas
+            a_borrar.update(n for n in corruptas if limpiar_referencias or not archivos[n]['referencias'])
+        if a_borrar:
+            self._borrar(sorted(a_borrar))
+
+        if ruta_json:
+            with open(ruta_json, 'w', encoding='utf-8') as f:
+                json.dump(informe, f, ensure_ascii=False, indent=1)
+            print(f"📝 Detalle guardado en {ruta_json}")
+
+        print("-" * 60)
+        print(f"✅ Correctas: {len(archivos) - len(corruptas)} | ❌ Corruptas: {len(corruptas)} | "
+              f"👻 Huérfanas: {len(informe['huerfanas'])} | 🔗 Rotas: {sum(informe['faltantes'].values())}")
+        print("-" * 60)
+        return informe
+
+    def _borrar(self, nombres):
+        manifiesto = ManifiestoImagenes(ARCHIVO_MANIFIESTO) if self.directorio == DIRECTORIO_IMAGENES else None
+        borradas = 0
+        for nombre in nombres:
+            try:
+                os.remove(os.path.join(self.directorio, nombre))
+                borradas += 1
+            except OSError as e:
+                print(f"  ⚠️ No se pudo borrar {nombre}: {e}")
+                continue
+            if manifiesto is not None:
+                manifiesto.olvidar_archivo(nombre)
+        if manifiesto is not None:
+            manifiesto.guardar()
+        print(f"🗑️  {borradas} archivo(s) eliminados")
+
+    def _listar(self, titulo, elementos):
+        if not elementos:
+            return
+        print(f"\n{titulo}: {len(elementos)}")
+        for elemento in elementos[:MAX_LISTADO]:
+            print(f"  - {elemento}")
+        if len(elementos) > MAX_LISTADO:
+            print(f"  ... y {len(elementos) - MAX_LISTADO} más")
+
+
+def main():
+    opciones = {'borrar_huerfanas': False, 'limpiar_referencias': False, 'borrar_corruptas': False,
+                'ruta_json': None}
+    for arg in sys.argv[1:]:
+        if arg == '--borrar-huerfanas':
+            opciones['borrar_huerfanas'] = True
+        elif arg == '--limpiar-referencias':
+            opciones['limpiar_referencias'] = True
+        elif arg == '--borrar-corruptas':
+            opciones['borrar_corruptas'] = True
+        elif arg.startswith('--json='):
+            opciones['ruta_json'] = arg.split('=', 1)[1]
+        else:
+            print(f"❌ Argumento desconocido: {arg}")
+            sys.exit(1)
+
+    VerificadorImagenes().ejecutar(**opciones)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lectura del volcado XML de Wikipedia en español (sin conexión)
+==============================================================
+Lee páginas concretas de un volcado multistream
+(eswiki-AAAAMMDD-pages-articles-multistream.xml.bz2) usando su índice
+(eswiki-AAAAMMDD-pages-articles-multistream-index.txt.bz2) para saltar
+directamente a los bloques bz2 que las contienen, sin descomprimir el resto.
+
+- El índice se recorre línea a línea ("offset:id:título"), guardando solo los
+  offsets de los títulos pedidos.
+- Cada bloque (unas 100 páginas) se descomprime y analiza en un proceso
+  aparte; en vuelo hay como máximo unos pocos bloques por proceso, así que la
+  memoria no depende del tamaño del volcado.
+- Las redirecciones se siguen hasta la página final.
+
+Los resultados se entregan ya reducidos: ítems del santoral para las páginas
+de días y primeros párrafos más imagen para los artículos de santos.
+"""
+
+import bz2
+import hashlib
+import io
+import os
+import re
+import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from urllib.parse import quote
+
+from descargador_imagenes import ANCHO_IMAGEN
+from santoral_wikitext import limpiar_wikitext, parsear_santoral_wikitext, texto_plano, titulo_pagina_dia
+
+URL_UPLOAD = "https://upload.wikimedia.org/wikipedia/commons"
+
+# Bytes leídos del volcado en cada paso al descomprimir un bloque
+TAMANO_LECTURA = 256 * 1024
+
+# Saltos máximos al seguir redirecciones encadenadas
+MAX_REDIRECCIONES = 3
+
+# Párrafos de la introducción que se devuelven por artículo
+MAX_PARRAFOS = 5
+
+_RE_PARAMETRO_IMAGEN = re.compile(r'^\s*\|\s*(?:imagen|image|foto)\s*=\s*([^|\n]*)', re.IGNORECASE | re.MULTILINE)
+_RE_ARCHIVO = re.compile(r'\[\[\s*(?:archivo|file|imagen|image)\s*:\s*([^|\]]+)', re.IGNORECASE)
+_RE_PREFIJO_ARCHIVO = re.compile(r'^(?:archivo|file|imagen|image)\s*:\s*', re.IGNORECASE)
+_RE_ENCABEZADO = re.compile(r'^\s*==.*==\s*$', re.MULTILINE)
+
+
+def ruta_indice_por_defecto(ruta_volcado):
+    """'...-multistream.xml.bz2' -> '...-multistream-index.txt.bz2'"""
+    if ruta_volcado.endswith('.xml.bz2'):
+        return ruta_volcado[:-len('.xml.bz2')] + '-index.txt.bz2'
+    return ruta_volcado + '-index.txt.bz2'
+
+
+def url_miniatura(nombre_archivo, ancho=ANCHO_IMAGEN):
+    """
+    URL de la miniatura en upload.wikimedia.org para un archivo de Commons
+
+    'Foo bar.jpg' -> 'https://upload.wikimedia.org/wikipedia/commons/thumb/a/ab/Foo_bar.jpg/300px-Foo_bar.jpg'
+    """
+    nombre = nombre_archivo.strip().replace(' ', '_')
+    nombre = nombre[:1].upper() + nombre[1:]
+    hash_md5 = hashlib.md5(nombre.encode('utf-8')).hexdigest()
+    nombre_url = quote(nombre)
+    miniatura = f"{ancho}px-{nombre_url}"
+    if nombre.lower().endswith('.svg'):
+        # Las miniaturas de SVG se sirven como PNG
+        miniatura += '.png'
+    return f"{URL_UPLOAD}/thumb/{hash_md5[0]}/{hash_md5[:2]}/{nombre_url}/{miniatura}"
+
+
+def imagen_de_articulo(wikitext):
+    """Nombre del archivo de la ficha (parámetro imagen=) o de la primera imagen de la introducción"""
+    for m in _RE_PARAMETRO_IMAGEN.finditer(wikitext):
+        valor = m.group(1).strip()
+        enlace = _RE_ARCHIVO.search(valor)
+        valor = enlace.group(1) if enlace else _RE_PREFIJO_ARCHIVO.sub('', valor)
+        valor = valor.strip()
+        if '.' in valor:
+            return valor
+
+    introduccion = _RE_ENCABEZADO.split(wikitext, 1)[0]
+    m = _RE_ARCHIVO.search(introduccion)
+    return m.group(1).strip() if m else None
+
+
+def parrafos_de_introduccion(wikitext):
+    """Primeros párrafos en texto plano antes del primer encabezado"""
+    introduccion = _RE_ENCABEZADO.split(limpiar_wikitext(wikitext), 1)[0]
+
+    parrafos = []
+    for bloque in re.split(r'\n\s*\n', introduccion):
+        lineas = [linea for linea in bloque.split('\n')
+                  if linea.strip() and not linea.lstrip().startswith(('*', '#', ':', ';', '|', '!', '__'))]
+        texto = texto_plano(' '.join(lineas))
+        if texto:
+            parrafos.append(texto)
+            if len(parrafos) >= MAX_PARRAFOS:
+                break
+    return parrafos
+
+
+def _leer_bloque(ruta_volcado, inicio):
+    """Descomprime el bloque bz2 que empieza en el offset indicado"""
+    descompresor = bz2.BZ2Decompressor()
+    partes = []
+    with open(ruta_volcado, 'rb') as f:
+        f.seek(inicio)
+        while not descompresor.eof:
+            datos = f.read(TAMANO_LECTURA)
+            if not datos:
+                break
+            partes.append(descompresor.decompress(datos))
+    return b''.join(partes)
+
+
+def _sin_espacio_de_nombres(etiqueta):
+    return etiqueta.rsplit('}', 1)[-1]
+
+
+def _procesar_bloque(ruta_volcado, inicio, pedidos):
+    """
+    Analiza un bloque del volcado (se ejecuta en un proceso trabajador)
+
+    Args:
+        ruta_volcado (str): Ruta del .xml.bz2
+        inicio (int): Offset del bloque
+        pedidos (dict): {titulo: 'dia' | 'articulo'}
+
+    Returns:
+        dict: {titulo: ('redireccion', destino) | ('dia', (items, problema)) | ('articulo', info)}
+    """
+    datos = _leer_bloque(ruta_volcado, inicio).replace(b'</mediawiki>', b'')
+    resultados = {}
+
+    for _, elemento in ET.iterparse(io.BytesIO(b'<paginas>' + datos + b'</paginas>'), events=('end',)):
+        if _sin_espacio_de_nombres(elemento.tag) != 'page':
+            continue
+
+        campos = {_sin_espacio_de_nombres(hijo.tag): hijo for hijo in elemento}
+        titulo = campos['title'].text if 'title' in campos else None
+        if titulo in pedidos:
+            if 'redirect' in campos:
+                resultados[titulo] = ('redireccion', campos['redirect'].get('title'))
+            else:
+                texto = ''
+                revision = campos.get('revision')
+                if revision is not None:
+                    for hijo in revision:
+                        if _sin_espacio_de_nombres(hijo.tag) == 'text':
+                            texto = hijo.text or ''
+
+                if pedidos[titulo] == 'dia':
+                    resultados[titulo] = ('dia', parsear_santoral_wikitext(texto))
+                else:
+                    resultados[titulo] = ('articulo', {
+                        'parrafos': parrafos_de_introduccion(texto),
+                        'imagen': imagen_de_articulo(texto),
+                    })
+        # Liberar la página ya analizada
+        elemento.clear()
+
+    return resultados
+
+
+class FuenteVolcadoWikipedia:
+    def __init__(self, ruta_volcado, ruta_indice=None, procesos=None):
+        """
+        Args:
+            ruta_volcado (str): Ruta del eswiki-*-pages-articles-multistream.xml.bz2
+            ruta_indice (str): Ruta del índice (por defecto, el que acompaña al volcado)
+            procesos (int): Procesos de descompresión. Default: os.cpu_count()
+        """
+        self.ruta_volcado = ruta_volcado
+        self.ruta_indice = ruta_indice or ruta_indice_por_defecto(ruta_volcado)
+        self.procesos = procesos or os.cpu_count() or 1
+
+        for ruta in (self.ruta_volcado, self.ruta_indice):
+            if not os.path.exists(ruta):
+                raise FileNotFoundError(f"No se encontró el archivo del volcado: {ruta}")
+
+    def _ubicar(self, titulos):
+        """Recorre el índice y agrupa los títulos pedidos por bloque: {offset: [titulos]}"""
+        pendientes = set(titulos)
+        bloques = {}
+        with bz2.open(self.ruta_indice, 'rt', encoding='utf-8') as indice:
+            for linea in indice:
+                offset, _, titulo = linea.rstrip('\n').split(':', 2)
+                if titulo in pendientes:
+                    bloques.setdefault(int(offset), []).append(titulo)
+                    pendientes.discard(titulo)
+                    if not pendientes:
+                        break
+        return bloques
+
+    def _leer_paginas(self, pedidos):
+        """
+        Lee las páginas pedidas siguiendo redirecciones
+
+        Args:
+            pedidos (dict): {titulo: 'dia' | 'articulo'}
+
+        Returns:
+            dict: {titulo_pedido: resultado} (los títulos que no están en el volcado se omiten)
+        """
+        resultados = {}
+        # titulo a buscar -> títulos pedidos originalmente que llevan a él
+        origen = {titulo: [titulo] for titulo in pedidos}
+        tipos = dict(pedidos)
+
+        for _ in range(MAX_REDIRECCIONES + 1):
+            if not tipos:
+                break
+
+            bloques = self._ubicar(tipos)
+            redirecciones = {}
+
+            with ProcessPoolExecutor(max_workers=self.procesos) as executor:
+                en_vuelo = set()
+                for inicio, titulos in bloques.items():
+                    # Pocos bloques en vuelo por proceso: memoria acotada
+                    if len(en_vuelo) >= self.procesos * 2:
+                        terminados, en_vuelo = wait(en_vuelo, return_when=FIRST_COMPLETED)
+                        self._recoger(terminados, origen, resultados, redirecciones)
+                    en_vuelo.add(executor.submit(_procesar_bloque, self.ruta_volcado, inicio,
+                                                 {t: tipos[t] for t in titulos}))
+                self._recoger(en_vuelo, origen, resultados, redirecciones)
+
+            # Siguiente vuelta: los destinos de las redirecciones
+            nuevos_origen = {}
+            nuevos_tipos = {}
+            for titulo, destino in redirecciones.items():
+                destino = destino.split('#', 1)[0].strip()
+                if not destino:
+                    continue
+                nuevos_origen.setdefault(destino, []).extend(origen[titulo])
+                nuevos_tipos[destino] = tipos[titulo]
+            origen, tipos = nuevos_origen, nuevos_tipos
+
+        return resultados
+
+    def _recoger(self, futuros, origen, resultados, redirecciones):
+        for futuro in futuros:
+            for titulo, (tipo, valor) in futuro.result().items():
+                if tipo == 'redireccion':
+                    redirecciones[titulo] = valor
+                else:
+                    for titulo_pedido in origen[titulo]:
+                        resultados[titulo_pedido] = valor
+
+    def santorales(self, dias):
+        """
+        Returns:
+            dict: {(mes, dia): (items, problema)} como parsear_santoral_wikitext
+        """
+        titulos = {titulo_pagina_dia(mes, dia): (mes, dia) for mes, dia in dias}
+        print(f"📚 Leyendo {len(titulos)} día(s) del volcado ({self.procesos} proceso(s))...")
+        paginas = self._leer_paginas({titulo: 'dia' for titulo in titulos})
+
+        santorales = {}
+        for titulo, fecha in titulos.items():
+            santorales[fecha] = paginas.get(titulo, ([], "Error: página del día no encontrada en el volcado"))
+        return santorales
+
+    def articulos(self, titulos):
+        """
+        Returns:
+            dict: {titulo: {'parrafos': [str], 'url_imagen': str}} solo para artículos existentes
+        """
+        titulos = list(dict.fromkeys(t for t in titulos if t))
+        print(f"📚 Leyendo {len(titulos)} artículo(s) del volcado ({self.procesos} proceso(s))...")
+        paginas = self._leer_paginas({titulo: 'articulo' for titulo in titulos})
+
+        articulos = {}
+        for titulo, pagina in paginas.items():
+            articulos[titulo] = {
+                'parrafos': pagina['parrafos'],
+                'url_imagen': url_miniatura(pagina['imagen']) if pagina['imagen'] else ""
+            }
+        return articulos
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cliente mínimo de la Action API de MediaWiki (es.wikipedia.org)
+===============================================================
+Agrupa títulos en lotes de hasta 50 por petición, sigue las continuaciones
+('continue') y resuelve normalizaciones y redirecciones para que cada título
+pedido quede asociado a su página.
+
+El endpoint es configurable (api_url), de modo que se puede apuntar a un
+servidor local que imite la API.
+
+Las consultas llevan maxlag: si las réplicas van atrasadas la API responde
+un error "maxlag" con Retry-After, que el limitador de peticiones usa para
+frenar y reintentar.
+"""
+
+from urllib.parse import quote, unquote
+
+API_URL = "https://es.wikipedia.org/w/api.php"
+URL_BASE_WIKI = "https://es.wikipedia.org/wiki/"
+
+# Máximo de títulos por petición permitido a usuarios sin permisos de bot
+TAMANO_LOTE = 50
+
+# Lag máximo (segundos) de las réplicas antes de que la API rechace la consulta
+MAXLAG = 5
+
+# Caracteres que MediaWiki no codifica en las URLs de artículos (wfUrlencode)
+_CARACTERES_SEGUROS_URL = ";@$!*(),/~:"
+
+
+def titulo_desde_url(url_wikipedia):
+    """'https://es.wikipedia.org/wiki/Agust%C3%ADn_de_Hipona' -> 'Agustín de Hipona'"""
+    titulo = url_wikipedia.split('/wiki/', 1)[-1]
+    titulo = titulo.split('#', 1)[0]
+    return unquote(titulo).replace('_', ' ')
+
+
+def url_desde_titulo(titulo):
+    """'Agustín de Hipona' -> 'https://es.wikipedia.org/wiki/Agust%C3%ADn_de_Hipona'"""
+    titulo, _, seccion = titulo.partition('#')
+    url = URL_BASE_WIKI + quote(titulo.strip().replace(' ', '_'), safe=_CARACTERES_SEGUROS_URL)
+    if seccion:
+        url += '#' + quote(seccion.strip().replace(' ', '_'), safe=_CARACTERES_SEGUROS_URL)
+    return url
+
+
+def _lotes(elementos, tamano=TAMANO_LOTE):
+    for i in range(0, len(elementos), tamano):
+        yield elementos[i:i + tamano]
+
+
+class ClienteMediaWiki:
+    def __init__(self, get, api_url=API_URL):
+        """
+        Args:
+            get (callable): Función GET a utilizar (ej: SantosWikipediaScraper._get),
+                            con la firma get(url, params=..., timeout=...)
+            api_url (str): Endpoint de la API
+        """
+        self.get = get
+        self.api_url = api_url
+        self.peticiones = 0
+
+    def consultar(self, params):
+        """
+        Ejecuta una consulta action=query siguiendo todas las continuaciones
+
+        Yields:
+            dict: cada respuesta JSON parcial
+        """
+        base = {
+            'action': 'query',
+            'format': 'json',
+            'formatversion': '2',
+            'maxlag': str(MAXLAG),
+        }
+        base.update(params)
+
+        continuar = {}
+        while True:
+            consulta = dict(base)
+            consulta.update(continuar)
+            response = self.get(self.api_url, params=consulta, timeout=30)
+            response.raise_for_status()
+            self.peticiones += 1
+            datos = response.json()
+
+            if 'error' in datos:
+                raise RuntimeError(f"API MediaWiki: {datos['error'].get('code')} - {datos['error'].get('info')}")
+
+            yield datos
+
+            if 'continue' not in datos:
+                break
+            continuar = datos['continue']
+
+    def consultar_titulos(self, titulos, params):
+        """
+        Consulta propiedades de páginas para una lista de títulos, en lotes de 50
+
+        Args:
+            titulos (list): Títulos tal como se quieren consultar
+            params (dict): Parámetros adicionales (prop, exintro, ...)
+
+        Returns:
+            dict: {titulo_pedido: pagina} con las páginas ya combinadas entre continuaciones.
+                  Los títulos inexistentes quedan asociados a una página con 'missing'.
+        """
+        resultado = {}
+        titulos_unicos = list(dict.fromkeys(t for t in titulos if t))
+
+        for lote in _lotes(titulos_unicos):
+            paginas = {}
+            traducciones = {}
+
+            consulta = dict(params)
+            consulta['titles'] = '|'.join(lote)
+
+            for datos in self.consultar(consulta):
+                query = datos.get('query', {})
+                for cambio in query.get('normalized', []) + query.get('redirects', []):
+                    traducciones[cambio['from']] = cambio['to']
+                for pagina in query.get('pages', []):
+                    # Las continuaciones traen fragmentos de la misma página: se combinan
+                    paginas.setdefault(pagina['title'], {}).update(pagina)
+
+            for titulo in lote:
+                final = titulo
+                vistos = set()
+                while final in traducciones and final not in vistos:
+                    vistos.add(final)
+                    final = traducciones[final]
+                if final in paginas:
+                    resultado[titulo] = paginas[final]
+
+        return resultado
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Configuración común de las pruebas
+==================================
+- Agrega scripts/ al path (los módulos se importan como en los scrapers).
+- adaptador_guionado: adaptador de transporte que responde lo que indica la
+  prueba (status, cabeceras o una excepción), para probar los adaptadores
+  del cliente HTTP sin red.
+- servidor_wikipedia: servidor HTTP local que imita a es.wikipedia.org, con
+  /w/api.php (action=query con normalized, redirects, continue y páginas
+  inexistentes) y /wiki/<título> (el HTML completo del artículo), para
+  comparar las dos formas de enriquecer santos sin salir a la red.
+"""
+
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+# Relleno de navegación, menús y pie de una página de Wikipedia (las reales pesan más)
+_RELLENO_HTML = '<li><a href="/wiki/Especial:Aleatoria">Página aleatoria</a></li>\n' * 400
+
+
+class AdaptadorGuionado(BaseAdapter):
+    def __init__(self, guion):
+        """
+        Args:
+            guion (list): Un paso por petición, en orden: status (int), (status, cabeceras)
+                          o una excepción a lanzar
+        """
+        super().__init__()
+        self.guion = list(guion)
+        self.pedidas = []
+
+    def send(self, request, **kwargs):
+        self.pedidas.append(request.url)
+        paso = self.guion.pop(0)
+        if isinstance(paso, Exception):
+            raise paso
+        status, cabeceras = paso if isinstance(paso, tuple) else (paso, {})
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(cabeceras)
+        response._content = b''
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+    @staticmethod
+    def peticion(url, metodo='GET'):
+        """PreparedRequest para pasarle directamente a un adaptador"""
+        return requests.Request(metodo, url).prepare()
+
+
+class ServidorWikipedia:
+    def __init__(self, paginas=None, redirecciones=None, extractos_por_respuesta=20):
+        """
+        Args:
+            paginas (dict): {título: {'extract': str, 'imagen': url}} de los artículos existentes
+            redirecciones (dict): {título: título destino}
+            extractos_por_respuesta (int): Extractos por respuesta, como exlimit: el resto
+                                           llega en continuaciones ('excontinue')
+        """
+        self.paginas = paginas or {}
+        self.redirecciones = redirecciones or {}
+        self.extractos_por_respuesta = extractos_por_respuesta
+        self.peticiones = []      # (ruta, parámetros) de cada petición recibida
+        self.bytes_enviados = 0   # cuerpos de las respuestas
+        self._lock = threading.Lock()
+        self._servidor = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._servidor.server_address[1]}"
+
+    @property
+    def api_url(self):
+        return self.url + '/w/api.php'
+
+    def iniciar(self):
+        self._servidor = ThreadingHTTPServer(('127.0.0.1', 0), self._manejador())
+        threading.Thread(target=self._servidor.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+
+    def detener(self):
+        self._servidor.shutdown()
+        self._servidor.server_close()
+
+    def _manejador(self):
+        servidor = self
+
+        class Manejador(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                partes = urlparse(self.path)
+                params = {clave: valores[0] for clave, valores in parse_qs(partes.query).items()}
+                if partes.path == '/w/api.php':
+                    estado, tipo, cuerpo = 200, 'application/json', servidor.responder_api(params)
+                elif partes.path.startswith('/wiki/'):
+                    estado, tipo, cuerpo = servidor.responder_articulo(unquote(partes.path[len('/wiki/'):]))
+                else:
+                    estado, tipo, cuerpo = 404, 'text/plain', b''
+                with servidor._lock:
+                    servidor.peticiones.append((partes.path, params))
+                    servidor.bytes_enviados += len(cuerpo)
+                self.send_response(estado)
+                self.send_header('Content-Type', tipo)
+                self.send_header('Content-Length', str(len(cuerpo)))
+                self.end_headers()
+                self.wfile.write(cuerpo)
+
+        return Manejador
+
+    @staticmethod
+    def normalizar(titulo):
+        """Como MediaWiki: '_' -> ' ' y primera letra en mayúscula"""
+        titulo = titulo.replace('_', ' ').strip()
+        return titulo[:1].upper() + titulo[1:]
+
+    def responder_api(self, params):
+        titulos = params.get('titles', '').split('|')
+        desde = int(params.get('excontinue', 0))
+        normalizados, redirecciones, paginas = [], [], []
+        vistos = set()
+
+        for titulo in titulos:
+            normal = self.normalizar(titulo)
+            if normal != titulo:
+                normalizados.append({'from': titulo, 'to': normal})
+            if normal in self.redirecciones:
+                redirecciones.append({'from': normal, 'to': self.redirecciones[normal]})
+                normal = self.redirecciones[normal]
+            if normal in vistos:
+                continue
+            vistos.add(normal)
+
+            if normal not in self.paginas:
+                paginas.append({'title': normal, 'missing': True})
+                continue
+            pagina = {'title': normal, 'pageid': len(vistos)}
+            indice = len(paginas)
+            # Cada respuesta trae solo su tramo de extractos; la imagen, en la primera
+            if desde <= indice < desde + self.extractos_por_respuesta:
+                pagina['extract'] = self.paginas[normal]['extract']
+            if desde == 0 and self.paginas[normal].get('imagen'):
+                pagina['thumbnail'] = {'source': self.paginas[normal]['imagen']}
+            paginas.append(pagina)
+
+        datos = {'batchcomplete': True, 'query': {'pages': paginas}}
+        if normalizados:
+            datos['query']['normalized'] = normalizados
+        if redirecciones:
+            datos['query']['redirects'] = redirecciones
+        if desde + self.extractos_por_respuesta < len(paginas):
+            del datos['batchcomplete']
+            datos['continue'] = {'excontinue': desde + self.extractos_por_respuesta, 'continue': '||'}
+        return json.dumps(datos).encode('utf-8')
+
+    def responder_articulo(self, titulo):
+        titulo = self.redirecciones.get(self.normalizar(titulo), self.normalizar(titulo))
+        pagina = self.paginas.get(titulo)
+        if pagina is None:
+            return 404, 'text/html', b''
+        imagen = pagina.get('imagen', '').replace('https:', '')
+        html = (f'<html><head><title>{titulo} - Wikipedia</title></head><body>'
+                f'<div id="mw-navigation"><ul>{_RELLENO_HTML}</ul></div>'
+                f'<div id="mw-content-text"><div class="mw-content-ltr mw-parser-output">'
+                f'<table class="infobox"><tr><td><img src="{imagen}"></td></tr></table>'
+                f'<p>{pagina["extract"]}</p></div></div>'
+                f'<div id="footer"><ul>{_RELLENO_HTML}</ul></div></body></html>')
+        return 200, 'text/html; charset=utf-8', html.encode('utf-8')
+
+
+@pytest.fixture
+def adaptador_guionado():
+    """Clase AdaptadorGuionado (cada prueba arma el suyo con su guion)"""
+    return AdaptadorGuionado
+
+
+@pytest.fixture
+def servidor_wikipedia():
+    """ServidorWikipedia local vacío (las pruebas cargan paginas y redirecciones)"""
+    servidor = ServidorWikipedia()
+    servidor.iniciar()
+    yield servidor
+    servidor.detener()
+
+
+@pytest.fixture
+def sesion():
+    """Sesión de requests sin proxies del entorno ni los adaptadores compartidos"""
+    session = requests.Session()
+    session.trust_env = False
+    yield session
+    session.close()
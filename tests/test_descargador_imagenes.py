@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Pruebas del descargador de imágenes: reanudación y deduplicación en paralelo"""
+
+import threading
+import time
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from descargador_imagenes import DescargadorImagenes, miniatura_wikimedia
+
+ORIGINAL = 'https://upload.wikimedia.org/wikipedia/commons/a/ab/Pedro.jpg'
+MINIATURA = miniatura_wikimedia(ORIGINAL)
+IMAGEN = bytes(range(256)) * 40
+ETAG = '"pedro-v1"'
+
+
+class CuerpoCortado:
+    """Cuerpo de respuesta que se corta (la conexión cae) tras `cortar_en` bytes"""
+
+    def __init__(self, datos, cortar_en=None):
+        self.datos = datos
+        self.cortar_en = cortar_en
+        self.leidos = 0
+
+    def read(self, cantidad=-1, **kwargs):
+        if self.cortar_en is not None and self.leidos >= self.cortar_en:
+            raise requests.exceptions.ConnectionError("conexión cortada")
+        hasta = len(self.datos) if cantidad < 0 else self.leidos + cantidad
+        if self.cortar_en is not None:
+            hasta = min(hasta, self.cortar_en)
+        bloque = self.datos[self.leidos:hasta]
+        self.leidos += len(bloque)
+        return bloque
+
+    def close(self):
+        pass
+
+
+class AdaptadorImagenes(BaseAdapter):
+    """Sirve IMAGEN en MINIATURA (respetando Range/If-Range) y 404 en cualquier otra URL"""
+
+    def __init__(self, cortar_en=None):
+        super().__init__()
+        self.cortar_en = cortar_en
+        self.pedidas = []   # (url, cabeceras) de cada petición
+
+    def send(self, request, **kwargs):
+        self.pedidas.append((request.url, dict(request.headers)))
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        if request.url != MINIATURA:
+            response.status_code = 404
+            response.headers = CaseInsensitiveDict()
+            response.raw = CuerpoCortado(b'')
+            return response
+
+        inicio = 0
+        rango = request.headers.get('Range')
+        if rango and request.headers.get('If-Range') == ETAG:
+            inicio = int(rango[len('bytes='):].rstrip('-'))
+        cuerpo = IMAGEN[inicio:]
+        response.status_code = 206 if inicio else 200
+        response.headers = CaseInsensitiveDict({'Content-Type': 'image/jpeg', 'ETag': ETAG,
+                                                'Content-Length': str(len(cuerpo))})
+        if inicio:
+            response.headers['Content-Range'] = f'bytes {inicio}-{len(IMAGEN) - 1}/{len(IMAGEN)}'
+        response.raw = CuerpoCortado(cuerpo, self.cortar_en)
+        # Solo la primera descarga se corta
+        self.cortar_en = None
+        return response
+
+    def close(self):
+        pass
+
+
+def test_reanuda_la_miniatura_cortada_aunque_fallen_las_demas(tmp_path, sesion):
+    adaptador = AdaptadorImagenes(cortar_en=3000)
+    sesion.mount('https://upload.wikimedia.org/', adaptador)
+    descargador = DescargadorImagenes(sesion, str(tmp_path))
+
+    # La miniatura se corta y el original da 404: la descarga falla...
+    assert descargador.descargar(ORIGINAL, 'pedro') == ""
+    assert [url for url, _ in adaptador.pedidas] == [MINIATURA, ORIGINAL]
+    # ...pero probar el original no se llevó lo que ya había bajado de la miniatura
+    assert [p.name for p in tmp_path.glob('pedro.jpg.*.part')]
+
+    adaptador.pedidas.clear()
+    assert descargador.descargar(ORIGINAL, 'pedro') == 'pedro.jpg'
+
+    url, cabeceras = adaptador.pedidas[0]
+    assert url == MINIATURA
+    assert cabeceras['Range'] == 'bytes=3000-'
+    assert cabeceras['If-Range'] == ETAG
+    assert (tmp_path / 'pedro.jpg').read_bytes() == IMAGEN
+    assert descargador.estadisticas['reanudadas'] == 1
+    # Ya descargada, no quedan .part de ninguna candidata
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['pedro.jpg']
+
+
+class AlmacenLento:
+    """Almacén cuyo índice tarda en armarse; registrar() antes de tenerlo es un error"""
+
+    def __init__(self):
+        self.actualizado = False
+        self.actualizaciones = 0
+
+    def actualizar(self):
+        self.actualizaciones += 1
+        time.sleep(0.05)
+        self.actualizado = True
+
+    def registrar(self, nombre):
+        assert self.actualizado, "registrar() con el índice a medio armar"
+        return nombre
+
+
+def test_registra_recien_con_el_indice_completo(tmp_path, sesion):
+    almacen = AlmacenLento()
+    descargador = DescargadorImagenes(sesion, str(tmp_path), almacen=almacen)
+    errores = []
+
+    def canonico(nombre):
+        try:
+            descargador._canonico(nombre)
+        except AssertionError as e:
+            errores.append(e)
+
+    hilos = [threading.Thread(target=canonico, args=(f"santo{i}.jpg",)) for i in range(4)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    assert errores == []
+    assert almacen.actualizaciones == 1
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Pruebas del limitador de ritmo por host"""
+
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+
+import limitador
+from limitador import AdaptadorLimitador, LimitadorPeticiones, _segundos_retry_after, motivo_para_frenar
+
+URL = 'https://es.wikipedia.org/w/api.php'
+
+
+def _respuesta(status, cabeceras=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(cabeceras or {})
+    return response
+
+
+def test_motivo_para_frenar():
+    assert motivo_para_frenar(_respuesta(200)) is None
+    assert motivo_para_frenar(_respuesta(500)) is None
+    assert motivo_para_frenar(_respuesta(429)) == "429"
+    assert motivo_para_frenar(_respuesta(503)) == "503"
+    assert motivo_para_frenar(_respuesta(200, {'MediaWiki-API-Error': 'maxlag'})) == "maxlag"
+
+
+def test_retry_after():
+    assert _segundos_retry_after('120') == 120.0
+    assert _segundos_retry_after('') is None
+    assert _segundos_retry_after('pronto') is None
+    assert 25 < _segundos_retry_after(formatdate(time.time() + 30, usegmt=True)) <= 30
+
+
+def test_frena_ante_sobrecarga():
+    lim = LimitadorPeticiones(peticiones_por_segundo=4, minimo=1)
+
+    assert lim.registrar(URL, _respuesta(429, {'Retry-After': '7'})) == "429"
+    estado = lim._hosts['es.wikipedia.org']
+    assert estado['ritmo'] == 4 * limitador.FACTOR_BAJADA
+    assert estado['recarga'] - time.monotonic() == pytest.approx(7, abs=0.5)
+
+    # Nunca baja del mínimo y la pausa pedida tiene un tope
+    lim.registrar(URL, _respuesta(503, {'Retry-After': '100000'}))
+    lim.registrar(URL, _respuesta(503))
+    assert estado['ritmo'] == 1
+    assert estado['recarga'] - time.monotonic() <= limitador.PAUSA_MAXIMA
+    assert estado['frenadas'] == 3
+
+
+def test_sube_con_respuestas_sanas():
+    lim = LimitadorPeticiones(peticiones_por_segundo=2, maximo=2 + limitador.INCREMENTO_RITMO)
+    estado = lim._estado('es.wikipedia.org', time.monotonic())
+
+    # Un 500 no es señal de sobrecarga, pero tampoco cuenta como sana
+    lim.registrar(URL, _respuesta(500))
+    for _ in range(limitador.RESPUESTAS_PARA_SUBIR - 1):
+        assert lim.registrar(URL, _respuesta(200)) is None
+    assert estado['ritmo'] == 2
+
+    lim.registrar(URL, _respuesta(200))
+    assert estado['ritmo'] == 2 + limitador.INCREMENTO_RITMO
+    for _ in range(limitador.RESPUESTAS_PARA_SUBIR):
+        lim.registrar(URL, _respuesta(200))
+    assert estado['ritmo'] == 2 + limitador.INCREMENTO_RITMO
+
+
+def test_respeta_el_ritmo_por_host():
+    lim = LimitadorPeticiones(peticiones_por_segundo=40, rafaga=1)
+
+    inicio = time.monotonic()
+    for _ in range(5):
+        lim.esperar(URL)
+    # Otro host tiene su propio turno
+    lim.esperar('https://upload.wikimedia.org/x.jpg')
+    transcurrido = time.monotonic() - inicio
+
+    assert transcurrido >= 4 / 40 * 0.9
+    assert lim._hosts['es.wikipedia.org']['peticiones'] == 5
+    assert lim._hosts['upload.wikimedia.org']['peticiones'] == 1
+
+
+def test_desactivado():
+    lim = LimitadorPeticiones(peticiones_por_segundo=0)
+
+    lim.esperar(URL)
+    assert lim.registrar(URL, _respuesta(429)) is None
+    assert lim.describir() == "sin límite"
+    assert lim._hosts == {}
+
+
+def test_adaptador_reintenta_tras_la_pausa(adaptador_guionado):
+    interno = adaptador_guionado([(503, {'Retry-After': '0'}), (429, {'Retry-After': '0'}), 200])
+    adaptador = AdaptadorLimitador(interno, LimitadorPeticiones(peticiones_por_segundo=100))
+
+    response = adaptador.send(adaptador_guionado.peticion(URL))
+
+    assert response.status_code == 200
+    assert len(interno.pedidas) == 3
+
+
+def test_adaptador_se_rinde_tras_los_reintentos(adaptador_guionado):
+    interno = adaptador_guionado([(429, {'Retry-After': '0'})] * 3)
+    adaptador = AdaptadorLimitador(interno, LimitadorPeticiones(peticiones_por_segundo=100), reintentos=2)
+
+    response = adaptador.send(adaptador_guionado.peticion(URL))
+
+    assert response.status_code == 429
+    assert len(interno.pedidas) == 3
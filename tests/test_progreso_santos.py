@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Pruebas del diario de progreso de las ejecuciones de santos"""
+
+import pytest
+
+from progreso_santos import DiarioProgreso, describir_pendiente
+
+RANGO = [1, 1, 1, 3]
+DIAS = [(1, 1), (1, 2), (1, 3)]
+FILA = {'mes': 1, 'dia': 1, 'nombre': 'San Basilio'}
+
+
+@pytest.fixture
+def ruta(tmp_path):
+    return str(tmp_path / 'santos_progreso.jsonl')
+
+
+def _iniciar(ruta):
+    diario = DiarioProgreso(ruta)
+    diario.iniciar(RANGO, False, DIAS, [], {'bytes': 40, 'filas': 0, 'inodo': 7})
+    return diario
+
+
+def test_sin_diario(ruta):
+    assert DiarioProgreso(ruta).leer() is None
+    assert describir_pendiente(ruta) is None
+
+
+def test_lee_lo_asentado(ruta):
+    diario = _iniciar(ruta)
+    diario.registrar_eliminacion(['1-1-San Basilio'], 0)
+    diario.registrar_dia(1, 1, [FILA], {'bytes': 80, 'filas': 1})
+    diario.registrar_dia(1, 2, [], {'bytes': 80, 'filas': 1})
+    diario.cerrar(borrar=False)
+
+    pendiente = DiarioProgreso(ruta).leer()
+
+    assert pendiente['inicio']['rango'] == RANGO
+    assert pendiente['inicio']['dias'] == [list(fecha) for fecha in DIAS]
+    assert pendiente['dias'] == {(1, 1): [FILA], (1, 2): []}
+    assert pendiente['eliminaciones'] == [(['1-1-San Basilio'], 0)]
+    assert pendiente['csv'] == {'bytes': 80, 'filas': 1}
+    assert pendiente['refresco'] is None
+    assert pendiente['compactado'] is None
+    assert describir_pendiente(ruta).endswith("2 de 3 días listos, sigue desde el 03/01")
+
+
+def test_descarta_la_linea_cortada_y_sigue(ruta):
+    diario = _iniciar(ruta)
+    diario.registrar_dia(1, 1, [FILA], {'bytes': 80, 'filas': 1})
+    diario.cerrar(borrar=False)
+    with open(ruta, 'ab') as f:
+        f.write(b'{"tipo": "dia", "mes": 1, "di')
+
+    retomado = DiarioProgreso(ruta)
+    assert list(retomado.leer()['dias']) == [(1, 1)]
+    retomado.reanudar()
+    retomado.registrar_dia(1, 2, [], {'bytes': 80, 'filas': 1})
+    retomado.cerrar(borrar=False)
+
+    assert list(DiarioProgreso(ruta).leer()['dias']) == [(1, 1), (1, 2)]
+
+
+def test_refresco_y_compactado(ruta):
+    diario = _iniciar(ruta)
+    diario.registrar_refresco([FILA], {'bytes': 90, 'filas': 2})
+    diario.registrar_compactado({'inodo': 8, 'bytes': 50, 'sha256': 'abc'})
+    diario.cerrar(borrar=False)
+
+    pendiente = DiarioProgreso(ruta).leer()
+
+    assert pendiente['refresco'] == [FILA]
+    assert pendiente['csv'] == {'bytes': 90, 'filas': 2}
+    assert pendiente['compactado'] == {'inodo': 8, 'bytes': 50, 'sha256': 'abc'}
+
+
+def test_iniciar_reemplaza_al_anterior(ruta):
+    diario = _iniciar(ruta)
+    diario.registrar_dia(1, 1, [FILA], {'bytes': 80, 'filas': 1})
+    diario.cerrar(borrar=False)
+
+    _iniciar(ruta).cerrar(borrar=False)
+
+    assert DiarioProgreso(ruta).leer()['dias'] == {}
+
+
+def test_cerrar_borra_el_diario(ruta):
+    diario = _iniciar(ruta)
+    diario.cerrar()
+
+    assert DiarioProgreso(ruta).leer() is None
+    # Después de cerrar no se escribe nada
+    diario.registrar_dia(1, 1, [FILA], {'bytes': 80, 'filas': 1})
+    assert DiarioProgreso(ruta).leer() is None
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Pruebas de reintentos, cortacircuitos y caché negativa"""
+
+import json
+from urllib.parse import urlparse
+
+import pytest
+import requests
+
+import resiliencia
+from resiliencia import AdaptadorResiliente, CacheNegativa, CircuitoAbierto, CortaCircuitos
+
+URL = 'https://es.wikipedia.org/wiki/Pedro_(ap%C3%B3stol)'
+MINIATURA = 'https://upload.wikimedia.org/wikipedia/commons/thumb/a/ab/Pedro.jpg/300px-Pedro.jpg'
+
+
+@pytest.fixture(autouse=True)
+def sin_esperas(monkeypatch):
+    monkeypatch.setattr(resiliencia, 'BACKOFF_BASE', 0)
+
+
+@pytest.fixture
+def armar(adaptador_guionado, tmp_path):
+    """armar(guion, fallos_para_cortar=...) -> (AdaptadorResiliente, interno, cortacircuitos)"""
+    def _armar(guion, fallos_para_cortar=resiliencia.FALLOS_PARA_CORTAR, enfriamiento=60.0):
+        interno = adaptador_guionado(guion)
+        cortacircuitos = CortaCircuitos(fallos_para_cortar, enfriamiento)
+        cache = CacheNegativa(str(tmp_path / 'negativa.json'))
+        return AdaptadorResiliente(interno, cortacircuitos, cache), interno, cortacircuitos
+    return _armar
+
+
+def _fallos(cortacircuitos, url=URL):
+    return cortacircuitos._estado(urlparse(url).netloc)['fallos']
+
+
+def test_reintenta_errores_transitorios(armar, adaptador_guionado):
+    adaptador, interno, cortacircuitos = armar([502, requests.exceptions.ConnectionError("corte"), 200])
+
+    response = adaptador.send(adaptador_guionado.peticion(URL))
+
+    assert response.status_code == 200
+    assert len(interno.pedidas) == 3
+    assert _fallos(cortacircuitos) == 0
+
+
+def test_fallos_seguidos_abren_el_circuito(armar, adaptador_guionado):
+    adaptador, interno, _ = armar([500, 502], fallos_para_cortar=2)
+
+    # El segundo fallo abre el circuito: no se sigue reintentando
+    assert adaptador.send(adaptador_guionado.peticion(URL)).status_code == 502
+    with pytest.raises(CircuitoAbierto):
+        adaptador.send(adaptador_guionado.peticion(URL))
+    assert len(interno.pedidas) == 2
+
+
+def test_sobrecarga_cuenta_sin_reintentar(armar, adaptador_guionado):
+    # 429/503 ya los reintentó el limitador (debajo): acá solo cuentan para el circuito
+    adaptador, interno, cortacircuitos = armar([503, 429])
+
+    assert adaptador.send(adaptador_guionado.peticion(URL)).status_code == 503
+    assert adaptador.send(adaptador_guionado.peticion(URL)).status_code == 429
+    assert len(interno.pedidas) == 2
+    assert _fallos(cortacircuitos) == 2
+
+
+def test_sobrecarga_abre_el_circuito(armar, adaptador_guionado):
+    adaptador, interno, _ = armar([503, 503], fallos_para_cortar=2)
+
+    adaptador.send(adaptador_guionado.peticion(URL))
+    adaptador.send(adaptador_guionado.peticion(URL))
+    with pytest.raises(CircuitoAbierto):
+        adaptador.send(adaptador_guionado.peticion(URL))
+    assert len(interno.pedidas) == 2
+
+
+def test_error_no_transitorio_cuenta_y_no_se_reintenta(armar, adaptador_guionado):
+    adaptador, interno, cortacircuitos = armar([requests.exceptions.ChunkedEncodingError("cortado"), 200])
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        adaptador.send(adaptador_guionado.peticion(URL))
+    assert len(interno.pedidas) == 1
+    assert _fallos(cortacircuitos) == 1
+
+
+def test_prueba_fallida_no_traba_el_host(armar, adaptador_guionado):
+    adaptador, interno, cortacircuitos = armar(
+        [500, requests.exceptions.ChunkedEncodingError("cortado"), 200], fallos_para_cortar=1, enfriamiento=0)
+
+    # El 500 abre el circuito; vencido el enfriamiento pasa una prueba, que falla
+    assert adaptador.send(adaptador_guionado.peticion(URL)).status_code == 500
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        adaptador.send(adaptador_guionado.peticion(URL))
+    # La prueba fallida no deja el host trabado: pasa la siguiente
+    assert adaptador.send(adaptador_guionado.peticion(URL)).status_code == 200
+    assert _fallos(cortacircuitos) == 0
+
+
+def test_miniatura_500_no_se_reintenta_ni_cuenta(armar, adaptador_guionado):
+    # Wikimedia responde 500 a miniaturas más anchas que el original
+    adaptador, interno, cortacircuitos = armar([500, 500, 200])
+
+    assert adaptador.send(adaptador_guionado.peticion(MINIATURA)).status_code == 500
+    assert interno.pedidas == [MINIATURA]
+    assert _fallos(cortacircuitos, MINIATURA) == 0
+
+    # El original (fuera de /thumb/) sí se reintenta ante un 500
+    original = 'https://upload.wikimedia.org/wikipedia/commons/a/ab/Pedro.jpg'
+    assert adaptador.send(adaptador_guionado.peticion(original)).status_code == 200
+    assert interno.pedidas[1:] == [original, original]
+
+
+def test_cache_negativa(armar, adaptador_guionado):
+    adaptador, interno, _ = armar([404])
+
+    assert adaptador.send(adaptador_guionado.peticion(URL)).status_code == 404
+    response = adaptador.send(adaptador_guionado.peticion(URL))
+
+    assert response.status_code == 404
+    assert response.desde_cache_negativa
+    assert len(interno.pedidas) == 1
+
+
+def test_metodos_no_idempotentes_pasan_directo(armar, adaptador_guionado):
+    adaptador, interno, cortacircuitos = armar([503])
+
+    assert adaptador.send(adaptador_guionado.peticion(URL, 'POST')).status_code == 503
+    assert _fallos(cortacircuitos) == 0
+
+
+def test_cache_negativa_guarda_por_tandas(tmp_path, monkeypatch):
+    monkeypatch.setattr(resiliencia, 'GUARDAR_NEGATIVA_CADA', 3)
+    ruta = tmp_path / 'negativa.json'
+    cache = CacheNegativa(str(ruta))
+
+    cache.registrar('https://a/1', 404)
+    cache.registrar('https://a/2', 410)
+    assert not ruta.exists()
+    cache.registrar('https://a/3', 404)
+    assert set(json.loads(ruta.read_text())) == {'https://a/1', 'https://a/2', 'https://a/3'}
+
+    # olvidar solo marca el cambio; guardar() lo escribe
+    cache.olvidar('https://a/1')
+    assert 'https://a/1' in json.loads(ruta.read_text())
+    cache.guardar()
+    assert set(json.loads(ruta.read_text())) == {'https://a/2', 'https://a/3'}
+
+    recargada = CacheNegativa(str(ruta))
+    assert recargada.obtener('https://a/2') == 410
+    assert recargada.obtener('https://a/1') is None
+
+
+def test_cache_negativa_vence(tmp_path):
+    cache = CacheNegativa(str(tmp_path / 'negativa.json'), ttl_horas=0)
+    cache.registrar(URL, 404)
+    assert cache.obtener(URL) is None
+
+
+def test_cerrar_guarda_la_cache_negativa(armar, adaptador_guionado, tmp_path):
+    adaptador, _, _ = armar([404])
+
+    adaptador.send(adaptador_guionado.peticion(URL))
+    adaptador.close()
+
+    assert URL in json.loads((tmp_path / 'negativa.json').read_text())
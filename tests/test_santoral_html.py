@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Pruebas del parseo del santoral y de los artículos desde HTML"""
+
+from santoral_html import parsear_articulo_html, parsear_santoral_html
+
+PAGINA = """<html><body>
+<div id="mw-navigation"><h2>Santoral católico</h2><ul><li><a href="/wiki/Portada">Portada</a></li></ul></div>
+<div class="mw-content-ltr mw-parser-output">
+<h2>Acontecimientos</h2><ul><li><a href="/wiki/1492">1492</a>: algo que no es un santo</li></ul>
+<h2><span>Santoral católico</span></h2>
+<ul><li><a href="/wiki/1245">1245</a> — <a href="/wiki/Pedro_(ap%C3%B3stol)">San Pedro</a>, apóstol</li>
+<li>Santa sin enlace</li></ul>
+<p><b>Por países</b></p><ul><li><a href="/wiki/Fiesta_nacional">Fiesta nacional</a></li></ul>
+<h2>Véase también</h2>
+</div></body></html>"""
+
+
+def test_items_del_santoral():
+    items, problema = parsear_santoral_html(PAGINA)
+
+    # Solo el cuerpo del artículo: el menú con el mismo título no cuenta
+    assert problema is None
+    assert items == [
+        {'url': 'https://es.wikipedia.org/wiki/Pedro_(ap%C3%B3stol)', 'texto_enlace': 'San Pedro',
+         'texto': '1245—San Pedro, apóstol'},
+        {'url': None, 'texto_enlace': None, 'texto': 'Santa sin enlace'},
+    ]
+
+
+def test_encabezado_dentro_de_mw_heading():
+    html = """<div class="mw-parser-output">
+    <div class="mw-heading mw-heading2"><h2>Santoral católico</h2></div>
+    <ul><li><a href="/wiki/Juan">San Juan</a></li></ul>
+    <ul><li><a href="/wiki/Ana">Santa Ana</a></li></ul>
+    <ul><li>Tercera lista</li></ul>
+    <div class="mw-heading mw-heading2"><h2>Véase también</h2></div></div>"""
+
+    items, problema = parsear_santoral_html(html)
+
+    assert problema is None
+    assert [item['texto_enlace'] for item in items] == ['San Juan', 'Santa Ana']
+
+
+def test_pagina_sin_santoral():
+    assert parsear_santoral_html('<div class="mw-parser-output"><h2>Historia</h2></div>') == \
+        ([], "No se encontró sección 'Santoral católico'")
+
+
+def test_articulo():
+    html = """<div class="mw-parser-output">
+    <table class="infobox"><tr><td><img src="//upload.wikimedia.org/wikipedia/commons/a/ab/Pedro.jpg"></td></tr></table>
+    <p>San Pedro fue <b>apóstol</b>.</p><div><p>Párrafo anidado</p></div><p>Murió en Roma.</p></div>"""
+
+    assert parsear_articulo_html(html) == {
+        'parrafos': ['San Pedro fue apóstol .', 'Murió en Roma.'],
+        'url_imagen': 'https://upload.wikimedia.org/wikipedia/commons/a/ab/Pedro.jpg',
+    }
+
+
+def test_articulo_sin_contenido():
+    assert parsear_articulo_html('<p>Fuera del artículo</p>') == {'parrafos': [], 'url_imagen': ''}
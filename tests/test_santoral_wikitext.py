@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Pruebas del parseo del santoral desde wikitext"""
+
+from santoral_wikitext import parsear_santoral_wikitext, texto_plano, titulo_pagina_dia
+
+PAGINA = """El '''4 de noviembre''' es el día 308 del año.
+== Acontecimientos ==
+* [[1492]]: algo que no es un santo
+== Santoral católico ==
+{{Santoral}}
+* [[Pedro (apóstol)|San Pedro]], apóstol.<ref>Martirologio romano</ref>
+** detalle de la viñeta anterior
+* [[1245]] — [[san_martín de porres|San Martín]]
+* [[Archivo:Bosco.jpg|miniaturadeimagen]] [[Juan Bosco|San '''Juan''' Bosco]] {{cita requerida}}
+* Santa sin enlace
+=== Por países ===
+* [[Fiesta nacional]]
+== Véase también ==
+"""
+
+
+def test_items_del_santoral():
+    items, problema = parsear_santoral_wikitext(PAGINA)
+
+    assert problema is None
+    assert items == [
+        {'titulo': 'Pedro (apóstol)', 'texto_enlace': 'San Pedro', 'texto': 'San Pedro, apóstol.'},
+        # Años y archivos no cuentan como enlace al santo; el título queda capitalizado
+        {'titulo': 'San martín de porres', 'texto_enlace': 'San Martín', 'texto': '1245 — San Martín'},
+        {'titulo': 'Juan Bosco', 'texto_enlace': 'San Juan Bosco', 'texto': 'San Juan Bosco'},
+        {'titulo': None, 'texto_enlace': None, 'texto': 'Santa sin enlace'},
+    ]
+
+
+def test_pagina_sin_santoral():
+    assert parsear_santoral_wikitext("== Acontecimientos ==\n* [[1492]]") == \
+        ([], "No se encontró sección 'Santoral católico'")
+
+
+def test_santoral_sin_vinetas():
+    assert parsear_santoral_wikitext("== Santoral católico ==\nSin datos.\n== Véase también ==") == \
+        ([], "Sección encontrada pero sin santos listados")
+
+
+def test_texto_plano():
+    texto = "'''[[Pedro|San Pedro]]''' y [http://ejemplo.org su sitio]&nbsp;hoy <!-- nota -->{{cita}}"
+    assert texto_plano(texto) == "San Pedro y su sitio hoy"
+
+
+def test_titulo_pagina_dia():
+    assert titulo_pagina_dia(11, 4) == "4 de noviembre"
+    assert titulo_pagina_dia(1, 1) == "1 de enero"
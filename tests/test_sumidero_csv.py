@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Pruebas de la escritura incremental de santos.csv"""
+
+import csv
+import os
+
+import pytest
+
+from sumidero_csv import SumideroCSV, clave_santo
+
+
+def _fila(mes, dia, nombre, **otros):
+    return dict({'mes': mes, 'dia': dia, 'nombre': nombre, 'prioridad': 1}, **otros)
+
+
+def _nombres(ruta):
+    with open(ruta, newline='', encoding='utf-8') as f:
+        return [fila['nombre'] for fila in csv.DictReader(f)]
+
+
+@pytest.fixture
+def sumidero(tmp_path):
+    sumidero = SumideroCSV(str(tmp_path / 'santos.csv'))
+    sumidero.abrir()
+    yield sumidero
+    sumidero.cerrar()
+
+
+def test_agregar_escribe_al_momento(sumidero):
+    posicion = sumidero.agregar([_fila(1, 1, 'San Basilio'), _fila(1, 2, 'San Gregorio')])
+
+    assert _nombres(sumidero.ruta) == ['San Basilio', 'San Gregorio']
+    assert posicion == {'bytes': os.path.getsize(sumidero.ruta), 'filas': 2}
+    assert sumidero.posicion() == posicion
+
+
+def test_tumbas_tapan_solo_lo_escrito_antes(sumidero):
+    sumidero.agregar([_fila(1, 1, 'San Basilio'), _fila(1, 1, 'San Gregorio')])
+    sumidero.eliminar([clave_santo(_fila(1, 1, 'San Basilio'))])
+    # El día recalculado vuelve a escribir al mismo santo: esta fila sigue viva
+    sumidero.agregar([_fila(1, 1, 'San Basilio', descripcion='nueva')])
+
+    vivas = list(sumidero.leer())
+    assert [(fila['nombre'], fila['descripcion']) for fila in vivas] == \
+        [('San Gregorio', ''), ('San Basilio', 'nueva')]
+    # El archivo no se toca hasta compactar
+    assert len(_nombres(sumidero.ruta)) == 3
+
+
+def test_compactar_reescribe_una_vez(sumidero):
+    sumidero.agregar([_fila(1, 1, 'San Basilio'), _fila(1, 2, 'San Gregorio')])
+    sumidero.eliminar([clave_santo(_fila(1, 1, 'San Basilio'))])
+    inodo = sumidero.identidad()
+
+    assert sumidero.compactar() == 1
+    assert _nombres(sumidero.ruta) == ['San Gregorio']
+    compactado = sumidero.identidad()
+    assert compactado != inodo
+    # Sin tumbas no hay nada que reescribir
+    assert sumidero.compactar() == 0
+    assert sumidero.identidad() == compactado
+
+    sumidero.agregar([_fila(1, 3, 'Santa Genoveva')])
+    assert _nombres(sumidero.ruta) == ['San Gregorio', 'Santa Genoveva']
+
+
+def test_abrir_en_una_posicion_recorta(tmp_path):
+    ruta = str(tmp_path / 'santos.csv')
+    sumidero = SumideroCSV(ruta)
+    sumidero.abrir()
+    posicion = sumidero.agregar([_fila(1, 1, 'San Basilio')])
+    sumidero.agregar([_fila(1, 2, 'San Gregorio')])
+    sumidero.cerrar()
+    with open(ruta, 'a', encoding='utf-8') as f:
+        f.write('1,3,Línea cort')
+
+    retomado = SumideroCSV(ruta)
+    retomado.abrir(posicion)
+    retomado.agregar([_fila(1, 3, 'Santa Genoveva')])
+    retomado.cerrar()
+
+    assert _nombres(ruta) == ['San Basilio', 'Santa Genoveva']
+    assert retomado.filas == 2
+
+
+def test_contiene(tmp_path):
+    ruta = str(tmp_path / 'santos.csv')
+    sumidero = SumideroCSV(ruta)
+    sumidero.abrir()
+    posicion = sumidero.agregar([_fila(1, 1, 'San Basilio'), _fila(1, 2, 'San Gregorio')])
+    sumidero.agregar([_fila(1, 3, 'Santa Genoveva')])
+    sumidero.cerrar()
+
+    assert sumidero.contiene(posicion)
+    assert not sumidero.contiene(dict(posicion, filas=1))
+
+    # Otro programa lo reescribe en el lugar, más corto
+    with open(ruta, 'w', newline='', encoding='utf-8') as f:
+        f.write('mes,dia,nombre\n1,1,San Basilio\n')
+    assert not sumidero.contiene(posicion)
+
+
+def test_huella(tmp_path):
+    ruta = str(tmp_path / 'santos.csv')
+    sumidero = SumideroCSV(ruta)
+    assert sumidero.huella() is None
+
+    sumidero.abrir()
+    sumidero.agregar([_fila(1, 1, 'San Basilio')])
+    sumidero.cerrar()
+    huella = sumidero.huella()
+    assert huella == sumidero.huella()
+    assert huella['bytes'] == os.path.getsize(ruta)
+
+    with open(ruta, 'r+', encoding='utf-8') as f:
+        f.seek(os.path.getsize(ruta) - 3)
+        f.write('XX\n')
+    assert sumidero.huella()['sha256'] != huella['sha256']
+
+
+def test_conserva_columnas_extra(tmp_path):
+    ruta = str(tmp_path / 'santos.csv')
+    with open(ruta, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['mes', 'dia', 'nombre', 'prioridad', 'fuente'])
+        writer.writeheader()
+        writer.writerow(_fila(1, 1, 'San Basilio', fuente='volcado'))
+        writer.writerow(_fila(1, 2, 'San Gregorio', fuente='api'))
+
+    sumidero = SumideroCSV(ruta)
+    sumidero.abrir()
+    sumidero.eliminar([clave_santo(_fila(1, 1, 'San Basilio'))])
+    sumidero.agregar([_fila(1, 3, 'Santa Genoveva')])
+    assert sumidero.compactar() == 1
+    sumidero.agregar([_fila(1, 4, 'San Rigoberto', fuente='manual')])
+    sumidero.cerrar()
+
+    with open(ruta, newline='', encoding='utf-8') as f:
+        filas = list(csv.DictReader(f))
+    assert [(fila['nombre'], fila['fuente']) for fila in filas] == \
+        [('San Gregorio', 'api'), ('Santa Genoveva', ''), ('San Rigoberto', 'manual')]
+    assert all(fila['descripcion'] == '' for fila in filas)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Pruebas de ClienteMediaWiki contra el servidor local que imita a la API"""
+
+import pytest
+
+from wikipedia_api import TAMANO_LOTE, ClienteMediaWiki, titulo_desde_url, url_desde_titulo
+
+PARAMS = {'prop': 'extracts|pageimages', 'exintro': '1', 'explaintext': '1', 'piprop': 'thumbnail'}
+
+
+def _santos(cantidad):
+    return {f"San Prueba {i}": {'extract': ' '.join([f"San Prueba {i} fue un santo de prueba."] * 8),
+                                'imagen': f"https://upload.wikimedia.org/prueba/{i}.jpg"}
+            for i in range(cantidad)}
+
+
+@pytest.fixture
+def cliente(servidor_wikipedia, sesion):
+    return ClienteMediaWiki(sesion.get, api_url=servidor_wikipedia.api_url)
+
+
+def test_agrupa_titulos_en_lotes(servidor_wikipedia, cliente):
+    servidor_wikipedia.paginas = _santos(120)
+    servidor_wikipedia.extractos_por_respuesta = TAMANO_LOTE
+
+    resultado = cliente.consultar_titulos(list(servidor_wikipedia.paginas), PARAMS)
+
+    assert len(resultado) == 120
+    assert cliente.peticiones == 3
+    lotes = [params['titles'].split('|') for _, params in servidor_wikipedia.peticiones]
+    assert [len(lote) for lote in lotes] == [50, 50, 20]
+    assert all(params['maxlag'] and params['formatversion'] == '2' for _, params in servidor_wikipedia.peticiones)
+
+
+def test_combina_continuaciones(servidor_wikipedia, cliente):
+    servidor_wikipedia.paginas = _santos(45)
+    servidor_wikipedia.extractos_por_respuesta = 20
+
+    resultado = cliente.consultar_titulos(list(servidor_wikipedia.paginas), PARAMS)
+
+    # Un lote, tres respuestas: cada página junta su imagen (1ª) y su extracto (su tramo)
+    assert cliente.peticiones == 3
+    assert [params.get('excontinue') for _, params in servidor_wikipedia.peticiones] == [None, '20', '40']
+    for titulo, datos in servidor_wikipedia.paginas.items():
+        assert resultado[titulo]['extract'] == datos['extract']
+        assert resultado[titulo]['thumbnail']['source'] == datos['imagen']
+
+
+def test_resuelve_normalizaciones_y_redirecciones(servidor_wikipedia, cliente):
+    servidor_wikipedia.paginas = _santos(2)
+    servidor_wikipedia.redirecciones = {'Pedro apóstol': 'San Prueba 0', 'Apóstol Pedro': 'Pedro apóstol'}
+
+    pedidos = ['san_Prueba_1', 'pedro apóstol', 'San Prueba 0', 'No existe']
+    resultado = cliente.consultar_titulos(pedidos, PARAMS)
+
+    assert resultado['san_Prueba_1']['title'] == 'San Prueba 1'
+    assert resultado['pedro apóstol']['title'] == 'San Prueba 0'
+    assert resultado['San Prueba 0'] is resultado['pedro apóstol']
+    assert resultado['No existe'].get('missing')
+    assert cliente.peticiones == 1
+
+
+def test_descarta_titulos_vacios_y_repetidos(servidor_wikipedia, cliente):
+    servidor_wikipedia.paginas = _santos(1)
+
+    resultado = cliente.consultar_titulos(['San Prueba 0', '', None, 'San Prueba 0'], PARAMS)
+
+    assert list(resultado) == ['San Prueba 0']
+    assert servidor_wikipedia.peticiones[0][1]['titles'] == 'San Prueba 0'
+
+
+def test_error_de_la_api(sesion):
+    class Respuesta:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {'error': {'code': 'maxlag', 'info': 'Waiting for a database server'}}
+
+    cliente = ClienteMediaWiki(lambda url, params=None, timeout=None: Respuesta())
+    with pytest.raises(RuntimeError, match='maxlag'):
+        cliente.consultar_titulos(['San Prueba 0'], PARAMS)
+
+
+def test_un_orden_de_magnitud_menos_peticiones_y_bytes(servidor_wikipedia, sesion):
+    """Un año de días trae cientos de santos: la API los resuelve de a 50 por petición"""
+    servidor_wikipedia.paginas = _santos(120)
+    servidor_wikipedia.extractos_por_respuesta = TAMANO_LOTE
+    titulos = list(servidor_wikipedia.paginas)
+
+    # Un artículo HTML completo por santo (como obtener_info_wikipedia con motor 'html')
+    por_articulo = {}
+    for titulo in titulos:
+        response = sesion.get(url_desde_titulo(titulo).replace('https://es.wikipedia.org', servidor_wikipedia.url))
+        por_articulo[titulo] = response.text
+    peticiones_html, bytes_html = len(servidor_wikipedia.peticiones), servidor_wikipedia.bytes_enviados
+
+    servidor_wikipedia.peticiones.clear()
+    servidor_wikipedia.bytes_enviados = 0
+    cliente = ClienteMediaWiki(sesion.get, api_url=servidor_wikipedia.api_url)
+    por_api = cliente.consultar_titulos(titulos, PARAMS)
+
+    # La misma información por los dos caminos
+    for titulo in titulos:
+        assert f"<p>{por_api[titulo]['extract']}</p>" in por_articulo[titulo]
+        assert por_api[titulo]['thumbnail']['source'].replace('https:', '') in por_articulo[titulo]
+
+    assert peticiones_html >= 10 * len(servidor_wikipedia.peticiones)
+    assert bytes_html >= 10 * servidor_wikipedia.bytes_enviados
+
+
+def test_urls_y_titulos():
+    url = url_desde_titulo('Agustín de Hipona')
+    assert url == 'https://es.wikipedia.org/wiki/Agust%C3%ADn_de_Hipona'
+    assert titulo_desde_url(url) == 'Agustín de Hipona'
+    assert titulo_desde_url('https://es.wikipedia.org/wiki/Pedro_(ap%C3%B3stol)#Vida') == 'Pedro (apóstol)'